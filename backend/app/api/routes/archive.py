@@ -0,0 +1,77 @@
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.api.schemas.archive import ArchivedOut, RestoredOut
+from app.api.services.archive import (
+    ArchivedContentNotFoundError,
+    ArchivedSlugExistsError,
+    list_archived,
+    restore_archived,
+)
+from app.auth.claims import Principal
+from app.auth.dependencies import get_current_principal
+from app.db.session import get_db
+from app.models.registry import CONTENT_MODELS
+
+router = APIRouter(prefix="/cms/archive", tags=["archive"])
+
+
+def _check_access(entity_type: str, current_user: Principal) -> None:
+    if entity_type not in CONTENT_MODELS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown content type '{entity_type}'"
+        )
+    # Restoring undoes a delete, so both endpoints need the delete permission.
+    if not current_user.has_permission(entity_type, "delete"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Permission required: {entity_type}:delete",
+        )
+
+
+@router.get("/{entity_type}", response_model=List[ArchivedOut])
+async def list_archived_endpoint(
+    entity_type: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Archived items of one type, most recently archived first."""
+    _check_access(entity_type, current_user)
+    items = list_archived(db=db, entity_type=entity_type, skip=skip, limit=limit)
+    return [ArchivedOut.model_validate(item) for item in items]
+
+
+@router.post("/{entity_type}/{entity_id}/restore", response_model=RestoredOut)
+async def restore_archived_endpoint(
+    entity_type: str,
+    entity_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Move an archived item back into its table, undeleted, with its last status."""
+    _check_access(entity_type, current_user)
+    try:
+        item = restore_archived(db=db, entity_type=entity_type, entity_id=entity_id)
+    except ArchivedContentNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ArchivedSlugExistsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    return RestoredOut(
+        type=entity_type,
+        id=item.id,
+        slug=item.slug,
+        title=item.title,
+        status=item.status,
+    )
@@ -6,6 +6,8 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from app.api.schemas.blog import BlogCreate, BlogList, BlogOut, BlogUpdate
+from app.api.schemas.revisions import RevisionDetail, RevisionDiff, RevisionOut
+from app.api.schemas.facets import FacetCounts
 from app.api.services.blog import (
     BlogNotFoundError,
     BlogSlugExistsError,
@@ -16,59 +18,34 @@ from app.api.services.blog import (
     list_blogs,
     update_blog,
 )
-from app.auth.dependencies import get_current_user
+from app.api.services.facets import get_facet_counts
+from app.api.services.revisions import (
+    RevisionNotFoundError,
+    diff_revisions,
+    get_revision_snapshot,
+    list_revisions,
+)
+from app.api.services.scheduling import InvalidScheduleError
+from app.api.services.view_counts import SORT_POPULAR, SORT_RECENT
+from app.auth.claims import Principal
+from app.auth.dependencies import require_permission, resolve_principal
+from app.core.view_counts import record_view
 from app.db.session import get_db
 from app.models.enums import ContentStatus
-from app.models.user import User
 
 router = APIRouter(prefix="/cms/blogs", tags=["blogs"])
 optional_security = HTTPBearer(auto_error=False)
 
 
-def require_admin_or_editor(current_user: User = Depends(get_current_user)) -> User:
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required",
-        )
-    return current_user
-
-
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Security(optional_security),
     db: Session = Depends(get_db)
-) -> Optional[User]:
+) -> Optional[Principal]:
     if credentials is None:
         return None
     try:
-        from app.auth.security import decode_token
-        from sqlalchemy import select
-        from sqlalchemy.orm import joinedload
-        from app.models.rbac import UserRole
-        from app.models.user import User
-        
-        payload = decode_token(credentials.credentials)
-        user_id = payload.get("sub")
-        
-        if not user_id:
-            return None
-        
-        try:
-            user_uuid = UUID(user_id)
-        except ValueError:
-            return None
-        
-        user = db.scalar(
-            select(User)
-            .options(joinedload(User.user_roles).joinedload(UserRole.role))
-            .where(User.id == user_uuid)
-        )
-        
-        if user and user.is_active:
-            return user
-        return None
-    except (HTTPException, ValueError, Exception):
+        return resolve_principal(credentials.credentials, db)
+    except HTTPException:
         return None
 
 
@@ -76,7 +53,7 @@ async def get_optional_user(
 async def create_blog_endpoint(
     data: BlogCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("blog", "create")),
 ):
     try:
         blog = create_blog(
@@ -90,6 +67,11 @@ async def create_blog_endpoint(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
+    except InvalidScheduleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
 
 
 @router.get("", response_model=List[BlogList])
@@ -97,16 +79,13 @@ async def list_blogs_endpoint(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: Optional[ContentStatus] = Query(None),
+    sort: str = Query(SORT_RECENT, pattern=f"^({SORT_RECENT}|{SORT_POPULAR})$"),
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
-    user_role_names = set()
-    if current_user:
-        user_role_names = {ur.role.name for ur in current_user.user_roles}
+    can_read_drafts = current_user is not None and current_user.has_permission("blog", "read")
     
-    is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
-    
-    if not is_admin_or_editor:
+    if not can_read_drafts:
         if status is None:
             status = ContentStatus.PUBLISHED
         elif status != ContentStatus.PUBLISHED:
@@ -115,26 +94,28 @@ async def list_blogs_endpoint(
                 detail="Only published blogs are accessible to public"
             )
     
-    blogs = list_blogs(db=db, skip=skip, limit=limit, status=status)
+    blogs = list_blogs(db=db, skip=skip, limit=limit, status=status, sort=sort)
     return blogs
 
 
+@router.get("/facets", response_model=FacetCounts)
+async def get_blog_facets_endpoint(db: Session = Depends(get_db)):
+    """Counts per facet value across published blogs."""
+    return get_facet_counts(db=db, entity_type="blog")
+
+
 @router.get("/{blog_id}", response_model=BlogOut)
 async def get_blog_endpoint(
     blog_id: UUID,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
     try:
         blog = get_blog_by_id(db=db, blog_id=blog_id)
         
-        user_role_names = set()
-        if current_user:
-            user_role_names = {ur.role.name for ur in current_user.user_roles}
+        can_read_drafts = current_user is not None and current_user.has_permission("blog", "read")
         
-        is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
-        
-        if not is_admin_or_editor and blog.status != ContentStatus.PUBLISHED:
+        if not can_read_drafts and blog.status != ContentStatus.PUBLISHED:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Blog not found"
@@ -152,23 +133,22 @@ async def get_blog_endpoint(
 async def get_blog_by_slug_endpoint(
     slug: str,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
     try:
         blog = get_blog_by_slug(db=db, slug=slug)
         
-        user_role_names = set()
-        if current_user:
-            user_role_names = {ur.role.name for ur in current_user.user_roles}
-        
-        is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
+        can_read_drafts = current_user is not None and current_user.has_permission("blog", "read")
         
-        if not is_admin_or_editor and blog.status != ContentStatus.PUBLISHED:
+        if not can_read_drafts and blog.status != ContentStatus.PUBLISHED:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Blog not found"
             )
         
+        if blog.status == ContentStatus.PUBLISHED:
+            record_view("blog", blog.id)
+        
         return blog
     except BlogNotFoundError as e:
         raise HTTPException(
@@ -182,7 +162,7 @@ async def update_blog_endpoint(
     blog_id: UUID,
     data: BlogUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("blog", "update")),
 ):
     try:
         blog = update_blog(
@@ -202,13 +182,18 @@ async def update_blog_endpoint(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
+    except InvalidScheduleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
 
 
 @router.delete("/{blog_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_blog_endpoint(
     blog_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("blog", "delete")),
 ):
     try:
         delete_blog(db=db, blog_id=blog_id)
@@ -217,3 +202,99 @@ async def delete_blog_endpoint(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+
+
+@router.get("/{blog_id}/revisions", response_model=List[RevisionOut])
+async def list_blog_revisions_endpoint(
+    blog_id: UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_permission("blog", "read")),
+):
+    try:
+        get_blog_by_id(db=db, blog_id=blog_id)
+    except BlogNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    return list_revisions(db=db, entity_type="blog", entity_id=blog_id, skip=skip, limit=limit)
+
+
+@router.get("/{blog_id}/revisions/{revision}", response_model=RevisionDetail)
+async def get_blog_revision_endpoint(
+    blog_id: UUID,
+    revision: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_permission("blog", "read")),
+):
+    try:
+        get_blog_by_id(db=db, blog_id=blog_id)
+        data = get_revision_snapshot(db=db, entity_type="blog", entity_id=blog_id, revision=revision)
+        return RevisionDetail(revision=revision, data=data)
+    except (BlogNotFoundError, RevisionNotFoundError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.get("/{blog_id}/revisions/{revision}/diff", response_model=RevisionDiff)
+async def diff_blog_revision_endpoint(
+    blog_id: UUID,
+    revision: int,
+    against: Optional[int] = Query(None, ge=0, description="Base revision; defaults to the previous one"),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_permission("blog", "read")),
+):
+    from_revision = against if against is not None else max(revision - 1, 0)
+    try:
+        get_blog_by_id(db=db, blog_id=blog_id)
+        operations = diff_revisions(
+            db=db,
+            entity_type="blog",
+            entity_id=blog_id,
+            from_revision=from_revision,
+            to_revision=revision,
+        )
+        return RevisionDiff(from_revision=from_revision, to_revision=revision, operations=operations)
+    except (BlogNotFoundError, RevisionNotFoundError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.post("/{blog_id}/revisions/{revision}/restore", response_model=BlogOut)
+async def restore_blog_revision_endpoint(
+    blog_id: UUID,
+    revision: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_permission("blog", "update")),
+):
+    """Save the fields of an earlier revision as a new revision."""
+    try:
+        get_blog_by_id(db=db, blog_id=blog_id)
+        data = get_revision_snapshot(db=db, entity_type="blog", entity_id=blog_id, revision=revision)
+        return update_blog(
+            db=db,
+            blog_id=blog_id,
+            data=data,
+            user=current_user
+        )
+    except (BlogNotFoundError, RevisionNotFoundError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except BlogSlugExistsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except InvalidScheduleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
@@ -6,6 +6,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from app.api.schemas.case_study import CaseStudyCreate, CaseStudyList, CaseStudyOut, CaseStudyUpdate
+from app.api.schemas.facets import FacetCounts
 from app.api.services.case_study import (
     CaseStudyNotFoundError,
     CaseStudySlugExistsError,
@@ -16,59 +17,28 @@ from app.api.services.case_study import (
     list_case_studies,
     update_case_study,
 )
-from app.auth.dependencies import get_current_user
+from app.api.services.facets import get_facet_counts
+from app.api.services.scheduling import InvalidScheduleError
+from app.api.services.view_counts import SORT_POPULAR, SORT_RECENT
+from app.auth.claims import Principal
+from app.auth.dependencies import require_permission, resolve_principal
+from app.core.view_counts import record_view
 from app.db.session import get_db
 from app.models.enums import ContentStatus
-from app.models.user import User
 
 router = APIRouter(prefix="/cms/case-studies", tags=["case-studies"])
 optional_security = HTTPBearer(auto_error=False)
 
 
-def require_admin_or_editor(current_user: User = Depends(get_current_user)) -> User:
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required",
-        )
-    return current_user
-
-
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Security(optional_security),
     db: Session = Depends(get_db)
-) -> Optional[User]:
+) -> Optional[Principal]:
     if credentials is None:
         return None
     try:
-        from app.auth.security import decode_token
-        from sqlalchemy import select
-        from sqlalchemy.orm import joinedload
-        from app.models.rbac import UserRole
-        from app.models.user import User
-        
-        payload = decode_token(credentials.credentials)
-        user_id = payload.get("sub")
-        
-        if not user_id:
-            return None
-        
-        try:
-            user_uuid = UUID(user_id)
-        except ValueError:
-            return None
-        
-        user = db.scalar(
-            select(User)
-            .options(joinedload(User.user_roles).joinedload(UserRole.role))
-            .where(User.id == user_uuid)
-        )
-        
-        if user and user.is_active:
-            return user
-        return None
-    except (HTTPException, ValueError, Exception):
+        return resolve_principal(credentials.credentials, db)
+    except HTTPException:
         return None
 
 
@@ -76,7 +46,7 @@ async def get_optional_user(
 async def create_case_study_endpoint(
     data: CaseStudyCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("case_study", "create")),
 ):
     try:
         case_study = create_case_study(
@@ -90,6 +60,11 @@ async def create_case_study_endpoint(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
+    except InvalidScheduleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
 
 
 @router.get("", response_model=List[CaseStudyList])
@@ -99,16 +74,13 @@ async def list_case_studies_endpoint(
     status: Optional[ContentStatus] = Query(None),
     industry: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
+    sort: str = Query(SORT_RECENT, pattern=f"^({SORT_RECENT}|{SORT_POPULAR})$"),
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
-    user_role_names = set()
-    if current_user:
-        user_role_names = {ur.role.name for ur in current_user.user_roles}
-    
-    is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
+    can_read_drafts = current_user is not None and current_user.has_permission("case_study", "read")
     
-    if not is_admin_or_editor:
+    if not can_read_drafts:
         if status is None:
             status = ContentStatus.PUBLISHED
         elif status != ContentStatus.PUBLISHED:
@@ -119,27 +91,29 @@ async def list_case_studies_endpoint(
     
     case_studies = list_case_studies(
         db=db, skip=skip, limit=limit, status=status,
-        industry=industry, category=category,
+        industry=industry, category=category, sort=sort,
     )
     return case_studies
 
 
+@router.get("/facets", response_model=FacetCounts)
+async def get_case_study_facets_endpoint(db: Session = Depends(get_db)):
+    """Counts per facet value across published case studies."""
+    return get_facet_counts(db=db, entity_type="case_study")
+
+
 @router.get("/{case_study_id}", response_model=CaseStudyOut)
 async def get_case_study_endpoint(
     case_study_id: UUID,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
     try:
         case_study = get_case_study_by_id(db=db, case_study_id=case_study_id)
         
-        user_role_names = set()
-        if current_user:
-            user_role_names = {ur.role.name for ur in current_user.user_roles}
-        
-        is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
+        can_read_drafts = current_user is not None and current_user.has_permission("case_study", "read")
         
-        if not is_admin_or_editor and case_study.status != ContentStatus.PUBLISHED:
+        if not can_read_drafts and case_study.status != ContentStatus.PUBLISHED:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Case study not found"
@@ -157,23 +131,22 @@ async def get_case_study_endpoint(
 async def get_case_study_by_slug_endpoint(
     slug: str,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
     try:
         case_study = get_case_study_by_slug(db=db, slug=slug)
         
-        user_role_names = set()
-        if current_user:
-            user_role_names = {ur.role.name for ur in current_user.user_roles}
+        can_read_drafts = current_user is not None and current_user.has_permission("case_study", "read")
         
-        is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
-        
-        if not is_admin_or_editor and case_study.status != ContentStatus.PUBLISHED:
+        if not can_read_drafts and case_study.status != ContentStatus.PUBLISHED:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Case study not found"
             )
         
+        if case_study.status == ContentStatus.PUBLISHED:
+            record_view("case_study", case_study.id)
+        
         return case_study
     except CaseStudyNotFoundError as e:
         raise HTTPException(
@@ -187,7 +160,7 @@ async def update_case_study_endpoint(
     case_study_id: UUID,
     data: CaseStudyUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("case_study", "update")),
 ):
     try:
         case_study = update_case_study(
@@ -207,13 +180,18 @@ async def update_case_study_endpoint(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
+    except InvalidScheduleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
 
 
 @router.delete("/{case_study_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_case_study_endpoint(
     case_study_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("case_study", "delete")),
 ):
     try:
         delete_case_study(db=db, case_study_id=case_study_id)
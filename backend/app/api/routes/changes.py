@@ -0,0 +1,62 @@
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Query, Response
+
+from app.api.schemas.changes import ChangeFeed, ChangeOut
+from app.api.services.changes import get_latest_cursor, list_changes, wait_for_changes
+from app.core.config import settings
+from app.db.session import SessionLocal
+
+router = APIRouter(prefix="/cms/changes", tags=["changes"])
+
+
+def _read_changes(since: int, limit: int, entity_type: Optional[str]):
+    # One short-lived session per poll, so no connection is held while waiting.
+    with SessionLocal() as db:
+        return list_changes(db=db, since=since, limit=limit, entity_type=entity_type)
+
+
+@router.get("", response_model=ChangeFeed)
+async def list_changes_endpoint(
+    response: Response,
+    since: Optional[int] = Query(
+        None, ge=0, description="Cursor from a previous response; omit to get the current head"
+    ),
+    limit: int = Query(500, ge=1, le=5000),
+    type: Optional[str] = Query(None, description="Restrict to one entity type, e.g. 'blog'"),
+    wait: float = Query(0, ge=0, description="Seconds to long-poll when there are no changes"),
+):
+    """
+    Incremental change feed for downstream caches.
+
+    Returns changes strictly after ``since`` in commit order. Without ``since``
+    the current head cursor is returned so a new consumer can start tailing.
+    With ``wait`` > 0 the request blocks until a change arrives or the wait
+    elapses; no pooled connection is held while waiting.
+    """
+    response.headers["Cache-Control"] = "no-store"
+
+    if since is None:
+        with SessionLocal() as db:
+            return ChangeFeed(changes=[], next_cursor=get_latest_cursor(db))
+
+    changes = _read_changes(since, limit + 1, type)
+
+    remaining = min(wait, settings.CHANGE_FEED_MAX_WAIT_SECONDS)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + remaining
+    while not changes and remaining > 0:
+        await wait_for_changes(min(remaining, settings.CHANGE_FEED_POLL_SECONDS))
+        changes = _read_changes(since, limit + 1, type)
+        remaining = deadline - loop.time()
+
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    next_cursor = changes[-1].id if changes else since
+
+    return ChangeFeed(
+        changes=[ChangeOut.model_validate(change) for change in changes],
+        next_cursor=next_cursor,
+        has_more=has_more,
+    )
@@ -0,0 +1,83 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.services.changes import get_latest_cursor
+from app.api.services.feeds import (
+    cache_while_streaming,
+    generate_blog_feed,
+    generate_sitemap,
+    generate_sitemap_index,
+    get_cached_document,
+    get_sitemap_layout,
+    get_sitemap_shard_count,
+)
+from app.db.session import get_db
+
+router = APIRouter(tags=["seo"])
+
+XML_MEDIA_TYPE = "application/xml"
+RSS_MEDIA_TYPE = "application/rss+xml"
+CACHE_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+
+def _serve(key: str, cursor: int, media_type: str, chunks) -> Response:
+    return StreamingResponse(
+        cache_while_streaming(key, cursor, chunks),
+        media_type=media_type,
+        headers=CACHE_HEADERS,
+    )
+
+
+def _cached(key: str, cursor: int, media_type: str):
+    body = get_cached_document(key, cursor)
+    if body is None:
+        return None
+    return Response(content=body, media_type=media_type, headers=CACHE_HEADERS)
+
+
+@router.get("/sitemap.xml")
+async def sitemap_endpoint(db: Session = Depends(get_db)):
+    """
+    Sitemap of all published content.
+
+    Past 50,000 URLs this becomes a sitemap index pointing at
+    ``/sitemap-{n}.xml`` shards.
+    """
+    cursor = get_latest_cursor(db)
+    cached = _cached("sitemap", cursor, XML_MEDIA_TYPE)
+    if cached is not None:
+        return cached
+
+    layout = get_sitemap_layout(db)
+    shard_count = get_sitemap_shard_count(layout)
+    if shard_count > 1:
+        return _serve("sitemap", cursor, XML_MEDIA_TYPE, generate_sitemap_index(shard_count))
+    return _serve("sitemap", cursor, XML_MEDIA_TYPE, generate_sitemap(layout))
+
+
+@router.get("/sitemap-{shard}.xml")
+async def sitemap_shard_endpoint(shard: int, db: Session = Depends(get_db)):
+    key = f"sitemap-{shard}"
+    cursor = get_latest_cursor(db)
+    cached = _cached(key, cursor, XML_MEDIA_TYPE)
+    if cached is not None:
+        return cached
+
+    layout = get_sitemap_layout(db)
+    if shard < 1 or shard > get_sitemap_shard_count(layout):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sitemap not found"
+        )
+    return _serve(key, cursor, XML_MEDIA_TYPE, generate_sitemap(layout, shard - 1))
+
+
+@router.get("/feeds/blogs.xml")
+async def blog_feed_endpoint(db: Session = Depends(get_db)):
+    """RSS feed of the most recently published blogs."""
+    cursor = get_latest_cursor(db)
+    cached = _cached("feed-blogs", cursor, RSS_MEDIA_TYPE)
+    if cached is not None:
+        return cached
+    return _serve("feed-blogs", cursor, RSS_MEDIA_TYPE, generate_blog_feed())
@@ -6,6 +6,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from app.api.schemas.page import PageCreate, PageOut, PageUpdate
+from app.api.schemas.revisions import RevisionDetail, RevisionDiff, RevisionOut
 from app.api.services.page import (
     PageNotFoundError,
     PageSlugExistsError,
@@ -16,59 +17,31 @@ from app.api.services.page import (
     list_pages,
     update_page,
 )
-from app.auth.dependencies import get_current_user
+from app.api.services.revisions import (
+    RevisionNotFoundError,
+    diff_revisions,
+    get_revision_snapshot,
+    list_revisions,
+)
+from app.api.services.scheduling import InvalidScheduleError
+from app.auth.claims import Principal
+from app.auth.dependencies import require_permission, resolve_principal
 from app.db.session import get_db
 from app.models.enums import ContentStatus
-from app.models.user import User
 
 router = APIRouter(prefix="/cms/pages", tags=["pages"])
 optional_security = HTTPBearer(auto_error=False)
 
 
-def require_admin_or_editor(current_user: User = Depends(get_current_user)) -> User:
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required",
-        )
-    return current_user
-
-
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Security(optional_security),
     db: Session = Depends(get_db)
-) -> Optional[User]:
+) -> Optional[Principal]:
     if credentials is None:
         return None
     try:
-        from app.auth.security import decode_token
-        from sqlalchemy import select
-        from sqlalchemy.orm import joinedload
-        from app.models.rbac import UserRole
-        from app.models.user import User
-        
-        payload = decode_token(credentials.credentials)
-        user_id = payload.get("sub")
-        
-        if not user_id:
-            return None
-        
-        try:
-            user_uuid = UUID(user_id)
-        except ValueError:
-            return None
-        
-        user = db.scalar(
-            select(User)
-            .options(joinedload(User.user_roles).joinedload(UserRole.role))
-            .where(User.id == user_uuid)
-        )
-        
-        if user and user.is_active:
-            return user
-        return None
-    except (HTTPException, ValueError, Exception):
+        return resolve_principal(credentials.credentials, db)
+    except HTTPException:
         return None
 
 
@@ -76,7 +49,7 @@ async def get_optional_user(
 async def create_page_endpoint(
     data: PageCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("page", "create")),
 ):
     try:
         page = create_page(
@@ -90,6 +63,11 @@ async def create_page_endpoint(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
+    except InvalidScheduleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
 
 
 @router.get("", response_model=List[PageOut])
@@ -98,15 +76,11 @@ async def list_pages_endpoint(
     limit: int = Query(100, ge=1, le=1000),
     status: Optional[ContentStatus] = Query(None),
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
-    user_role_names = set()
-    if current_user:
-        user_role_names = {ur.role.name for ur in current_user.user_roles}
+    can_read_drafts = current_user is not None and current_user.has_permission("page", "read")
     
-    is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
-    
-    if not is_admin_or_editor:
+    if not can_read_drafts:
         if status is None:
             status = ContentStatus.PUBLISHED
         elif status != ContentStatus.PUBLISHED:
@@ -123,18 +97,14 @@ async def list_pages_endpoint(
 async def get_page_endpoint(
     page_id: UUID,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
     try:
         page = get_page_by_id(db=db, page_id=page_id)
         
-        user_role_names = set()
-        if current_user:
-            user_role_names = {ur.role.name for ur in current_user.user_roles}
-        
-        is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
+        can_read_drafts = current_user is not None and current_user.has_permission("page", "read")
         
-        if not is_admin_or_editor and page.status != ContentStatus.PUBLISHED:
+        if not can_read_drafts and page.status != ContentStatus.PUBLISHED:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Page not found"
@@ -152,18 +122,14 @@ async def get_page_endpoint(
 async def get_page_by_slug_endpoint(
     slug: str,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
     try:
         page = get_page_by_slug(db=db, slug=slug)
         
-        user_role_names = set()
-        if current_user:
-            user_role_names = {ur.role.name for ur in current_user.user_roles}
-        
-        is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
+        can_read_drafts = current_user is not None and current_user.has_permission("page", "read")
         
-        if not is_admin_or_editor and page.status != ContentStatus.PUBLISHED:
+        if not can_read_drafts and page.status != ContentStatus.PUBLISHED:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Page not found"
@@ -182,7 +148,7 @@ async def update_page_endpoint(
     page_id: UUID,
     data: PageUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("page", "update")),
 ):
     try:
         page = update_page(
@@ -202,13 +168,18 @@ async def update_page_endpoint(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
+    except InvalidScheduleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
 
 
 @router.delete("/{page_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_page_endpoint(
     page_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("page", "delete")),
 ):
     try:
         delete_page(db=db, page_id=page_id)
@@ -217,3 +188,99 @@ async def delete_page_endpoint(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+
+
+@router.get("/{page_id}/revisions", response_model=List[RevisionOut])
+async def list_page_revisions_endpoint(
+    page_id: UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_permission("page", "read")),
+):
+    try:
+        get_page_by_id(db=db, page_id=page_id)
+    except PageNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    return list_revisions(db=db, entity_type="page", entity_id=page_id, skip=skip, limit=limit)
+
+
+@router.get("/{page_id}/revisions/{revision}", response_model=RevisionDetail)
+async def get_page_revision_endpoint(
+    page_id: UUID,
+    revision: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_permission("page", "read")),
+):
+    try:
+        get_page_by_id(db=db, page_id=page_id)
+        data = get_revision_snapshot(db=db, entity_type="page", entity_id=page_id, revision=revision)
+        return RevisionDetail(revision=revision, data=data)
+    except (PageNotFoundError, RevisionNotFoundError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.get("/{page_id}/revisions/{revision}/diff", response_model=RevisionDiff)
+async def diff_page_revision_endpoint(
+    page_id: UUID,
+    revision: int,
+    against: Optional[int] = Query(None, ge=0, description="Base revision; defaults to the previous one"),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_permission("page", "read")),
+):
+    from_revision = against if against is not None else max(revision - 1, 0)
+    try:
+        get_page_by_id(db=db, page_id=page_id)
+        operations = diff_revisions(
+            db=db,
+            entity_type="page",
+            entity_id=page_id,
+            from_revision=from_revision,
+            to_revision=revision,
+        )
+        return RevisionDiff(from_revision=from_revision, to_revision=revision, operations=operations)
+    except (PageNotFoundError, RevisionNotFoundError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.post("/{page_id}/revisions/{revision}/restore", response_model=PageOut)
+async def restore_page_revision_endpoint(
+    page_id: UUID,
+    revision: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_permission("page", "update")),
+):
+    """Save the fields of an earlier revision as a new revision."""
+    try:
+        get_page_by_id(db=db, page_id=page_id)
+        data = get_revision_snapshot(db=db, entity_type="page", entity_id=page_id, revision=revision)
+        return update_page(
+            db=db,
+            page_id=page_id,
+            data=data,
+            user=current_user
+        )
+    except (PageNotFoundError, RevisionNotFoundError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except PageSlugExistsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except InvalidScheduleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
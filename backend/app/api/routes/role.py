@@ -5,10 +5,10 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.schemas.user import RoleOut
-from app.auth.dependencies import RequireAdmin
+from app.auth.claims import Principal
+from app.auth.dependencies import require_permission
 from app.db.session import get_db
 from app.models.role import Role
-from app.models.user import User
 
 router = APIRouter(prefix="/cms/roles", tags=["roles"])
 
@@ -16,8 +16,8 @@ router = APIRouter(prefix="/cms/roles", tags=["roles"])
 @router.get("", response_model=List[RoleOut])
 async def list_roles_endpoint(
     db: Session = Depends(get_db),
-    current_user: User = Depends(RequireAdmin),
+    current_user: Principal = Depends(require_permission("role", "read")),
 ):
-    """List all roles. Admin only."""
+    """List all roles. Requires role:read."""
     roles = db.scalars(select(Role).order_by(Role.name)).all()
     return list(roles)
@@ -16,59 +16,25 @@ from app.api.services.service import (
     list_services,
     update_service,
 )
-from app.auth.dependencies import get_current_user
+from app.api.services.scheduling import InvalidScheduleError
+from app.auth.claims import Principal
+from app.auth.dependencies import require_permission, resolve_principal
 from app.db.session import get_db
 from app.models.enums import ContentStatus
-from app.models.user import User
 
 router = APIRouter(prefix="/cms/services", tags=["services"])
 optional_security = HTTPBearer(auto_error=False)
 
 
-def require_admin_or_editor(current_user: User = Depends(get_current_user)) -> User:
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required",
-        )
-    return current_user
-
-
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Security(optional_security),
     db: Session = Depends(get_db)
-) -> Optional[User]:
+) -> Optional[Principal]:
     if credentials is None:
         return None
     try:
-        from app.auth.security import decode_token
-        from sqlalchemy import select
-        from sqlalchemy.orm import joinedload
-        from app.models.rbac import UserRole
-        from app.models.user import User
-        
-        payload = decode_token(credentials.credentials)
-        user_id = payload.get("sub")
-        
-        if not user_id:
-            return None
-        
-        try:
-            user_uuid = UUID(user_id)
-        except ValueError:
-            return None
-        
-        user = db.scalar(
-            select(User)
-            .options(joinedload(User.user_roles).joinedload(UserRole.role))
-            .where(User.id == user_uuid)
-        )
-        
-        if user and user.is_active:
-            return user
-        return None
-    except (HTTPException, ValueError, Exception):
+        return resolve_principal(credentials.credentials, db)
+    except HTTPException:
         return None
 
 
@@ -76,7 +42,7 @@ async def get_optional_user(
 async def create_service_endpoint(
     data: ServiceCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("service", "create")),
 ):
     try:
         service = create_service(
@@ -90,6 +56,11 @@ async def create_service_endpoint(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
+    except InvalidScheduleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
 
 
 @router.get("", response_model=List[ServiceList])
@@ -98,15 +69,11 @@ async def list_services_endpoint(
     limit: int = Query(100, ge=1, le=1000),
     status: Optional[ContentStatus] = Query(None),
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
-    user_role_names = set()
-    if current_user:
-        user_role_names = {ur.role.name for ur in current_user.user_roles}
-    
-    is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
+    can_read_drafts = current_user is not None and current_user.has_permission("service", "read")
     
-    if not is_admin_or_editor:
+    if not can_read_drafts:
         if status is None:
             status = ContentStatus.PUBLISHED
         elif status != ContentStatus.PUBLISHED:
@@ -123,19 +90,15 @@ async def list_services_endpoint(
 async def get_service_by_slug_endpoint(
     slug: str,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
     """Get a single service by slug (full payload including content). Public for published only."""
     try:
         service = get_service_by_slug(db=db, slug=slug)
 
-        user_role_names = set()
-        if current_user:
-            user_role_names = {ur.role.name for ur in current_user.user_roles}
+        can_read_drafts = current_user is not None and current_user.has_permission("service", "read")
 
-        is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
-
-        if not is_admin_or_editor and service.status != ContentStatus.PUBLISHED:
+        if not can_read_drafts and service.status != ContentStatus.PUBLISHED:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Service not found"
@@ -153,18 +116,14 @@ async def get_service_by_slug_endpoint(
 async def get_service_endpoint(
     service_id: UUID,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user: Optional[Principal] = Depends(get_optional_user),
 ):
     try:
         service = get_service_by_id(db=db, service_id=service_id)
         
-        user_role_names = set()
-        if current_user:
-            user_role_names = {ur.role.name for ur in current_user.user_roles}
-        
-        is_admin_or_editor = "admin" in user_role_names or "editor" in user_role_names
+        can_read_drafts = current_user is not None and current_user.has_permission("service", "read")
         
-        if not is_admin_or_editor and service.status != ContentStatus.PUBLISHED:
+        if not can_read_drafts and service.status != ContentStatus.PUBLISHED:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Service not found"
@@ -183,7 +142,7 @@ async def update_service_endpoint(
     service_id: UUID,
     data: ServiceUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("service", "update")),
 ):
     try:
         service = update_service(
@@ -203,13 +162,18 @@ async def update_service_endpoint(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
+    except InvalidScheduleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
 
 
 @router.delete("/{service_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_service_endpoint(
     service_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin_or_editor),
+    current_user: Principal = Depends(require_permission("service", "delete")),
 ):
     try:
         delete_service(db=db, service_id=service_id)
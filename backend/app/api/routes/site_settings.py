@@ -1,5 +1,5 @@
 from typing import Dict, Any
-from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends
 from sqlalchemy.orm import Session
 
 from app.api.schemas.site_settings import SiteSettingsOut, SiteSettingsUpdate
@@ -25,9 +25,9 @@ from app.api.services.site_settings import (
     save_contact_info,
     SiteSettingsNotFoundError
 )
-from app.auth.dependencies import get_current_user
+from app.auth.claims import Principal
+from app.auth.dependencies import require_permission
 from app.db.session import get_db
-from app.models.user import User
 
 router = APIRouter(prefix="/cms/site-settings", tags=["site-settings"])
 
@@ -44,17 +44,9 @@ async def get_header(
 async def update_header(
     config: Dict[str, Any] = Body(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(require_permission("site_settings", "update"))
 ):
     """Update header configuration (requires authentication)"""
-    # Check if user has admin or editor role
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required"
-        )
-    
     setting = save_header_config(db, config)
     return SiteSettingsOut(
         key=setting.key,
@@ -73,15 +65,9 @@ async def get_hero(db: Session = Depends(get_db)):
 async def update_hero(
     config: Dict[str, Any] = Body(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(require_permission("site_settings", "update")),
 ):
     """Update hero section configuration (requires authentication)"""
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required",
-        )
     setting = save_hero_config(db, config)
     return SiteSettingsOut(
         key=setting.key,
@@ -100,15 +86,9 @@ async def get_hero(db: Session = Depends(get_db)):
 async def update_hero(
     config: Dict[str, Any] = Body(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(require_permission("site_settings", "update")),
 ):
     """Update hero section configuration (requires authentication)"""
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required",
-        )
     setting = save_hero_config(db, config)
     return SiteSettingsOut(
         key=setting.key,
@@ -129,17 +109,9 @@ async def get_footer(
 async def update_footer(
     config: Dict[str, Any] = Body(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(require_permission("site_settings", "update"))
 ):
     """Update footer configuration (requires authentication)"""
-    # Check if user has admin or editor role
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required"
-        )
-    
     setting = save_footer_config(db, config)
     return SiteSettingsOut(
         key=setting.key,
@@ -160,17 +132,9 @@ async def get_theme(
 async def update_theme(
     config: Dict[str, Any] = Body(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(require_permission("site_settings", "update"))
 ):
     """Update theme configuration (requires authentication)"""
-    # Check if user has admin or editor role
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required"
-        )
-    
     setting = save_theme_config(db, config)
     return SiteSettingsOut(
         key=setting.key,
@@ -191,17 +155,9 @@ async def get_ui(
 async def update_ui(
     config: Dict[str, Any] = Body(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(require_permission("site_settings", "update"))
 ):
     """Update UI settings configuration (requires authentication)"""
-    # Check if user has admin or editor role
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required"
-        )
-    
     setting = save_ui_config(db, config)
     return SiteSettingsOut(
         key=setting.key,
@@ -220,15 +176,9 @@ async def get_services_ai_ml_section_route(db: Session = Depends(get_db)):
 async def update_services_ai_ml_section(
     config: Dict[str, Any] = Body(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(require_permission("site_settings", "update"))
 ):
     """Update AI & ML solutions section (requires auth)."""
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required"
-        )
     setting = save_services_ai_ml_section(db, config)
     return SiteSettingsOut(
         key=setting.key,
@@ -247,14 +197,8 @@ async def get_about_page_route(db: Session = Depends(get_db)):
 async def update_about_page(
     config: Dict[str, Any] = Body(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(require_permission("site_settings", "update")),
 ):
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required",
-        )
     setting = save_about_page(db, config)
     return SiteSettingsOut(
         key=setting.key,
@@ -273,14 +217,8 @@ async def get_contact_info_route(db: Session = Depends(get_db)):
 async def update_contact_info(
     config: Dict[str, Any] = Body(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(require_permission("site_settings", "update")),
 ):
-    user_role_names = {ur.role.name for ur in current_user.user_roles}
-    if "admin" not in user_role_names and "editor" not in user_role_names:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Editor role required",
-        )
     setting = save_contact_info(db, config)
     return SiteSettingsOut(
         key=setting.key,
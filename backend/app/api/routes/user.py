@@ -16,9 +16,9 @@ from app.api.services.user import (
     list_users,
     update_user,
 )
-from app.auth.dependencies import get_current_user, RequireAdmin
+from app.auth.claims import Principal
+from app.auth.dependencies import require_permission
 from app.db.session import get_db
-from app.models.user import User
 
 router = APIRouter(prefix="/cms/users", tags=["users"])
 
@@ -27,9 +27,9 @@ router = APIRouter(prefix="/cms/users", tags=["users"])
 async def create_user_endpoint(
     data: UserCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(RequireAdmin),
+    current_user: Principal = Depends(require_permission("user", "create")),
 ):
-    """Create a new user. Admin only."""
+    """Create a new user. Requires user:create."""
     try:
         user = create_user(
             db=db,
@@ -60,9 +60,9 @@ async def list_users_endpoint(
     limit: int = Query(100, ge=1, le=1000),
     is_active: Optional[bool] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(RequireAdmin),
+    current_user: Principal = Depends(require_permission("user", "read")),
 ):
-    """List users. Admin only."""
+    """List users. Requires user:read."""
     users = list_users(db=db, skip=skip, limit=limit, is_active=is_active)
     return users
 
@@ -71,9 +71,9 @@ async def list_users_endpoint(
 async def get_user_endpoint(
     user_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(RequireAdmin),
+    current_user: Principal = Depends(require_permission("user", "read")),
 ):
-    """Get user by ID. Admin only."""
+    """Get user by ID. Requires user:read."""
     try:
         user = get_user_by_id(db=db, user_id=user_id)
         return user
@@ -89,9 +89,9 @@ async def update_user_endpoint(
     user_id: UUID,
     data: UserUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(RequireAdmin),
+    current_user: Principal = Depends(require_permission("user", "update")),
 ):
-    """Update user. Admin only."""
+    """Update user. Requires user:update."""
     try:
         user = update_user(
             db=db,
@@ -126,9 +126,9 @@ async def update_user_endpoint(
 async def delete_user_endpoint(
     user_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(RequireAdmin),
+    current_user: Principal = Depends(require_permission("user", "delete")),
 ):
-    """Delete user (soft delete). Admin only."""
+    """Delete user (soft delete). Requires user:delete."""
     try:
         delete_user(db=db, user_id=user_id)
     except UserNotFoundError as e:
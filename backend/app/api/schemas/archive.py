@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models.enums import ContentStatus
+
+
+class ArchivedOut(BaseModel):
+    type: str = Field(..., validation_alias="entity_type")
+    id: UUID = Field(..., validation_alias="entity_id")
+    slug: str
+    title: Optional[str] = None
+    deleted_at: datetime
+    archived_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class RestoredOut(BaseModel):
+    type: str
+    id: UUID
+    slug: str
+    title: str
+    status: ContentStatus
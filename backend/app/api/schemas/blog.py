@@ -4,6 +4,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.api.schemas.related import RelatedItem
 from app.models.enums import ContentStatus
 
 
@@ -17,6 +18,7 @@ class BlogBase(BaseModel):
     category: Optional[str] = Field(None, max_length=100)
     tags: Optional[List[str]] = None
     status: ContentStatus = ContentStatus.DRAFT
+    published_at: Optional[datetime] = None
     meta_title: Optional[str] = Field(None, max_length=255)
     meta_description: Optional[str] = None
     meta_keywords: Optional[List[str]] = None
@@ -37,6 +39,7 @@ class BlogUpdate(BaseModel):
     category: Optional[str] = Field(None, max_length=100)
     tags: Optional[List[str]] = None
     status: Optional[ContentStatus] = None
+    published_at: Optional[datetime] = None
     meta_title: Optional[str] = Field(None, max_length=255)
     meta_description: Optional[str] = None
     meta_keywords: Optional[List[str]] = None
@@ -52,6 +55,7 @@ class BlogOut(BlogBase):
     updated_by: Optional[UUID] = None
     published_by: Optional[UUID] = None
     is_deleted: bool = False
+    related: List[RelatedItem] = []
 
     class Config:
         from_attributes = True
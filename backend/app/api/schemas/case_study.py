@@ -4,6 +4,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.api.schemas.related import RelatedItem
 from app.models.enums import ContentStatus
 
 
@@ -22,6 +23,7 @@ class CaseStudyBase(BaseModel):
     industry: Optional[str] = Field(None, max_length=100)
     tags: Optional[List[str]] = None
     status: ContentStatus = ContentStatus.DRAFT
+    published_at: Optional[datetime] = None
     meta_title: Optional[str] = Field(None, max_length=255)
     meta_description: Optional[str] = None
     meta_keywords: Optional[List[str]] = None
@@ -47,6 +49,7 @@ class CaseStudyUpdate(BaseModel):
     industry: Optional[str] = Field(None, max_length=100)
     tags: Optional[List[str]] = None
     status: Optional[ContentStatus] = None
+    published_at: Optional[datetime] = None
     meta_title: Optional[str] = Field(None, max_length=255)
     meta_description: Optional[str] = None
     meta_keywords: Optional[List[str]] = None
@@ -62,6 +65,7 @@ class CaseStudyOut(CaseStudyBase):
     updated_by: Optional[UUID] = None
     published_by: Optional[UUID] = None
     is_deleted: bool = False
+    related: List[RelatedItem] = []
 
     class Config:
         from_attributes = True
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models.enums import ChangeOp
+
+
+class ChangeOut(BaseModel):
+    cursor: int = Field(..., validation_alias="id")
+    type: str = Field(..., validation_alias="entity_type")
+    id: UUID = Field(..., validation_alias="entity_id")
+    slug: Optional[str] = None
+    op: ChangeOp
+    version: int
+    changed_at: datetime = Field(..., validation_alias="created_at")
+
+    class Config:
+        from_attributes = True
+
+
+class ChangeFeed(BaseModel):
+    changes: List[ChangeOut]
+    next_cursor: int
+    has_more: bool = False
@@ -0,0 +1,14 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class FacetValue(BaseModel):
+    value: str
+    count: int
+
+
+class FacetCounts(BaseModel):
+    tag: List[FacetValue] = []
+    category: List[FacetValue] = []
+    industry: List[FacetValue] = []
@@ -17,6 +17,7 @@ class JobBase(BaseModel):
     requirements: Optional[List[str]] = None
     content: Optional[Dict[str, Any]] = None
     status: ContentStatus = ContentStatus.DRAFT
+    published_at: Optional[datetime] = None
 
 
 class JobCreate(JobBase):
@@ -33,6 +34,7 @@ class JobUpdate(BaseModel):
     requirements: Optional[List[str]] = None
     content: Optional[Dict[str, Any]] = None
     status: Optional[ContentStatus] = None
+    published_at: Optional[datetime] = None
 
 
 class JobOut(JobBase):
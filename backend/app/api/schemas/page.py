@@ -31,6 +31,7 @@ class PageBase(BaseModel):
     content: List[Dict[str, Any]] = Field(..., min_length=0)
     template: Optional[str] = Field(None, max_length=100)
     status: ContentStatus = ContentStatus.DRAFT
+    published_at: Optional[datetime] = None
     meta_title: Optional[str] = Field(None, max_length=255)
     meta_description: Optional[str] = None
     meta_keywords: Optional[List[str]] = None
@@ -43,6 +44,7 @@ class PageCreate(BaseModel):
     content: List[Dict[str, Any]] = Field(..., min_length=0)
     template: Optional[str] = Field(None, max_length=100)
     status: ContentStatus = ContentStatus.DRAFT
+    published_at: Optional[datetime] = None
     meta_title: Optional[str] = Field(None, max_length=255)
     meta_description: Optional[str] = None
     meta_keywords: Optional[List[str]] = None
@@ -60,6 +62,7 @@ class PageUpdate(BaseModel):
     content: Optional[List[Dict[str, Any]]] = None
     template: Optional[str] = Field(None, max_length=100)
     status: Optional[ContentStatus] = None
+    published_at: Optional[datetime] = None
     meta_title: Optional[str] = Field(None, max_length=255)
     meta_description: Optional[str] = None
     meta_keywords: Optional[List[str]] = None
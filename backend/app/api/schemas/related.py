@@ -0,0 +1,11 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class RelatedItem(BaseModel):
+    type: str
+    id: UUID
+    slug: str
+    title: str
+    score: float
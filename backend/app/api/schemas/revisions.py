@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class RevisionOut(BaseModel):
+    revision: int
+    is_keyframe: bool
+    base_revision: Optional[int] = None
+    size_raw: int
+    created_by: Optional[UUID] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class RevisionDetail(BaseModel):
+    revision: int
+    data: Dict[str, Any]
+
+
+class RevisionDiff(BaseModel):
+    from_revision: int
+    to_revision: int
+    operations: List[Dict[str, Any]]
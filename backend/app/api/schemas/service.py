@@ -4,6 +4,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.api.schemas.related import RelatedItem
 from app.models.enums import ContentStatus
 
 
@@ -16,6 +17,7 @@ class ServiceBase(BaseModel):
     featured_image_url: Optional[str] = None
     icon_url: Optional[str] = None
     status: ContentStatus = ContentStatus.DRAFT
+    published_at: Optional[datetime] = None
     meta_title: Optional[str] = Field(None, max_length=255)
     meta_description: Optional[str] = None
     meta_keywords: Optional[List[str]] = None
@@ -35,6 +37,7 @@ class ServiceUpdate(BaseModel):
     featured_image_url: Optional[str] = None
     icon_url: Optional[str] = None
     status: Optional[ContentStatus] = None
+    published_at: Optional[datetime] = None
     meta_title: Optional[str] = Field(None, max_length=255)
     meta_description: Optional[str] = None
     meta_keywords: Optional[List[str]] = None
@@ -50,6 +53,7 @@ class ServiceOut(ServiceBase):
     updated_by: Optional[UUID] = None
     published_by: Optional[UUID] = None
     is_deleted: bool = False
+    related: List[RelatedItem] = []
 
     class Config:
         from_attributes = True
@@ -0,0 +1,205 @@
+"""
+Archival of soft-deleted content.
+
+Deletes only set ``is_deleted``, so without this the tombstones would stay in
+the content tables for good, carried by every index and filtered out by
+every query. The ``content.archive`` background task moves items that have
+been deleted for longer than ``ARCHIVE_RETENTION_DAYS`` into
+``content_archive``, one ``DELETE ... RETURNING`` / ``INSERT`` statement per
+batch of ``ARCHIVE_BATCH_SIZE`` rows, committing after each batch. Rows
+locked by a concurrent write are skipped until the next run.
+
+Deleted items cannot be edited, so ``updated_at`` is the deletion time.
+``restore_archived`` puts an item back into its table as a live item.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, literal, select, text
+from sqlalchemy.orm import Session, defer
+
+from app.api.services.changes import record_change
+from app.api.services.facets import apply_facet_changes, facet_values
+from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
+from app.core.scheduler import reschedule_publish
+from app.core.tasks import enqueue, enqueue_post_publish, task_handler
+from app.models.content_archive import ContentArchive
+from app.models.enums import ChangeOp, ContentStatus
+from app.models.registry import CONTENT_MODELS
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_TASK = "content.archive"
+
+_counters = Counters()
+_last_run: Dict[str, Any] = {}
+
+
+class ArchivedContentNotFoundError(Exception):
+    pass
+
+
+class ArchivedSlugExistsError(Exception):
+    pass
+
+
+# ============================================================================
+# Archival
+# ============================================================================
+
+def _archive_batch(db: Session, entity_type: str, cutoff: datetime) -> int:
+    """Move one batch of expired tombstones; returns the number of rows moved."""
+    model = CONTENT_MODELS[entity_type]
+    table = model.__table__
+    expired = (
+        select(model.id)
+        .where(model.is_deleted == True, model.updated_at < cutoff)
+        .order_by(model.updated_at)
+        .limit(settings.ARCHIVE_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    moved = (
+        delete(table)
+        .where(table.c.id.in_(expired.scalar_subquery()))
+        .returning(*table.c)
+        .cte("moved")
+    )
+    stmt = insert(ContentArchive).from_select(
+        ["entity_type", "entity_id", "slug", "title", "data", "deleted_at"],
+        select(
+            literal(entity_type),
+            moved.c.id,
+            moved.c.slug,
+            moved.c.title,
+            func.to_jsonb(moved.table_valued()),
+            moved.c.updated_at,
+        ),
+    )
+    return db.execute(stmt).rowcount or 0
+
+
+def archive_deleted(db: Session, entity_types: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    Archive items soft-deleted before the retention window.
+
+    Commits after every batch, so a long backlog never holds locks or a
+    transaction open for long; at most ``ARCHIVE_MAX_BATCHES_PER_RUN``
+    batches run per type. Returns rows archived per type.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.ARCHIVE_RETENTION_DAYS)
+    started = time.perf_counter()
+    archived: Dict[str, int] = {}
+    for entity_type in entity_types or list(CONTENT_MODELS):
+        total = 0
+        for _ in range(settings.ARCHIVE_MAX_BATCHES_PER_RUN):
+            moved = _archive_batch(db, entity_type, cutoff)
+            db.commit()
+            total += moved
+            if moved < settings.ARCHIVE_BATCH_SIZE:
+                break
+        if total:
+            _counters.inc(f"archived.{entity_type}", total)
+            logger.info(f"Archived {total} deleted {entity_type} item(s)")
+        archived[entity_type] = total
+
+    _counters.inc("runs")
+    _last_run.update(
+        finished_at=datetime.now(timezone.utc).isoformat(),
+        seconds=round(time.perf_counter() - started, 3),
+        archived=archived,
+    )
+    return archived
+
+
+def schedule_archive(db: Session, delay_seconds: Optional[float] = None) -> None:
+    """Queue the next archival run unless one is already pending."""
+    enqueue(
+        db,
+        ARCHIVE_TASK,
+        dedup_key=ARCHIVE_TASK,
+        delay_seconds=settings.ARCHIVE_INTERVAL_SECONDS if delay_seconds is None else delay_seconds,
+    )
+
+
+@task_handler(ARCHIVE_TASK)
+def _run_archive(db: Session, payload: Dict[str, Any]) -> None:
+    if not settings.ARCHIVE_ENABLED:
+        return
+    archive_deleted(db)
+    schedule_archive(db)
+
+
+# ============================================================================
+# Listing & Restore
+# ============================================================================
+
+def list_archived(
+    db: Session,
+    entity_type: str,
+    skip: int = 0,
+    limit: int = 100
+) -> List[ContentArchive]:
+    query = (
+        select(ContentArchive)
+        .options(defer(ContentArchive.data))
+        .where(ContentArchive.entity_type == entity_type)
+        .order_by(ContentArchive.archived_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(db.scalars(query).all())
+
+
+def restore_archived(db: Session, entity_type: str, entity_id: UUID):
+    """
+    Move an archived item back into its table and undelete it.
+
+    Only columns present both in the archived row and in the current table
+    are restored; columns added since archival take their defaults. The
+    item comes back with the status it had when it was deleted.
+    """
+    archived = db.get(ContentArchive, (entity_type, entity_id), with_for_update=True)
+    if archived is None:
+        raise ArchivedContentNotFoundError(f"No archived {entity_type} with id '{entity_id}'")
+
+    model = CONTENT_MODELS[entity_type]
+    if db.scalar(select(model.id).where(model.slug == archived.slug)) is not None:
+        raise ArchivedSlugExistsError(
+            f"Cannot restore: a {entity_type} with slug '{archived.slug}' already exists"
+        )
+
+    table = model.__table__
+    quote = db.get_bind().dialect.identifier_preparer.quote
+    names = [quote(column.name) for column in table.columns if column.name in archived.data]
+    db.execute(
+        text(
+            f"INSERT INTO {quote(table.name)} ({', '.join(names)}) "
+            f"SELECT {', '.join(f'restored.{name}' for name in names)} "
+            f"FROM content_archive AS archive, "
+            f"jsonb_populate_record(NULL::{quote(table.name)}, archive.data) AS restored "
+            "WHERE archive.entity_type = :entity_type AND archive.entity_id = :entity_id"
+        ),
+        {"entity_type": entity_type, "entity_id": entity_id},
+    )
+    db.delete(archived)
+    db.flush()
+
+    item = db.get(model, entity_id)
+    item.is_deleted = False
+    record_change(db, entity_type, item.id, item.slug, ChangeOp.CREATE)
+    apply_facet_changes(db, entity_type, frozenset(), facet_values(entity_type, item))
+    if item.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, entity_type, item.id)
+    db.commit()
+    db.refresh(item)
+    reschedule_publish(entity_type, item)
+    _counters.inc(f"restored.{entity_type}")
+    return item
+
+
+register_metrics_source("archive", lambda: {**_counters.snapshot(), "last_run": dict(_last_run)})
@@ -4,7 +4,14 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.enums import ContentStatus
+from app.api.services.changes import record_change
+from app.api.services.facets import apply_facet_changes, facet_values
+from app.api.services.revisions import record_revision, revision_snapshot
+from app.api.services.scheduling import resolve_scheduled_publish_at
+from app.api.services.view_counts import SORT_POPULAR, SORT_RECENT, order_by_popularity
+from app.core.scheduler import reschedule_publish
+from app.core.tasks import enqueue_post_publish
+from app.models.enums import ChangeOp, ContentStatus
 from app.models.blog import Blog
 from app.models.user import User
 
@@ -50,10 +57,20 @@ def create_blog(
         from datetime import datetime, timezone
         blog.published_at = datetime.now(timezone.utc)
         blog.published_by = user.id
+    elif blog.status == ContentStatus.SCHEDULED:
+        blog.published_at = resolve_scheduled_publish_at(data)
+        blog.published_by = user.id
     
     db.add(blog)
+    db.flush()
+    record_change(db, "blog", blog.id, blog.slug, ChangeOp.CREATE)
+    record_revision(db, "blog", blog.id, revision_snapshot("blog", blog), user.id)
+    apply_facet_changes(db, "blog", frozenset(), facet_values("blog", blog))
+    if blog.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "blog", blog.id)
     db.commit()
     db.refresh(blog)
+    reschedule_publish("blog", blog)
     return blog
 
 
@@ -79,14 +96,19 @@ def list_blogs(
     db: Session,
     skip: int = 0,
     limit: int = 100,
-    status: Optional[ContentStatus] = None
+    status: Optional[ContentStatus] = None,
+    sort: str = SORT_RECENT
 ) -> List[Blog]:
     query = select(Blog).where(Blog.is_deleted == False)
     
     if status:
         query = query.where(Blog.status == status)
     
-    query = query.offset(skip).limit(limit).order_by(Blog.created_at.desc())
+    if sort == SORT_POPULAR:
+        query = order_by_popularity(query, Blog, "blog")
+    else:
+        query = query.order_by(Blog.created_at.desc())
+    query = query.offset(skip).limit(limit)
     
     return list(db.scalars(query).all())
 
@@ -100,6 +122,7 @@ def update_blog(
     blog = get_blog_by_id(db, blog_id)
     
     old_status = blog.status
+    old_facets = facet_values("blog", blog)
     
     if "slug" in data and data["slug"] != blog.slug:
         existing = db.scalar(
@@ -136,7 +159,11 @@ def update_blog(
     
     blog.updated_by = user.id
     
-    if old_status != ContentStatus.PUBLISHED and blog.status == ContentStatus.PUBLISHED:
+    if blog.status == ContentStatus.SCHEDULED:
+        current = blog.published_at if old_status == ContentStatus.SCHEDULED else None
+        blog.published_at = resolve_scheduled_publish_at(data, current)
+        blog.published_by = user.id
+    elif old_status != ContentStatus.PUBLISHED and blog.status == ContentStatus.PUBLISHED:
         from datetime import datetime, timezone
         blog.published_at = datetime.now(timezone.utc)
         blog.published_by = user.id
@@ -144,12 +171,24 @@ def update_blog(
         blog.published_at = None
         blog.published_by = None
     
+    record_change(db, "blog", blog.id, blog.slug, ChangeOp.UPDATE)
+    record_revision(db, "blog", blog.id, revision_snapshot("blog", blog), user.id)
+    apply_facet_changes(db, "blog", old_facets, facet_values("blog", blog))
+    if old_status == ContentStatus.PUBLISHED or blog.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "blog", blog.id)
     db.commit()
     db.refresh(blog)
+    reschedule_publish("blog", blog)
     return blog
 
 
 def delete_blog(db: Session, blog_id: UUID) -> None:
     blog = get_blog_by_id(db, blog_id)
+    old_facets = facet_values("blog", blog)
     blog.is_deleted = True
+    record_change(db, "blog", blog.id, blog.slug, ChangeOp.DELETE)
+    apply_facet_changes(db, "blog", old_facets, frozenset())
+    if blog.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "blog", blog.id)
     db.commit()
+    reschedule_publish("blog", blog)
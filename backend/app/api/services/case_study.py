@@ -4,7 +4,13 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.enums import ContentStatus
+from app.api.services.changes import record_change
+from app.api.services.facets import apply_facet_changes, facet_values
+from app.api.services.scheduling import resolve_scheduled_publish_at
+from app.api.services.view_counts import SORT_POPULAR, SORT_RECENT, order_by_popularity
+from app.core.scheduler import reschedule_publish
+from app.core.tasks import enqueue_post_publish
+from app.models.enums import ChangeOp, ContentStatus
 from app.models.case_study import CaseStudy
 from app.models.user import User
 
@@ -55,10 +61,19 @@ def create_case_study(
         from datetime import datetime, timezone
         case_study.published_at = datetime.now(timezone.utc)
         case_study.published_by = user.id
+    elif case_study.status == ContentStatus.SCHEDULED:
+        case_study.published_at = resolve_scheduled_publish_at(data)
+        case_study.published_by = user.id
     
     db.add(case_study)
+    db.flush()
+    record_change(db, "case_study", case_study.id, case_study.slug, ChangeOp.CREATE)
+    apply_facet_changes(db, "case_study", frozenset(), facet_values("case_study", case_study))
+    if case_study.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "case_study", case_study.id)
     db.commit()
     db.refresh(case_study)
+    reschedule_publish("case_study", case_study)
     return case_study
 
 
@@ -87,6 +102,7 @@ def list_case_studies(
     status: Optional[ContentStatus] = None,
     industry: Optional[str] = None,
     category: Optional[str] = None,
+    sort: str = SORT_RECENT,
 ) -> List[CaseStudy]:
     query = select(CaseStudy).where(CaseStudy.is_deleted == False)
     
@@ -105,7 +121,11 @@ def list_case_studies(
             )
         )
     
-    query = query.offset(skip).limit(limit).order_by(CaseStudy.created_at.desc())
+    if sort == SORT_POPULAR:
+        query = order_by_popularity(query, CaseStudy, "case_study")
+    else:
+        query = query.order_by(CaseStudy.created_at.desc())
+    query = query.offset(skip).limit(limit)
     
     return list(db.scalars(query).all())
 
@@ -119,6 +139,7 @@ def update_case_study(
     case_study = get_case_study_by_id(db, case_study_id)
     
     old_status = case_study.status
+    old_facets = facet_values("case_study", case_study)
     
     if "slug" in data and data["slug"] != case_study.slug:
         existing = db.scalar(
@@ -165,7 +186,11 @@ def update_case_study(
     
     case_study.updated_by = user.id
     
-    if old_status != ContentStatus.PUBLISHED and case_study.status == ContentStatus.PUBLISHED:
+    if case_study.status == ContentStatus.SCHEDULED:
+        current = case_study.published_at if old_status == ContentStatus.SCHEDULED else None
+        case_study.published_at = resolve_scheduled_publish_at(data, current)
+        case_study.published_by = user.id
+    elif old_status != ContentStatus.PUBLISHED and case_study.status == ContentStatus.PUBLISHED:
         from datetime import datetime, timezone
         case_study.published_at = datetime.now(timezone.utc)
         case_study.published_by = user.id
@@ -173,12 +198,23 @@ def update_case_study(
         case_study.published_at = None
         case_study.published_by = None
     
+    record_change(db, "case_study", case_study.id, case_study.slug, ChangeOp.UPDATE)
+    apply_facet_changes(db, "case_study", old_facets, facet_values("case_study", case_study))
+    if old_status == ContentStatus.PUBLISHED or case_study.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "case_study", case_study.id)
     db.commit()
     db.refresh(case_study)
+    reschedule_publish("case_study", case_study)
     return case_study
 
 
 def delete_case_study(db: Session, case_study_id: UUID) -> None:
     case_study = get_case_study_by_id(db, case_study_id)
+    old_facets = facet_values("case_study", case_study)
     case_study.is_deleted = True
+    record_change(db, "case_study", case_study.id, case_study.slug, ChangeOp.DELETE)
+    apply_facet_changes(db, "case_study", old_facets, frozenset())
+    if case_study.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "case_study", case_study.id)
     db.commit()
+    reschedule_publish("case_study", case_study)
@@ -0,0 +1,158 @@
+"""
+Change feed service.
+
+Every content write appends a ``ChangeLog`` row inside the caller's
+transaction via ``record_change``. Once that transaction commits, in-process
+listeners are invoked and long-poll waiters on ``/cms/changes`` are woken.
+
+The row id is the feed cursor, so ids must become visible in order: a row
+that commits after a consumer has read past its id would never be served.
+``record_change`` therefore takes a transaction-level advisory lock before
+the row gets its id, which serialises change-log writers from that point to
+their commit. The same lock makes ``max(version) + 1`` safe; the unique
+``(entity_type, entity_id, version)`` index backs it up.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Callable, List, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.change_log import ChangeLog
+from app.models.enums import ChangeOp
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_changes"
+
+# Arbitrary application-wide key for pg_advisory_xact_lock.
+CHANGE_LOG_LOCK_KEY = 4_180_127_332
+
+
+class ChangeEvent(NamedTuple):
+    entity_type: str
+    entity_id: UUID
+    slug: Optional[str]
+    op: ChangeOp
+
+
+ChangeListener = Callable[[List[ChangeEvent]], None]
+
+_listeners: List[ChangeListener] = []
+_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = set()
+_waiters_lock = threading.Lock()
+
+
+def register_change_listener(listener: ChangeListener) -> None:
+    """Register a callback invoked with the committed changes of each transaction."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def record_change(
+    db: Session,
+    entity_type: str,
+    entity_id: UUID,
+    slug: Optional[str],
+    op: ChangeOp,
+) -> None:
+    """Append a change-log row to the session; it commits with the caller's write."""
+    # Write the caller's rows first so their row locks are taken before the
+    # shared lock, never while holding it.
+    db.flush()
+    db.execute(select(func.pg_advisory_xact_lock(CHANGE_LOG_LOCK_KEY)))
+    next_version = (
+        select(func.coalesce(func.max(ChangeLog.version), 0) + 1)
+        .where(ChangeLog.entity_type == entity_type, ChangeLog.entity_id == entity_id)
+        .scalar_subquery()
+    )
+    db.add(
+        ChangeLog(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            slug=slug,
+            op=op.value,
+            version=next_version,
+        )
+    )
+    db.info.setdefault(_PENDING_KEY, []).append(
+        ChangeEvent(entity_type, entity_id, slug, op)
+    )
+
+
+def list_changes(
+    db: Session,
+    since: int = 0,
+    limit: int = 500,
+    entity_type: Optional[str] = None,
+) -> List[ChangeLog]:
+    query = select(ChangeLog).where(ChangeLog.id > since)
+
+    if entity_type:
+        query = query.where(ChangeLog.entity_type == entity_type)
+
+    query = query.order_by(ChangeLog.id).limit(limit)
+
+    return list(db.scalars(query).all())
+
+
+def get_latest_cursor(db: Session) -> int:
+    return db.scalar(select(func.coalesce(func.max(ChangeLog.id), 0)))
+
+
+async def wait_for_changes(timeout: float) -> bool:
+    """
+    Wait until a change is committed in this process or ``timeout`` elapses.
+
+    Returns:
+        True if woken by a commit, False on timeout
+    """
+    loop = asyncio.get_running_loop()
+    waiter = (loop, loop.create_future())
+    with _waiters_lock:
+        _waiters.add(waiter)
+    try:
+        await asyncio.wait_for(waiter[1], timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        with _waiters_lock:
+            _waiters.discard(waiter)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _wake_waiters() -> None:
+    with _waiters_lock:
+        waiters = list(_waiters)
+    for loop, future in waiters:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(_resolve, future)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _dispatch_committed_changes(session: Session) -> None:
+    changes = session.info.pop(_PENDING_KEY, None)
+    if not changes:
+        return
+    for listener in list(_listeners):
+        try:
+            listener(changes)
+        except Exception:
+            logger.exception("Change listener %r failed", listener)
+    _wake_waiters()
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _discard_pending_changes(session: Session, previous_transaction) -> None:
+    if not session.in_transaction():
+        session.info.pop(_PENDING_KEY, None)
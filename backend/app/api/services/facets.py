@@ -0,0 +1,215 @@
+"""
+Facet counts for content filters.
+
+``content_facet_counts`` holds one row per (content type, facet, value) with
+the number of published, non-deleted items carrying that value. Content
+services snapshot an item's facet values before a write and apply the
+difference afterwards, inside the same transaction, so the aggregate is
+always consistent with the content rows.
+
+Reads are served from a per-process copy that is dropped when a change to
+that content type commits here, and expires after ``FACET_CACHE_TTL_SECONDS``
+to pick up writes made by other processes.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy import delete, func, literal, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.api.services.changes import ChangeEvent, register_change_listener
+from app.core.config import settings
+from app.core.request_log import note_cache
+from app.db.session import SessionLocal
+from app.models.blog import Blog
+from app.models.case_study import CaseStudy
+from app.models.enums import ContentStatus
+from app.models.facet_count import ContentFacetCount
+
+logger = logging.getLogger(__name__)
+
+# Facets maintained per content type: facet name -> model attribute.
+# Case study "category" filters match industry or tags, so those are its facets.
+FACET_FIELDS: Dict[str, Dict[str, str]] = {
+    "blog": {"tag": "tags", "category": "category"},
+    "case_study": {"tag": "tags", "industry": "industry"},
+}
+
+_FACET_MODELS = {"blog": Blog, "case_study": CaseStudy}
+
+FacetKey = Tuple[str, str]
+FacetCounts = Dict[str, List[Dict[str, object]]]
+
+_cache: Dict[str, Tuple[float, FacetCounts]] = {}
+_cache_lock = threading.Lock()
+
+
+def facet_values(entity_type: str, item) -> FrozenSet[FacetKey]:
+    """(facet, value) pairs an item contributes; empty unless it is published."""
+    fields = FACET_FIELDS.get(entity_type)
+    if not fields or item.is_deleted or item.status != ContentStatus.PUBLISHED:
+        return frozenset()
+    pairs = set()
+    for facet, attribute in fields.items():
+        value = getattr(item, attribute)
+        values = value if isinstance(value, list) else [value]
+        pairs.update((facet, v) for v in values if v)
+    return frozenset(pairs)
+
+
+def apply_facet_changes(
+    db: Session,
+    entity_type: str,
+    before: FrozenSet[FacetKey],
+    after: FrozenSet[FacetKey],
+) -> None:
+    """Adjust facet counts by the difference between two snapshots of one item."""
+    deltas = {key: 1 for key in after - before}
+    deltas.update({key: -1 for key in before - after})
+    if not deltas:
+        return
+
+    # Stable row order keeps concurrent writers from deadlocking.
+    rows = [
+        {"entity_type": entity_type, "facet": facet, "value": value, "count": delta}
+        for (facet, value), delta in sorted(deltas.items())
+    ]
+    stmt = insert(ContentFacetCount).values(rows)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[
+                ContentFacetCount.entity_type,
+                ContentFacetCount.facet,
+                ContentFacetCount.value,
+            ],
+            set_={"count": ContentFacetCount.count + stmt.excluded.count},
+        )
+    )
+
+    removed = [key for key, delta in deltas.items() if delta < 0]
+    if removed:
+        db.execute(
+            delete(ContentFacetCount).where(
+                ContentFacetCount.entity_type == entity_type,
+                tuple_(ContentFacetCount.facet, ContentFacetCount.value).in_(removed),
+                ContentFacetCount.count <= 0,
+            )
+        )
+
+
+def get_facet_counts(db: Session, entity_type: str) -> FacetCounts:
+    """Return ``{facet: [{"value", "count"}, ...]}`` ordered by count, most common first."""
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _cache.get(entity_type)
+    if cached is not None and cached[0] > now:
+        note_cache(hit=True)
+        return cached[1]
+    note_cache(hit=False)
+
+    result: FacetCounts = {facet: [] for facet in FACET_FIELDS[entity_type]}
+    rows = db.execute(
+        select(ContentFacetCount.facet, ContentFacetCount.value, ContentFacetCount.count)
+        .where(ContentFacetCount.entity_type == entity_type, ContentFacetCount.count > 0)
+        .order_by(
+            ContentFacetCount.facet,
+            ContentFacetCount.count.desc(),
+            ContentFacetCount.value,
+        )
+    )
+    for facet, value, count in rows:
+        result.setdefault(facet, []).append({"value": value, "count": count})
+
+    with _cache_lock:
+        _cache[entity_type] = (now + settings.FACET_CACHE_TTL_SECONDS, result)
+    return result
+
+
+def _invalidate_on_change(changes: List[ChangeEvent]) -> None:
+    with _cache_lock:
+        for change in changes:
+            _cache.pop(change.entity_type, None)
+
+
+register_change_listener(_invalidate_on_change)
+
+
+# ============================================================================
+# Backfill
+# ============================================================================
+
+def _count_from_content(db: Session, entity_type: str) -> Counter:
+    model = _FACET_MODELS[entity_type]
+    counts: Counter = Counter()
+    for facet, attribute in FACET_FIELDS[entity_type].items():
+        column = getattr(model, attribute)
+        is_array = attribute == "tags"
+        value = func.unnest(column) if is_array else column
+        values = (
+            select(model.id, value.label("value"))
+            .where(
+                model.status == ContentStatus.PUBLISHED,
+                model.is_deleted == False,
+                column.isnot(None),
+            )
+            .subquery()
+        )
+        for facet_value, count in db.execute(
+            select(values.c.value, func.count(values.c.id.distinct())).group_by(values.c.value)
+        ):
+            if facet_value:
+                counts[(facet, facet_value)] = count
+    return counts
+
+
+def rebuild_facet_counts(db: Session, entity_type: Optional[str] = None) -> int:
+    """
+    Recompute facet counts from the content tables.
+
+    Takes an exclusive table lock so concurrent incremental updates wait for
+    the rebuild instead of being overwritten by it. The caller commits.
+    """
+    db.execute(text("LOCK TABLE content_facet_counts IN EXCLUSIVE MODE"))
+
+    written = 0
+    for current in [entity_type] if entity_type else list(FACET_FIELDS):
+        db.execute(delete(ContentFacetCount).where(ContentFacetCount.entity_type == current))
+        counts = _count_from_content(db, current)
+        if counts:
+            db.execute(
+                insert(ContentFacetCount).values(
+                    [
+                        {"entity_type": current, "facet": facet, "value": value, "count": count}
+                        for (facet, value), count in sorted(counts.items())
+                    ]
+                )
+            )
+        written += len(counts)
+        with _cache_lock:
+            _cache.pop(current, None)
+    return written
+
+
+def ensure_facet_counts() -> None:
+    """Backfill facet counts once, when the aggregate table is still empty."""
+    with SessionLocal() as db:
+        if db.scalar(select(literal(1)).select_from(ContentFacetCount).limit(1)):
+            return
+        has_content = any(
+            db.scalar(
+                select(literal(1)).select_from(model).where(
+                    model.status == ContentStatus.PUBLISHED, model.is_deleted == False
+                ).limit(1)
+            )
+            for model in _FACET_MODELS.values()
+        )
+        if not has_content:
+            return
+        written = rebuild_facet_counts(db)
+        db.commit()
+        logger.info(f"Backfilled {written} facet count(s)")
@@ -0,0 +1,255 @@
+"""
+Sitemap and feed generation.
+
+Output is produced by generators that read projected columns through
+server-side cursors (``yield_per``), so memory use does not grow with the
+number of published items. Each generator opens its own session because it
+runs after the request handler (and its ``get_db`` session) has returned.
+
+Rendered documents are cached per process together with the change-log head
+cursor they were built at; any content write, in any process, moves the
+cursor and invalidates them.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+from uuid import UUID
+from xml.sax.saxutils import escape
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.request_log import note_cache
+from app.db.session import SessionLocal
+from app.models.blog import Blog
+from app.models.enums import ContentStatus
+from app.models.registry import CONTENT_MODELS
+
+# Sitemap protocol limit per file.
+SITEMAP_MAX_URLS = 50000
+
+_YIELD_PER = 1000
+
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+_SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+# Sitemap sections in output order, with their public URL patterns.
+SITEMAP_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("page", "/{slug}"),
+    ("service", "/services/{slug}"),
+    ("blog", "/blogs/{slug}"),
+    ("case_study", "/case-studies/{slug}"),
+    ("job", "/careers/{slug}"),
+)
+
+# Page slug rendered by the site root.
+HOME_PAGE_SLUG = "home"
+
+
+# ============================================================================
+# Rendered Output Cache
+# ============================================================================
+
+@dataclass
+class _CachedDocument:
+    cursor: int
+    body: bytes
+
+
+_cache: Dict[str, _CachedDocument] = {}
+_cache_lock = threading.Lock()
+
+
+def get_cached_document(key: str, cursor: int) -> Optional[bytes]:
+    """Return a rendered document if it was built at the current change cursor."""
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None and cached.cursor == cursor:
+        note_cache(hit=True)
+        return cached.body
+    note_cache(hit=False)
+    return None
+
+
+def cache_while_streaming(key: str, cursor: int, chunks: Iterator[str]) -> Iterator[bytes]:
+    """Pass chunks through to the client and cache the full document once complete."""
+    parts: List[bytes] = []
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        parts.append(data)
+        yield data
+    with _cache_lock:
+        _cache[key] = _CachedDocument(cursor, b"".join(parts))
+
+
+# ============================================================================
+# Sitemap
+# ============================================================================
+
+def _site_url(path: str) -> str:
+    return settings.PUBLIC_SITE_URL.rstrip("/") + path
+
+
+def _published(model):
+    return (model.status == ContentStatus.PUBLISHED) & (model.is_deleted == False)
+
+
+@dataclass
+class SitemapLayout:
+    """
+    Where each sitemap shard starts, read in a single snapshot.
+
+    ``shard_starts`` holds the (section index, id) of the first URL of every
+    shard. Shards are bounded by these ids rather than by offsets, so a
+    publish or delete between the layout query and rendering a shard can
+    change that shard's length but never moves a URL into a second shard or
+    out of all of them.
+    """
+    total: int
+    shard_starts: List[Tuple[int, UUID]]
+
+
+def get_sitemap_layout(db: Session) -> SitemapLayout:
+    """Count published URLs and find each shard's first id in one statement."""
+    urls = union_all(
+        *(
+            select(literal(index).label("section"), CONTENT_MODELS[entity_type].id.label("id"))
+            .where(_published(CONTENT_MODELS[entity_type]))
+            for index, (entity_type, _) in enumerate(SITEMAP_SECTIONS)
+        )
+    ).subquery("urls")
+    numbered = select(
+        urls.c.section,
+        urls.c.id,
+        (func.row_number().over(order_by=(urls.c.section, urls.c.id)) - 1).label("position"),
+        func.count().over().label("total"),
+    ).subquery("numbered")
+    rows = db.execute(
+        select(numbered.c.section, numbered.c.id, numbered.c.total)
+        .where(numbered.c.position % SITEMAP_MAX_URLS == 0)
+        .order_by(numbered.c.position)
+    ).all()
+    return SitemapLayout(
+        total=rows[0].total if rows else 0,
+        shard_starts=[(row.section, row.id) for row in rows],
+    )
+
+
+def get_sitemap_shard_count(layout: SitemapLayout) -> int:
+    """Number of sitemap files needed; 1 means no index is required."""
+    return max(1, len(layout.shard_starts))
+
+
+def _shard_ranges(
+    layout: SitemapLayout, shard: int
+) -> List[Tuple[str, str, Optional[UUID], Optional[UUID]]]:
+    """Map a shard onto (section, pattern, first id, end id) keyset slices."""
+    start_section, start_id = layout.shard_starts[shard]
+    end = layout.shard_starts[shard + 1] if shard + 1 < len(layout.shard_starts) else None
+    last_section = end[0] if end is not None else len(SITEMAP_SECTIONS) - 1
+    ranges = []
+    for index in range(start_section, last_section + 1):
+        entity_type, pattern = SITEMAP_SECTIONS[index]
+        ranges.append(
+            (
+                entity_type,
+                pattern,
+                start_id if index == start_section else None,
+                end[1] if end is not None and index == end[0] else None,
+            )
+        )
+    return ranges
+
+
+def _format_url(pattern: str, entity_type: str, slug: str) -> str:
+    if entity_type == "page" and slug == HOME_PAGE_SLUG:
+        return _site_url("/")
+    return _site_url(pattern.format(slug=quote(slug, safe="")))
+
+
+def _url_entry(loc: str, lastmod: Optional[datetime]) -> str:
+    entry = f"<url><loc>{escape(loc)}</loc>"
+    if lastmod is not None:
+        entry += f"<lastmod>{lastmod.date().isoformat()}</lastmod>"
+    return entry + "</url>\n"
+
+
+def generate_sitemap(layout: SitemapLayout, shard: Optional[int] = None) -> Iterator[str]:
+    """
+    Stream a ``<urlset>`` document.
+
+    With ``shard=None`` every published URL is emitted; otherwise only the
+    slice belonging to that zero-based shard of the sitemap index. Each
+    slice is an ``id`` range read in id order, so every shard costs the
+    same however far into the table it starts.
+    """
+    if shard is None:
+        ranges = [(entity_type, pattern, None, None) for entity_type, pattern in SITEMAP_SECTIONS]
+    else:
+        ranges = _shard_ranges(layout, shard)
+
+    yield _XML_HEADER
+    yield f'<urlset xmlns="{_SITEMAP_NS}">\n'
+    with SessionLocal() as db:
+        for entity_type, pattern, first_id, end_id in ranges:
+            model = CONTENT_MODELS[entity_type]
+            query = select(model.slug, model.updated_at).where(_published(model))
+            if first_id is not None:
+                query = query.where(model.id >= first_id)
+            if end_id is not None:
+                query = query.where(model.id < end_id)
+            rows = db.execute(query.order_by(model.id).execution_options(yield_per=_YIELD_PER))
+            for slug, updated_at in rows:
+                yield _url_entry(_format_url(pattern, entity_type, slug), updated_at)
+    yield "</urlset>\n"
+
+
+def generate_sitemap_index(shard_count: int) -> Iterator[str]:
+    """Stream a ``<sitemapindex>`` pointing at ``/sitemap-{n}.xml`` shards."""
+    yield _XML_HEADER
+    yield f'<sitemapindex xmlns="{_SITEMAP_NS}">\n'
+    for shard in range(1, shard_count + 1):
+        yield f"<sitemap><loc>{escape(_site_url(f'/sitemap-{shard}.xml'))}</loc></sitemap>\n"
+    yield "</sitemapindex>\n"
+
+
+# ============================================================================
+# Blog Feed (RSS 2.0)
+# ============================================================================
+
+def _rfc822(value: datetime) -> str:
+    return value.strftime("%a, %d %b %Y %H:%M:%S %z")
+
+
+def generate_blog_feed() -> Iterator[str]:
+    """Stream an RSS 2.0 feed of the most recently published blogs."""
+    site = _site_url("/")
+    yield _XML_HEADER
+    yield '<rss version="2.0">\n<channel>\n'
+    yield f"<title>{escape(settings.APP_NAME)} Blog</title>\n"
+    yield f"<link>{escape(site)}</link>\n"
+    yield f"<description>{escape(settings.APP_NAME)} blog posts</description>\n"
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(Blog.slug, Blog.title, Blog.excerpt, Blog.published_at, Blog.created_at)
+            .where(_published(Blog))
+            .order_by(Blog.published_at.desc().nulls_last(), Blog.created_at.desc())
+            .limit(settings.FEED_MAX_ITEMS)
+            .execution_options(yield_per=_YIELD_PER)
+        )
+        for slug, title, excerpt, published_at, created_at in rows:
+            link = _site_url(f"/blogs/{quote(slug, safe='')}")
+            item = (
+                f"<item><title>{escape(title)}</title>"
+                f"<link>{escape(link)}</link>"
+                f'<guid isPermaLink="true">{escape(link)}</guid>'
+                f"<pubDate>{_rfc822(published_at or created_at)}</pubDate>"
+            )
+            if excerpt:
+                item += f"<description>{escape(excerpt)}</description>"
+            yield item + "</item>\n"
+    yield "</channel>\n</rss>\n"
@@ -4,7 +4,12 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.enums import ContentStatus
+from app.api.services.changes import record_change
+from app.api.services.scheduling import resolve_scheduled_publish_at
+from app.api.services.view_counts import SORT_POPULAR, SORT_RECENT, order_by_popularity
+from app.core.scheduler import reschedule_publish
+from app.core.tasks import enqueue_post_publish
+from app.models.enums import ChangeOp, ContentStatus
 from app.models.job import Job
 from app.models.user import User
 
@@ -39,10 +44,18 @@ def create_job(db: Session, data: dict, user: User) -> Job:
         from datetime import datetime, timezone
         job.published_at = datetime.now(timezone.utc)
         job.published_by = user.id
+    elif job.status == ContentStatus.SCHEDULED:
+        job.published_at = resolve_scheduled_publish_at(data)
+        job.published_by = user.id
 
     db.add(job)
+    db.flush()
+    record_change(db, "job", job.id, job.slug, ChangeOp.CREATE)
+    if job.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "job", job.id)
     db.commit()
     db.refresh(job)
+    reschedule_publish("job", job)
     return job
 
 
@@ -66,18 +79,24 @@ def list_jobs(
     limit: int = 100,
     status: Optional[ContentStatus] = None,
     job_type: Optional[str] = None,
+    sort: str = SORT_RECENT,
 ) -> List[Job]:
     query = select(Job).where(Job.is_deleted == False)
     if status:
         query = query.where(Job.status == status)
     if job_type:
         query = query.where(Job.job_type == job_type)
-    query = query.order_by(Job.created_at.desc()).offset(skip).limit(limit)
+    if sort == SORT_POPULAR:
+        query = order_by_popularity(query, Job, "job")
+    else:
+        query = query.order_by(Job.created_at.desc())
+    query = query.offset(skip).limit(limit)
     return list(db.scalars(query).all())
 
 
 def update_job(db: Session, job_id: UUID, data: dict, user: User) -> Job:
     job = get_job_by_id(db, job_id)
+    old_status = job.status
     if "slug" in data and data["slug"] != job.slug:
         existing = db.scalar(
             select(Job).where(Job.slug == data["slug"], Job.id != job_id)
@@ -100,20 +119,31 @@ def update_job(db: Session, job_id: UUID, data: dict, user: User) -> Job:
     if "content" in data:
         job.content = data["content"]
     if "status" in data:
-        old_status = job.status
         job.status = data["status"]
         if old_status != ContentStatus.PUBLISHED and data["status"] == ContentStatus.PUBLISHED:
             from datetime import datetime, timezone
-            if not job.published_at:
+            if not job.published_at or old_status == ContentStatus.SCHEDULED:
                 job.published_at = datetime.now(timezone.utc)
             job.published_by = user.id
+    if job.status == ContentStatus.SCHEDULED:
+        current = job.published_at if old_status == ContentStatus.SCHEDULED else None
+        job.published_at = resolve_scheduled_publish_at(data, current)
+        job.published_by = user.id
     job.updated_by = user.id
+    record_change(db, "job", job.id, job.slug, ChangeOp.UPDATE)
+    if old_status == ContentStatus.PUBLISHED or job.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "job", job.id)
     db.commit()
     db.refresh(job)
+    reschedule_publish("job", job)
     return job
 
 
 def delete_job(db: Session, job_id: UUID) -> None:
     job = get_job_by_id(db, job_id)
     job.is_deleted = True
+    record_change(db, "job", job.id, job.slug, ChangeOp.DELETE)
+    if job.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "job", job.id)
     db.commit()
+    reschedule_publish("job", job)
@@ -4,7 +4,12 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.enums import ContentStatus
+from app.api.services.changes import record_change
+from app.api.services.revisions import record_revision, revision_snapshot
+from app.api.services.scheduling import resolve_scheduled_publish_at
+from app.core.scheduler import reschedule_publish
+from app.core.tasks import enqueue_post_publish
+from app.models.enums import ChangeOp, ContentStatus
 from app.models.page import Page
 from app.models.user import User
 
@@ -46,10 +51,19 @@ def create_page(
         from datetime import datetime, timezone
         page.published_at = datetime.now(timezone.utc)
         page.published_by = user.id
+    elif page.status == ContentStatus.SCHEDULED:
+        page.published_at = resolve_scheduled_publish_at(data)
+        page.published_by = user.id
     
     db.add(page)
+    db.flush()
+    record_change(db, "page", page.id, page.slug, ChangeOp.CREATE)
+    record_revision(db, "page", page.id, revision_snapshot("page", page), user.id)
+    if page.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "page", page.id)
     db.commit()
     db.refresh(page)
+    reschedule_publish("page", page)
     return page
 
 
@@ -107,6 +121,7 @@ def update_page(
     user: User
 ) -> Page:
     page = get_page_by_id(db, page_id)
+    old_status = page.status
     
     if "slug" in data and data["slug"] != page.slug:
         existing = db.scalar(
@@ -126,13 +141,16 @@ def update_page(
     if "template" in data:
         page.template = data["template"]
     if "status" in data:
-        old_status = page.status
         page.status = data["status"]
         if old_status != ContentStatus.PUBLISHED and data["status"] == ContentStatus.PUBLISHED:
             from datetime import datetime, timezone
-            if not page.published_at:
+            if not page.published_at or old_status == ContentStatus.SCHEDULED:
                 page.published_at = datetime.now(timezone.utc)
             page.published_by = user.id
+    if page.status == ContentStatus.SCHEDULED:
+        current = page.published_at if old_status == ContentStatus.SCHEDULED else None
+        page.published_at = resolve_scheduled_publish_at(data, current)
+        page.published_by = user.id
     if "meta_title" in data:
         page.meta_title = data["meta_title"]
     if "meta_description" in data:
@@ -144,8 +162,13 @@ def update_page(
     
     page.updated_by = user.id
     
+    record_change(db, "page", page.id, page.slug, ChangeOp.UPDATE)
+    record_revision(db, "page", page.id, revision_snapshot("page", page), user.id)
+    if old_status == ContentStatus.PUBLISHED or page.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "page", page.id)
     db.commit()
     db.refresh(page)
+    reschedule_publish("page", page)
     return page
 
 
@@ -155,4 +178,8 @@ def delete_page(
 ) -> None:
     page = get_page_by_id(db, page_id)
     page.is_deleted = True
+    record_change(db, "page", page.id, page.slug, ChangeOp.DELETE)
+    if page.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "page", page.id)
     db.commit()
+    reschedule_publish("page", page)
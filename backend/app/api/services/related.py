@@ -0,0 +1,308 @@
+"""
+Related-content recommendations.
+
+Published blogs, case studies and services are described by sparse term
+vectors built from their tags, category, industry and SEO keywords. Items
+are L2-normalised, so the dot product of two rows is their cosine
+similarity. Scores are computed with NumPy over a CSR matrix and its
+transposed postings, touching only items that share at least one term.
+
+Results are stored in ``related_content`` by the ``related.refresh``
+background task. Each refresh recomputes only the rows that can have
+changed: items edited since their last computation, items sharing a term
+with those, and items whose stored list points at something that changed or
+is no longer published.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.tasks import enqueue, register_post_publish_hook, task_handler
+from app.models.blog import Blog
+from app.models.case_study import CaseStudy
+from app.models.enums import ContentStatus
+from app.models.related_content import RelatedContent
+from app.models.service import Service
+
+logger = logging.getLogger(__name__)
+
+RELATED_REFRESH_TASK = "related.refresh"
+
+RELATED_MODELS = {
+    "blog": Blog,
+    "case_study": CaseStudy,
+    "service": Service,
+}
+
+# Feature weights; terms from every source share one vocabulary so that,
+# e.g., a blog tag can match a service keyword.
+TAG_WEIGHT = 1.0
+CATEGORY_WEIGHT = 1.5
+KEYWORD_WEIGHT = 0.5
+
+_UPSERT_CHUNK_SIZE = 1000
+
+ItemKey = Tuple[str, UUID]
+
+
+@dataclass
+class _Item:
+    entity_type: str
+    id: UUID
+    slug: str
+    title: str
+    updated_at: Optional[datetime]
+    terms: Dict[str, float]
+
+
+# ============================================================================
+# Feature Extraction
+# ============================================================================
+
+def _normalize_term(value: str) -> str:
+    return " ".join(value.lower().split())
+
+
+def _add_terms(terms: Dict[str, float], values: Optional[Iterable[str]], weight: float) -> None:
+    for value in values or ():
+        if value:
+            term = _normalize_term(value)
+            if term:
+                terms[term] = max(terms.get(term, 0.0), weight)
+
+
+def _load_items(db: Session) -> List[_Item]:
+    items: List[_Item] = []
+    for entity_type, model in RELATED_MODELS.items():
+        columns = [model.id, model.slug, model.title, model.updated_at, model.meta_keywords]
+        columns += [getattr(model, name) for name in ("tags", "category", "industry") if hasattr(model, name)]
+        rows = db.execute(
+            select(*columns).where(
+                model.status == ContentStatus.PUBLISHED,
+                model.is_deleted == False,
+            )
+        ).mappings()
+        for row in rows:
+            terms: Dict[str, float] = {}
+            _add_terms(terms, row.get("meta_keywords"), KEYWORD_WEIGHT)
+            _add_terms(terms, row.get("tags"), TAG_WEIGHT)
+            _add_terms(terms, [row.get("category"), row.get("industry")], CATEGORY_WEIGHT)
+            items.append(
+                _Item(entity_type, row["id"], row["slug"], row["title"], row["updated_at"], terms)
+            )
+    return items
+
+
+# ============================================================================
+# Similarity
+# ============================================================================
+
+class _TermMatrix:
+    """Row-normalised CSR term matrix with a CSC copy for posting-list lookups."""
+
+    def __init__(self, items: List[_Item]) -> None:
+        vocabulary: Dict[str, int] = {}
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for item in items:
+            for term, weight in item.terms.items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                data.append(weight)
+            indptr.append(len(indices))
+
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=np.float64)
+
+        # L2-normalise each row so dot products are cosine similarities.
+        row_of = np.repeat(np.arange(len(items)), np.diff(self.indptr))
+        norms = np.sqrt(np.bincount(row_of, weights=self.data ** 2, minlength=len(items)))
+        if len(self.data):
+            self.data = self.data / norms[row_of]
+
+        order = np.argsort(self.indices, kind="stable")
+        self.col_rows = row_of[order]
+        self.col_data = self.data[order]
+        self.col_ptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=len(vocabulary)), out=self.col_ptr[1:])
+
+    def _postings(self, row: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self.indptr[row], self.indptr[row + 1]
+        rows, values = [], []
+        for term, weight in zip(self.indices[start:end], self.data[start:end]):
+            lo, hi = self.col_ptr[term], self.col_ptr[term + 1]
+            rows.append(self.col_rows[lo:hi])
+            values.append(self.col_data[lo:hi] * weight)
+        if not rows:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty.astype(np.float64)
+        return np.concatenate(rows), np.concatenate(values)
+
+    def neighbours(self, row: int) -> np.ndarray:
+        """Rows sharing at least one term with ``row`` (including itself)."""
+        rows, _ = self._postings(row)
+        return np.unique(rows)
+
+    def top_k(self, row: int, k: int) -> List[Tuple[int, float]]:
+        rows, values = self._postings(row)
+        if not len(rows):
+            return []
+        candidates, inverse = np.unique(rows, return_inverse=True)
+        scores = np.bincount(inverse, weights=values)
+        keep = candidates != row
+        candidates, scores = candidates[keep], scores[keep]
+        if len(candidates) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        return [(int(candidates[i]), float(scores[i])) for i in order if scores[i] > 0]
+
+
+# ============================================================================
+# Refresh
+# ============================================================================
+
+def refresh_related_content(db: Session, full: bool = False) -> int:
+    """
+    Recompute stale related-content rows.
+
+    Args:
+        db: Database session (the caller commits)
+        full: Recompute every row instead of only the affected ones
+
+    Returns:
+        Number of rows written
+    """
+    started = datetime.now(timezone.utc)
+    items = _load_items(db)
+    position: Dict[ItemKey, int] = {
+        (item.entity_type, item.id): index for index, item in enumerate(items)
+    }
+
+    stored: Dict[ItemKey, Tuple[datetime, List[Dict[str, Any]]]] = {
+        (entity_type, entity_id): (computed_at, related)
+        for entity_type, entity_id, computed_at, related in db.execute(
+            select(
+                RelatedContent.entity_type,
+                RelatedContent.entity_id,
+                RelatedContent.computed_at,
+                RelatedContent.items,
+            )
+        )
+    }
+
+    orphaned = [key for key in stored if key not in position]
+    if orphaned:
+        db.execute(
+            delete(RelatedContent).where(
+                tuple_(RelatedContent.entity_type, RelatedContent.entity_id).in_(orphaned)
+            )
+        )
+
+    if full:
+        dirty = set(range(len(items)))
+    else:
+        dirty = {
+            index for key, index in position.items()
+            if key not in stored
+            or (items[index].updated_at is not None and items[index].updated_at > stored[key][0])
+        }
+
+    matrix = _TermMatrix(items)
+
+    affected: Set[int] = set(dirty)
+    for index in dirty:
+        affected.update(int(row) for row in matrix.neighbours(index))
+
+    dirty_keys = {(items[index].entity_type, str(items[index].id)) for index in dirty}
+    for key, (_, related) in stored.items():
+        index = position.get(key)
+        if index is None or index in affected:
+            continue
+        for entry in related:
+            ref = (entry.get("type"), entry.get("id"))
+            if ref in dirty_keys or (ref[0], _as_uuid(ref[1])) not in position:
+                affected.add(index)
+                break
+
+    if not affected:
+        return len(orphaned)
+
+    k = settings.RELATED_CONTENT_TOP_K
+    rows = []
+    for index in sorted(affected):
+        item = items[index]
+        related = [
+            {
+                "type": items[other].entity_type,
+                "id": str(items[other].id),
+                "slug": items[other].slug,
+                "title": items[other].title,
+                "score": round(score, 4),
+            }
+            for other, score in matrix.top_k(index, k)
+        ]
+        rows.append(
+            {
+                "entity_type": item.entity_type,
+                "entity_id": item.id,
+                "items": related,
+                "computed_at": started,
+            }
+        )
+
+    for start in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+        stmt = insert(RelatedContent).values(rows[start:start + _UPSERT_CHUNK_SIZE])
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[RelatedContent.entity_type, RelatedContent.entity_id],
+                set_={"items": stmt.excluded.items, "computed_at": stmt.excluded.computed_at},
+            )
+        )
+
+    logger.info(
+        f"Related content refreshed: {len(rows)} row(s) recomputed "
+        f"({len(dirty)} changed of {len(items)}), {len(orphaned)} removed"
+    )
+    return len(rows) + len(orphaned)
+
+
+def _as_uuid(value: Any) -> Optional[UUID]:
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
+def schedule_related_refresh(db: Session, full: bool = False) -> None:
+    """Queue a refresh; bursts of edits within the delay collapse into one run."""
+    enqueue(
+        db,
+        RELATED_REFRESH_TASK,
+        {"full": full},
+        dedup_key=RELATED_REFRESH_TASK,
+        delay_seconds=settings.RELATED_REFRESH_DELAY_SECONDS,
+    )
+
+
+@task_handler(RELATED_REFRESH_TASK)
+def _run_related_refresh(db: Session, payload: Dict[str, Any]) -> None:
+    refresh_related_content(db, full=bool(payload.get("full")))
+
+
+def _on_content_published(db: Session, payload: Dict[str, Any]) -> None:
+    if payload.get("entity_type") in RELATED_MODELS:
+        schedule_related_refresh(db)
+
+
+register_post_publish_hook(_on_content_published)
@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+
+class InvalidScheduleError(Exception):
+    pass
+
+
+def resolve_scheduled_publish_at(data: dict, current: Optional[datetime] = None) -> datetime:
+    """
+    Validate the publish time for an item saved with status 'scheduled'.
+
+    A newly supplied ``published_at`` must be in the future; an existing one is
+    kept as-is so unrelated edits don't fail as the fire time approaches.
+    """
+    when = data.get("published_at") or current
+    if when is None:
+        raise InvalidScheduleError("published_at is required when status is 'scheduled'")
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    if data.get("published_at") and when <= datetime.now(timezone.utc):
+        raise InvalidScheduleError("published_at must be in the future for scheduled content")
+    return when
@@ -4,7 +4,11 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.enums import ContentStatus
+from app.api.services.changes import record_change
+from app.api.services.scheduling import resolve_scheduled_publish_at
+from app.core.scheduler import reschedule_publish
+from app.core.tasks import enqueue_post_publish
+from app.models.enums import ChangeOp, ContentStatus
 from app.models.service import Service
 from app.models.user import User
 
@@ -49,10 +53,18 @@ def create_service(
         from datetime import datetime, timezone
         service.published_at = datetime.now(timezone.utc)
         service.published_by = user.id
+    elif service.status == ContentStatus.SCHEDULED:
+        service.published_at = resolve_scheduled_publish_at(data)
+        service.published_by = user.id
     
     db.add(service)
+    db.flush()
+    record_change(db, "service", service.id, service.slug, ChangeOp.CREATE)
+    if service.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "service", service.id)
     db.commit()
     db.refresh(service)
+    reschedule_publish("service", service)
     return service
 
 
@@ -110,6 +122,7 @@ def update_service(
     user: User
 ) -> Service:
     service = get_service_by_id(db, service_id)
+    old_status = service.status
     
     if "slug" in data and data["slug"] != service.slug:
         existing = db.scalar(
@@ -135,13 +148,16 @@ def update_service(
     if "icon_url" in data:
         service.icon_url = data["icon_url"]
     if "status" in data:
-        old_status = service.status
         service.status = data["status"]
         if old_status != ContentStatus.PUBLISHED and data["status"] == ContentStatus.PUBLISHED:
             from datetime import datetime, timezone
-            if not service.published_at:
+            if not service.published_at or old_status == ContentStatus.SCHEDULED:
                 service.published_at = datetime.now(timezone.utc)
             service.published_by = user.id
+    if service.status == ContentStatus.SCHEDULED:
+        current = service.published_at if old_status == ContentStatus.SCHEDULED else None
+        service.published_at = resolve_scheduled_publish_at(data, current)
+        service.published_by = user.id
     if "meta_title" in data:
         service.meta_title = data["meta_title"]
     if "meta_description" in data:
@@ -153,8 +169,12 @@ def update_service(
     
     service.updated_by = user.id
     
+    record_change(db, "service", service.id, service.slug, ChangeOp.UPDATE)
+    if old_status == ContentStatus.PUBLISHED or service.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "service", service.id)
     db.commit()
     db.refresh(service)
+    reschedule_publish("service", service)
     return service
 
 
@@ -164,4 +184,8 @@ def delete_service(
 ) -> None:
     service = get_service_by_id(db, service_id)
     service.is_deleted = True
+    record_change(db, "service", service.id, service.slug, ChangeOp.DELETE)
+    if service.status == ContentStatus.PUBLISHED:
+        enqueue_post_publish(db, "service", service.id)
     db.commit()
+    reschedule_publish("service", service)
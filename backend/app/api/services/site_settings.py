@@ -1,9 +1,22 @@
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.api.services.changes import ChangeEvent, record_change, register_change_listener
+from app.core.config import settings
+from app.core.request_log import note_cache
+from app.models.enums import ChangeOp
 from app.models.site_settings import SiteSettings
 
+# Per-process cache of setting values: key -> (expires_at, value or _MISSING).
+# Dropped when a setting change commits in this process; the TTL bounds how
+# long other processes' writes take to show up.
+_MISSING = object()
+_cache: Dict[str, Tuple[float, Any]] = {}
+_cache_lock = threading.Lock()
+
 
 class SiteSettingsNotFoundError(Exception):
     pass
@@ -16,10 +29,40 @@ def get_setting(db: Session, key: str) -> Optional[SiteSettings]:
 
 def get_setting_value(db: Session, key: str, default: Any = None) -> Any:
     """Get a site setting value by key, returns default if not found"""
-    setting = get_setting(db, key)
-    if setting:
-        return setting.value
-    return default
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None and cached[0] > now:
+        note_cache(hit=True)
+        value = cached[1]
+    else:
+        note_cache(hit=False)
+        value = db.scalar(select(SiteSettings.value).where(SiteSettings.key == key))
+        if value is None:
+            value = _MISSING
+        with _cache_lock:
+            _cache[key] = (now + settings.SITE_SETTINGS_CACHE_TTL_SECONDS, value)
+    return default if value is _MISSING else value
+
+
+def prime_settings_cache(db: Session) -> int:
+    """Load every setting into the cache with one query; returns the number loaded."""
+    rows = db.execute(select(SiteSettings.key, SiteSettings.value)).all()
+    expires_at = time.monotonic() + settings.SITE_SETTINGS_CACHE_TTL_SECONDS
+    with _cache_lock:
+        for key, value in rows:
+            _cache[key] = (expires_at, _MISSING if value is None else value)
+    return len(rows)
+
+
+def _invalidate_on_change(changes: List[ChangeEvent]) -> None:
+    with _cache_lock:
+        for change in changes:
+            if change.entity_type == "site_setting":
+                _cache.pop(change.slug, None)
+
+
+register_change_listener(_invalidate_on_change)
 
 
 def set_setting(db: Session, key: str, value: Dict[str, Any], description: Optional[str] = None) -> SiteSettings:
@@ -30,6 +73,7 @@ def set_setting(db: Session, key: str, value: Dict[str, Any], description: Optio
         setting.value = value
         if description:
             setting.description = description
+        op = ChangeOp.UPDATE
     else:
         setting = SiteSettings(
             key=key,
@@ -37,7 +81,10 @@ def set_setting(db: Session, key: str, value: Dict[str, Any], description: Optio
             description=description
         )
         db.add(setting)
+        db.flush()
+        op = ChangeOp.CREATE
     
+    record_change(db, "site_setting", setting.id, setting.key, op)
     db.commit()
     db.refresh(setting)
     return setting
@@ -8,6 +8,7 @@ from sqlalchemy.exc import IntegrityError
 from app.models.user import User
 from app.models.rbac import UserRole
 from app.models.role import Role
+from app.auth.revocation import revoke_user_tokens
 from app.auth.security import hash_password
 
 
@@ -135,6 +136,7 @@ def update_user(
 ) -> User:
     """Update user and roles."""
     user = get_user_by_id(db, user_id)
+    revoke_tokens = False
     
     # Check email uniqueness if changing
     if "email" in data and data["email"] != user.email:
@@ -153,6 +155,7 @@ def update_user(
     # Update password if provided
     if "password" in data and data["password"]:
         user.password_hash = hash_password(data["password"])
+        revoke_tokens = True
     
     # Update other fields
     if "first_name" in data:
@@ -162,6 +165,7 @@ def update_user(
     if "avatar_url" in data:
         user.avatar_url = data["avatar_url"]
     if "is_active" in data:
+        revoke_tokens = revoke_tokens or data["is_active"] != user.is_active
         user.is_active = data["is_active"]
     if "is_email_verified" in data:
         user.is_email_verified = data["is_email_verified"]
@@ -170,6 +174,11 @@ def update_user(
     
     # Update roles if provided
     if "role_ids" in data and data["role_ids"] is not None:
+        # Tokens carry role claims, so a role change revokes them
+        revoke_tokens = revoke_tokens or (
+            {ur.role_id for ur in user.user_roles} != set(data["role_ids"])
+        )
+        
         # Remove existing roles
         db.query(UserRole).filter(UserRole.user_id == user_id).delete()
         
@@ -190,6 +199,9 @@ def update_user(
                 )
                 db.add(user_role)
     
+    if revoke_tokens:
+        revoke_user_tokens(db, user)
+    
     try:
         db.commit()
         db.refresh(user)
@@ -204,4 +216,5 @@ def delete_user(db: Session, user_id: UUID) -> None:
     """Soft delete user (set is_active=False)."""
     user = get_user_by_id(db, user_id)
     user.is_active = False
+    revoke_user_tokens(db, user)
     db.commit()
@@ -0,0 +1,17 @@
+from sqlalchemy import Select, and_, func
+
+from app.models.view_count import ContentViewCount
+
+SORT_RECENT = "recent"
+SORT_POPULAR = "popular"
+
+
+def order_by_popularity(query: Select, model, entity_type: str) -> Select:
+    """Order a content query by flushed view count, most viewed first."""
+    return query.outerjoin(
+        ContentViewCount,
+        and_(
+            ContentViewCount.entity_type == entity_type,
+            ContentViewCount.entity_id == model.id,
+        ),
+    ).order_by(func.coalesce(ContentViewCount.views, 0).desc(), model.created_at.desc())
@@ -0,0 +1,86 @@
+"""
+Authorization claims carried in access tokens.
+
+At login the user's role names and ``resource:action`` permissions are
+compiled from ``user_roles``/``role_permissions`` into the token, along with
+the user's revocation epoch. Requests are then authorized from the token and
+the in-memory epoch map (``app.auth.revocation``) without loading the user.
+
+Permission checks resolve the token's roles against the live policy matrix
+(``app.auth.policy``), so grant changes apply without logging in again; the
+``perms`` claim tells clients what the user could do when the token was issued.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.auth.policy import policy
+from app.models.permission import Permission
+from app.models.rbac import RolePermission, UserRole
+from app.models.role import Role
+from app.models.user import User
+
+CLAIM_ROLES = "roles"
+CLAIM_PERMISSIONS = "perms"
+CLAIM_EPOCH = "epoch"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller as described by their token."""
+
+    id: UUID
+    roles: FrozenSet[str]
+    permissions: FrozenSet[str]
+    epoch: int
+
+    def has_role(self, *roles: str) -> bool:
+        return any(role in self.roles for role in roles)
+
+    def has_permission(self, resource: str, action: str) -> bool:
+        return policy.allows(self.roles, resource, action)
+
+
+def compile_claims(db: Session, user: User) -> Dict[str, Any]:
+    """Role, permission and epoch claims for a new access token."""
+    rows = db.execute(
+        select(Role.name, Permission.resource, Permission.action)
+        .select_from(UserRole)
+        .join(Role, Role.id == UserRole.role_id)
+        .outerjoin(RolePermission, RolePermission.role_id == Role.id)
+        .outerjoin(Permission, Permission.id == RolePermission.permission_id)
+        .where(UserRole.user_id == user.id)
+    )
+    roles = set()
+    permissions = set()
+    for role, resource, action in rows:
+        roles.add(role)
+        if resource is not None:
+            permissions.add(f"{resource}:{action}")
+    return {
+        CLAIM_ROLES: sorted(roles),
+        CLAIM_PERMISSIONS: sorted(permissions),
+        CLAIM_EPOCH: user.token_epoch or 0,
+    }
+
+
+def principal_from_claims(user_id: UUID, payload: Mapping[str, Any]) -> Optional[Principal]:
+    """Build a principal from token claims, or None for tokens issued without them."""
+    if CLAIM_ROLES not in payload or CLAIM_EPOCH not in payload:
+        return None
+    return Principal(
+        id=user_id,
+        roles=frozenset(payload[CLAIM_ROLES]),
+        permissions=frozenset(payload.get(CLAIM_PERMISSIONS, ())),
+        epoch=int(payload[CLAIM_EPOCH]),
+    )
+
+
+def principal_from_user(db: Session, user: User) -> Principal:
+    """Build a principal from the database, for tokens that carry no claims."""
+    claims = compile_claims(db, user)
+    return principal_from_claims(user.id, claims)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
@@ -6,21 +6,18 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 
+from app.auth.claims import Principal, principal_from_claims, principal_from_user
+from app.auth.revocation import token_epochs
 from app.auth.security import decode_token
+from app.core.request_log import note_user
 from app.db.session import get_db
 from app.models.rbac import UserRole
-from app.models.role import Role
 from app.models.user import User
 
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    token = credentials.credentials
-    
+def _decode_user_id(token: str) -> Tuple[UUID, Dict[str, Any]]:
     try:
         payload = decode_token(token)
         user_id: Optional[str] = payload.get("sub")
@@ -48,6 +45,10 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    return user_uuid, payload
+
+
+def _load_active_user(db: Session, user_uuid: UUID) -> User:
     user = db.scalar(
         select(User)
         .options(joinedload(User.user_roles).joinedload(UserRole.role))
@@ -70,13 +71,72 @@ async def get_current_user(
     return user
 
 
+def _check_epoch(epoch: int, current_epoch: int, is_active: bool) -> None:
+    if not is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user account",
+        )
+    
+    if epoch < current_epoch:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication token has been revoked. Please log in again.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    user_uuid, payload = _decode_user_id(credentials.credentials)
+    user = _load_active_user(db, user_uuid)
+    
+    principal = principal_from_claims(user_uuid, payload)
+    if principal is not None:
+        _check_epoch(principal.epoch, user.token_epoch, user.is_active)
+    
+    return user
+
+
+def resolve_principal(token: str, db: Session) -> Principal:
+    """
+    Authorize a bearer token.
+    
+    Tokens carrying role claims are checked against the in-memory revocation
+    epochs only, without touching the database. Tokens issued before claims
+    existed, or any token while the epoch map is not loaded, fall back to
+    loading the user.
+    """
+    user_uuid, payload = _decode_user_id(token)
+    note_user(user_uuid)
+    principal = principal_from_claims(user_uuid, payload)
+    
+    if principal is not None and token_epochs.loaded:
+        current_epoch, is_active = token_epochs.lookup(user_uuid)
+        _check_epoch(principal.epoch, current_epoch, is_active)
+        return principal
+    
+    user = _load_active_user(db, user_uuid)
+    if principal is not None:
+        _check_epoch(principal.epoch, user.token_epoch, user.is_active)
+        return principal
+    return principal_from_user(db, user)
+
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> Principal:
+    return resolve_principal(credentials.credentials, db)
+
+
 def require_roles(*required_roles: str):
     async def role_checker(
-        current_user: User = Depends(get_current_user)
-    ) -> User:
-        user_role_names = {ur.role.name for ur in current_user.user_roles}
-        
-        if not any(role in user_role_names for role in required_roles):
+        current_user: Principal = Depends(get_current_principal)
+    ) -> Principal:
+        if not current_user.has_role(*required_roles):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Required roles: {', '.join(required_roles)}",
@@ -87,6 +147,22 @@ def require_roles(*required_roles: str):
     return role_checker
 
 
+def require_permission(resource: str, action: str):
+    """Require a ``resource:action`` permission from the compiled policy (``app.auth.policy``)."""
+    async def permission_checker(
+        current_user: Principal = Depends(get_current_principal)
+    ) -> Principal:
+        if not current_user.has_permission(resource, action):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Permission required: {resource}:{action}",
+            )
+        
+        return current_user
+    
+    return permission_checker
+
+
 RequireAdmin = require_roles("admin")
 RequireEditor = require_roles("editor")
 RequireViewer = require_roles("viewer")
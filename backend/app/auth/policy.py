@@ -0,0 +1,246 @@
+"""
+Compiled role/permission policy.
+
+The ``roles`` -> ``role_permissions`` -> ``permissions`` graph is compiled
+into one bit per ``(resource, action)`` and one integer mask per role. The
+mask for a set of roles is computed once and cached, so
+``require_permission`` checks are a dict lookup and a bit test, with no
+queries and no role names in route code.
+
+The matrix is compiled at startup, recompiled after any commit in this
+process that touches roles, permissions or grants, and reloaded every
+``POLICY_REFRESH_SECONDS`` to pick up changes made elsewhere. Role
+membership itself comes from the token (``app.auth.claims``).
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
+from app.db.session import SessionLocal
+from app.models.permission import Permission
+from app.models.rbac import RolePermission
+from app.models.role import Role
+
+logger = logging.getLogger(__name__)
+
+_CHANGED_KEY = "policy_changed"
+
+# Arbitrary application-wide key for pg_advisory_xact_lock.
+POLICY_SEED_LOCK_KEY = 4_180_127_333
+
+CONTENT_RESOURCES = ("page", "service", "blog", "case_study", "job")
+CRUD_ACTIONS = ("create", "read", "update", "delete")
+
+# Seeded into an empty permissions table. "read" on a content resource
+# grants access to drafts and revision history; published items are public.
+DEFAULT_PERMISSIONS: Tuple[Tuple[str, str], ...] = (
+    *((resource, action) for resource in CONTENT_RESOURCES for action in CRUD_ACTIONS),
+    ("site_settings", "update"),
+    ("user", "create"),
+    ("user", "read"),
+    ("user", "update"),
+    ("user", "delete"),
+    ("role", "read"),
+)
+
+DEFAULT_ROLE_GRANTS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "admin": DEFAULT_PERMISSIONS,
+    "editor": (
+        *((resource, action) for resource in CONTENT_RESOURCES for action in CRUD_ACTIONS),
+        ("site_settings", "update"),
+    ),
+    "viewer": tuple((resource, "read") for resource in CONTENT_RESOURCES),
+}
+
+_counters = Counters()
+
+
+class _CompiledPolicy(NamedTuple):
+    bits: Dict[Tuple[str, str], int]
+    role_masks: Dict[str, int]
+    # Memoised masks per distinct set of roles seen in tokens.
+    combined: Dict[FrozenSet[str], int]
+
+
+class PolicyMatrix:
+    """Permission bits per role, swapped atomically on each compile."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._compiled = _CompiledPolicy({}, {}, {})
+        self._loaded = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def compile(self, grants: Iterable[Tuple[str, Optional[str], Optional[str]]]) -> None:
+        """Build the matrix from (role name, resource, action) rows."""
+        bits: Dict[Tuple[str, str], int] = {}
+        role_masks: Dict[str, int] = {}
+        for role, resource, action in grants:
+            mask = role_masks.setdefault(role, 0)
+            if resource is None or action is None:
+                continue
+            bit = bits.setdefault((resource, action), len(bits))
+            role_masks[role] = mask | (1 << bit)
+        self._compiled = _CompiledPolicy(bits, role_masks, {})
+        self._loaded = True
+
+    def allows(self, roles: FrozenSet[str], resource: str, action: str) -> bool:
+        compiled = self._compiled
+        bit = compiled.bits.get((resource, action))
+        if bit is None:
+            return False
+        mask = compiled.combined.get(roles)
+        if mask is None:
+            mask = 0
+            for role in roles:
+                mask |= compiled.role_masks.get(role, 0)
+            with self._lock:
+                compiled.combined[roles] = mask
+        return bool(mask >> bit & 1)
+
+    def reload(self) -> None:
+        """Recompile from the database."""
+        with SessionLocal() as db:
+            rows = db.execute(
+                select(Role.name, Permission.resource, Permission.action)
+                .select_from(Role)
+                .outerjoin(RolePermission, RolePermission.role_id == Role.id)
+                .outerjoin(Permission, Permission.id == RolePermission.permission_id)
+            ).all()
+        self.compile(rows)
+        _counters.inc("compiles")
+
+    def snapshot(self) -> Dict[str, float]:
+        compiled = self._compiled
+        return {
+            "loaded": self._loaded,
+            "permissions": len(compiled.bits),
+            "roles": len(compiled.role_masks),
+            "cached_role_sets": len(compiled.combined),
+            **_counters.snapshot(),
+        }
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="policy")
+        await self._loop.run_in_executor(self._executor, self.reload)
+        self._runner = asyncio.create_task(self._run(), name="policy")
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.POLICY_REFRESH_SECONDS)
+            try:
+                await self._loop.run_in_executor(self._executor, self.reload)
+            except Exception as e:
+                _counters.inc("reload_errors")
+                logger.warning(f"Policy reload failed: {e}")
+
+
+policy = PolicyMatrix()
+
+
+# ============================================================================
+# Change Tracking
+# ============================================================================
+
+_POLICY_MODELS = (Role, Permission, RolePermission)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _mark_policy_changes(session: Session, flush_context) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, _POLICY_MODELS):
+            session.info[_CHANGED_KEY] = True
+            return
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _recompile_after_commit(session: Session) -> None:
+    if session.info.pop(_CHANGED_KEY, False):
+        try:
+            policy.reload()
+        except Exception as e:
+            logger.warning(f"Policy recompile after commit failed: {e}")
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _discard_policy_changes(session: Session, previous_transaction) -> None:
+    if not session.in_transaction():
+        session.info.pop(_CHANGED_KEY, None)
+
+
+# ============================================================================
+# Seeding
+# ============================================================================
+
+def ensure_default_permissions(db: Session) -> int:
+    """
+    Seed default roles, permissions and grants into an empty permissions table.
+
+    Existing permission data is left alone so administrators' edits stick.
+    Every worker runs this at boot; on an empty table the first one seeds
+    under a transaction-level advisory lock while the others wait on it and
+    then find the table populated. The caller commits (releasing the lock).
+
+    Returns:
+        Number of grants created
+    """
+    if db.scalar(select(Permission.id).limit(1)) is not None:
+        return 0
+    db.execute(select(func.pg_advisory_xact_lock(POLICY_SEED_LOCK_KEY)))
+    if db.scalar(select(Permission.id).limit(1)) is not None:
+        return 0
+
+    roles = {role.name: role for role in db.scalars(select(Role))}
+    for name in DEFAULT_ROLE_GRANTS:
+        if name not in roles:
+            roles[name] = Role(name=name, description=f"Built-in {name} role", is_system_role=True)
+            db.add(roles[name])
+
+    permissions = {
+        (resource, action): Permission(
+            name=f"{resource}:{action}",
+            resource=resource,
+            action=action,
+            description=f"{action.capitalize()} {resource.replace('_', ' ')}",
+        )
+        for resource, action in DEFAULT_PERMISSIONS
+    }
+    db.add_all(permissions.values())
+    db.flush()
+
+    granted = 0
+    for name, grants in DEFAULT_ROLE_GRANTS.items():
+        for key in grants:
+            db.add(RolePermission(role_id=roles[name].id, permission_id=permissions[key].id))
+            granted += 1
+    return granted
+
+
+register_metrics_source("policy", policy.snapshot)
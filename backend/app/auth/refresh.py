@@ -0,0 +1,126 @@
+"""
+Rotating refresh tokens.
+
+Login issues a refresh token next to the short-lived access token. The
+client exchanges it at ``/auth/refresh`` for a new pair with one indexed
+lookup instead of repeating the bcrypt password check. Every exchange
+revokes the presented token; presenting a revoked token again means it was
+copied, so its whole family (everything descended from the same login) is
+revoked. Bumping the user's ``token_epoch`` revokes refresh tokens too.
+"""
+
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+_counters = Counters()
+
+
+class InvalidRefreshTokenError(Exception):
+    pass
+
+
+def _hash(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def issue_refresh_token(db: Session, user: User, family_id: Optional[uuid.UUID] = None) -> str:
+    """Add a new refresh token for ``user`` to the session and return its value."""
+    now = datetime.now(timezone.utc)
+    token = secrets.token_urlsafe(32)
+    if family_id is None:
+        # New login: drop this user's expired tokens while we are here.
+        db.execute(
+            delete(RefreshToken).where(
+                RefreshToken.user_id == user.id,
+                RefreshToken.expires_at < now,
+            )
+        )
+    db.add(
+        RefreshToken(
+            token_hash=_hash(token),
+            user_id=user.id,
+            family_id=family_id or uuid.uuid4(),
+            token_epoch=user.token_epoch or 0,
+            expires_at=now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    _counters.inc("issued")
+    return token
+
+
+def _revoke_family(db: Session, family_id: uuid.UUID) -> None:
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+
+
+def rotate_refresh_token(db: Session, token: str) -> Tuple[User, str]:
+    """
+    Exchange a refresh token for its successor. The caller commits.
+
+    Returns:
+        The token's user and the new refresh token
+
+    Raises:
+        InvalidRefreshTokenError: Unknown, expired, revoked or reused token,
+            or the user is inactive. Reuse revokes the family, which is
+            committed before raising.
+    """
+    now = datetime.now(timezone.utc)
+    row = db.scalar(
+        select(RefreshToken)
+        .where(RefreshToken.token_hash == _hash(token))
+        .with_for_update()
+    )
+    if row is None:
+        _counters.inc("rejected")
+        raise InvalidRefreshTokenError("Invalid refresh token")
+
+    if row.revoked_at is not None:
+        _revoke_family(db, row.family_id)
+        db.commit()
+        _counters.inc("reuse_detected")
+        raise InvalidRefreshTokenError("Refresh token has already been used")
+
+    user = db.get(User, row.user_id)
+    if (
+        row.expires_at <= now
+        or user is None
+        or not user.is_active
+        or row.token_epoch < (user.token_epoch or 0)
+    ):
+        _counters.inc("rejected")
+        raise InvalidRefreshTokenError("Refresh token has expired or been revoked")
+
+    row.revoked_at = now
+    new_token = issue_refresh_token(db, user, family_id=row.family_id)
+    _counters.inc("rotated")
+    return user, new_token
+
+
+def revoke_refresh_token(db: Session, token: str) -> bool:
+    """Revoke the family of a refresh token (logout). The caller commits."""
+    family_id = db.scalar(
+        select(RefreshToken.family_id).where(RefreshToken.token_hash == _hash(token))
+    )
+    if family_id is None:
+        return False
+    _revoke_family(db, family_id)
+    _counters.inc("logouts")
+    return True
+
+
+register_metrics_source("refresh_tokens", _counters.snapshot)
@@ -0,0 +1,169 @@
+"""
+Per-user access token revocation.
+
+Access tokens record the user's ``token_epoch`` at login. Bumping the epoch
+with ``revoke_user_tokens`` (deactivation, role or password changes) rejects
+every token issued before it.
+
+Each process keeps a map of only the users that can reject a token: those
+with a non-zero epoch or an inactive account. It is reloaded every
+``TOKEN_EPOCH_REFRESH_SECONDS``; revocations committed in this process apply
+immediately, other processes pick them up on their next reload.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
+from app.db.session import SessionLocal
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_token_revocations"
+
+# user id -> (epoch, is_active)
+EpochEntry = Tuple[int, bool]
+
+# Reloads that may fail in a row before the map stops being trusted and
+# requests fall back to loading the user from the database.
+_MAX_MISSED_RELOADS = 3
+
+_counters = Counters()
+
+
+class TokenEpochMap:
+    """In-memory copy of the users whose tokens may be revoked."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[UUID, EpochEntry] = {}
+        self._noted: Dict[UUID, EpochEntry] = {}
+        self._loaded_at: Optional[float] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def loaded(self) -> bool:
+        """True while the map is recent enough to authorize requests on its own."""
+        if self._loaded_at is None:
+            return False
+        max_age = settings.TOKEN_EPOCH_REFRESH_SECONDS * _MAX_MISSED_RELOADS
+        return time.monotonic() - self._loaded_at < max_age
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def lookup(self, user_id: UUID) -> EpochEntry:
+        """Current (epoch, is_active) for a user; unlisted users are (0, True)."""
+        with self._lock:
+            return self._entries.get(user_id, (0, True))
+
+    def note(self, user_id: UUID, epoch: int, is_active: bool) -> None:
+        """Apply a committed revocation without waiting for the next reload."""
+        with self._lock:
+            self._entries[user_id] = (epoch, is_active)
+            self._noted[user_id] = (epoch, is_active)
+
+    def reload(self) -> int:
+        """
+        Replace the map with the current database state.
+
+        Returns:
+            Number of users in the map
+        """
+        started = time.monotonic()
+        with self._lock:
+            self._noted = {}
+        with SessionLocal() as db:
+            rows = db.execute(
+                select(User.id, User.token_epoch, User.is_active).where(
+                    or_(User.token_epoch > 0, User.is_active == False)
+                )
+            ).all()
+        entries = {user_id: (epoch, is_active) for user_id, epoch, is_active in rows}
+        with self._lock:
+            # Revocations noted while the query ran may be newer than what it saw.
+            for user_id, (epoch, is_active) in self._noted.items():
+                if epoch >= entries.get(user_id, (0, True))[0]:
+                    entries[user_id] = (epoch, is_active)
+            self._entries = entries
+            self._loaded_at = started
+        _counters.inc("reloads")
+        return len(entries)
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="token-epochs")
+        try:
+            await self._loop.run_in_executor(self._executor, self.reload)
+        except Exception as e:
+            logger.warning(f"Initial token epoch load failed: {e}")
+        self._runner = asyncio.create_task(self._run(), name="token-epochs")
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.TOKEN_EPOCH_REFRESH_SECONDS)
+            try:
+                await self._loop.run_in_executor(self._executor, self.reload)
+            except Exception as e:
+                _counters.inc("reload_errors")
+                logger.warning(f"Token epoch reload failed: {e}")
+
+
+token_epochs = TokenEpochMap()
+
+
+def revoke_user_tokens(db: Session, user: User) -> None:
+    """
+    Invalidate every access token issued to ``user`` so far.
+
+    Call after the user's other changes (including ``is_active``) have been
+    applied; the bump commits with the caller's transaction.
+    """
+    user.token_epoch = (user.token_epoch or 0) + 1
+    db.info.setdefault(_PENDING_KEY, []).append((user.id, user.token_epoch, user.is_active))
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _apply_committed_revocations(session: Session) -> None:
+    revocations: Optional[List[Tuple[UUID, int, bool]]] = session.info.pop(_PENDING_KEY, None)
+    for user_id, epoch, is_active in revocations or ():
+        token_epochs.note(user_id, epoch, is_active)
+        _counters.inc("revoked")
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _discard_pending_revocations(session: Session, previous_transaction) -> None:
+    if not session.in_transaction():
+        session.info.pop(_PENDING_KEY, None)
+
+
+register_metrics_source(
+    "token_epochs",
+    lambda: {"loaded": token_epochs.loaded, "tracked_users": token_epochs.size, **_counters.snapshot()},
+)
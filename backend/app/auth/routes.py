@@ -1,11 +1,19 @@
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 
-from app.auth.schemas import LoginResponse, Token, UserLogin, UserOut
+from app.auth.claims import compile_claims
+from app.auth.refresh import (
+    InvalidRefreshTokenError,
+    issue_refresh_token,
+    revoke_refresh_token,
+    rotate_refresh_token,
+)
+from app.auth.schemas import LoginResponse, RefreshRequest, Token, TokenPair, UserLogin, UserOut
 from app.auth.security import create_access_token, verify_password
+from app.auth.throttle import client_ip, login_throttle
 from app.db.session import get_db
 from app.models.rbac import UserRole
 from app.models.user import User
@@ -16,8 +24,18 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
 async def login(
     credentials: UserLogin,
+    request: Request,
     db: Session = Depends(get_db)
 ):
+    # Reject over-limit attempts before any database or bcrypt work
+    retry_after = login_throttle.acquire(client_ip(request), credentials.email)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Please try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+    
     user = db.scalar(
         select(User)
         .options(joinedload(User.user_roles).joinedload(UserRole.role))
@@ -42,13 +60,55 @@ async def login(
             detail="Incorrect email or password",
         )
     
+    login_throttle.succeeded(credentials.email)
     user.last_login_at = datetime.now(timezone.utc)
+    refresh_token = issue_refresh_token(db, user)
     db.commit()
     
-    access_token = create_access_token(data={"sub": str(user.id)})
+    access_token = create_access_token(
+        data={"sub": str(user.id), **compile_claims(db, user)}
+    )
     
     return LoginResponse(
         access_token=access_token,
+        refresh_token=refresh_token,
         token_type="bearer",
         user=UserOut.model_validate(user)
     )
+
+
+@router.post("/refresh", response_model=TokenPair, status_code=status.HTTP_200_OK)
+async def refresh(
+    data: RefreshRequest,
+    db: Session = Depends(get_db)
+):
+    """Exchange a refresh token for a new access/refresh token pair."""
+    try:
+        user, refresh_token = rotate_refresh_token(db, data.refresh_token)
+    except InvalidRefreshTokenError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+        )
+    
+    access_token = create_access_token(
+        data={"sub": str(user.id), **compile_claims(db, user)}
+    )
+    db.commit()
+    
+    return TokenPair(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer"
+    )
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    data: RefreshRequest,
+    db: Session = Depends(get_db)
+):
+    """Revoke a refresh token and every token rotated from the same login."""
+    revoke_refresh_token(db, data.refresh_token)
+    db.commit()
@@ -15,6 +15,14 @@ class Token(BaseModel):
     token_type: str = "bearer"
 
 
+class TokenPair(Token):
+    refresh_token: str
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
 class TokenPayload(BaseModel):
     sub: str
     exp: datetime
@@ -41,5 +49,6 @@ class UserOut(BaseModel):
 
 class LoginResponse(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str = "bearer"
     user: UserOut
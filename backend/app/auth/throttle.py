@@ -0,0 +1,145 @@
+"""
+Login attempt throttling.
+
+Each client IP and each account (normalised email) is limited with GCRA, the
+generic cell rate algorithm: a key stores a single "theoretical arrival time"
+float, which is equivalent to a sliding window of ``limit`` attempts per
+``window`` seconds with a burst of up to ``limit``. Attempts are checked
+before the user lookup and bcrypt verification, so a credential-stuffing
+burst is rejected at the cost of a dict lookup.
+
+State is per worker process, so with N workers a key can make up to N times
+the configured attempts; the limits are sized with that in mind.
+
+Behind a reverse proxy the peer address is the proxy's, which would put every
+client in one bucket. ``client_ip`` instead takes the address the last
+``TRUSTED_PROXY_HOPS`` proxies recorded in ``X-Forwarded-For``; entries left
+of those are client-supplied and ignored.
+"""
+
+import math
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
+
+_counters = Counters()
+
+
+def client_ip(request: Request) -> Optional[str]:
+    """The client address as seen by the outermost trusted proxy."""
+    peer = request.client.host if request.client else None
+    hops = settings.TRUSTED_PROXY_HOPS
+    if not hops:
+        return peer
+    forwarded = [
+        entry.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for entry in header.split(",")
+        if entry.strip()
+    ]
+    if not forwarded:
+        return peer
+    # Each trusted proxy appends the address it received the request from.
+    return forwarded[-hops] if len(forwarded) >= hops else forwarded[0]
+
+
+class GcraLimiter:
+    """Per-key GCRA limiter allowing ``limit`` events per ``window`` seconds."""
+
+    def __init__(self, limit: int, window: float, max_keys: int) -> None:
+        self.interval = window / limit
+        self.tolerance = window - self.interval
+        self.max_keys = max_keys
+        self._tat: Dict[str, float] = {}
+
+    def check(self, key: str, now: float) -> Tuple[Optional[float], float]:
+        """
+        Evaluate one event for ``key`` without recording it.
+
+        Returns:
+            (retry_after, new_tat): retry_after is None when the event is allowed
+        """
+        tat = max(self._tat.get(key, now), now)
+        if tat - now > self.tolerance:
+            return tat - now - self.tolerance, tat
+        return None, tat + self.interval
+
+    def commit(self, key: str, tat: float, now: float) -> None:
+        if len(self._tat) >= self.max_keys and key not in self._tat:
+            self._prune(now)
+        self._tat[key] = tat
+
+    def reset(self, key: str) -> None:
+        self._tat.pop(key, None)
+
+    def _prune(self, now: float) -> None:
+        # Keys whose arrival time has passed are back to a full burst and can go.
+        expired = [key for key, tat in self._tat.items() if tat <= now]
+        for key in expired:
+            del self._tat[key]
+        if len(self._tat) >= self.max_keys:
+            # Still full of active keys: forget the ones closest to recovery.
+            keep = sorted(self._tat.items(), key=lambda item: item[1])[len(self._tat) // 2:]
+            self._tat = dict(keep)
+            _counters.inc("evictions")
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+
+class LoginThrottle:
+    """Combined per-IP and per-account login limiter."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_ip = GcraLimiter(
+            settings.LOGIN_ATTEMPTS_PER_IP,
+            settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+            settings.LOGIN_THROTTLE_MAX_KEYS,
+        )
+        self._by_account = GcraLimiter(
+            settings.LOGIN_ATTEMPTS_PER_ACCOUNT,
+            settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+            settings.LOGIN_THROTTLE_MAX_KEYS,
+        )
+
+    def acquire(self, ip: Optional[str], email: str) -> Optional[int]:
+        """
+        Record a login attempt if both limits allow it.
+
+        Returns:
+            None if allowed, otherwise the number of seconds to wait
+        """
+        account = email.strip().lower()
+        now = time.monotonic()
+        with self._lock:
+            ip_retry, ip_tat = self._by_ip.check(ip, now) if ip else (None, 0.0)
+            account_retry, account_tat = self._by_account.check(account, now)
+            if ip_retry is None and account_retry is None:
+                if ip:
+                    self._by_ip.commit(ip, ip_tat, now)
+                self._by_account.commit(account, account_tat, now)
+                _counters.inc("allowed")
+                return None
+        _counters.inc("rejected_ip" if ip_retry is not None else "rejected_account")
+        return max(1, math.ceil(max(ip_retry or 0, account_retry or 0)))
+
+    def succeeded(self, email: str) -> None:
+        """Clear the account's failure budget after a successful login."""
+        with self._lock:
+            self._by_account.reset(email.strip().lower())
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            tracked = {"tracked_ips": len(self._by_ip), "tracked_accounts": len(self._by_account)}
+        return {**tracked, **_counters.snapshot()}
+
+
+login_throttle = LoginThrottle()
+
+register_metrics_source("login_throttle", login_throttle.snapshot)
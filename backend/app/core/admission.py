@@ -0,0 +1,183 @@
+"""
+Admission control.
+
+Requests are sorted into route classes (public reads, admin writes, auth),
+each with its own concurrency limit and a bounded FIFO queue. A request that
+finds its class full waits in the queue for at most
+``ADMISSION_QUEUE_TIMEOUT_SECONDS``; if the queue is full or the wait runs
+out it gets ``503`` with ``Retry-After`` straight away instead of piling up
+on the connection pool. Because the classes are separate, a login storm or
+a bulk editor import cannot use up the slots that serve public pages.
+
+Health checks and change-feed long polls (which hold no connection while
+waiting) are not limited. All state lives on the event loop, so no locking
+is needed; limits are per worker process.
+"""
+
+import asyncio
+import json
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+
+CLASS_PUBLIC_READ = "public_read"
+CLASS_ADMIN_WRITE = "admin_write"
+CLASS_AUTH = "auth"
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_UNLIMITED_PREFIXES = ("/health", "/cms/changes")
+
+
+def classify_request(method: str, path: str) -> Optional[str]:
+    """Route class for a request, or None if it is not limited."""
+    if path.startswith(_UNLIMITED_PREFIXES):
+        return None
+    if path.startswith("/auth"):
+        return CLASS_AUTH
+    if method not in _READ_METHODS:
+        return CLASS_ADMIN_WRITE
+    return CLASS_PUBLIC_READ
+
+
+class _Gate:
+    """Concurrency limit with a bounded FIFO wait queue."""
+
+    def __init__(self, limit: int, max_queue: int) -> None:
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.stats: Dict[str, int] = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected_queue_full": 0,
+            "rejected_timeout": 0,
+            "max_queue_depth": 0,
+        }
+
+    async def acquire(self, timeout: float) -> bool:
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            self.stats["admitted"] += 1
+            return True
+        if len(self.waiters) >= self.max_queue:
+            self.stats["rejected_queue_full"] += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        self.stats["queued"] += 1
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], len(self.waiters))
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # Handed a slot just as the wait expired; give it back.
+                self.release()
+            else:
+                waiter.cancel()
+                self._discard(waiter)
+            self.stats["rejected_timeout"] += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                waiter.cancel()
+                self._discard(waiter)
+            raise
+        self.stats["admitted"] += 1
+        return True
+
+    def release(self) -> None:
+        # Hand the slot directly to the oldest live waiter, if any.
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self.waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def snapshot(self) -> Dict[str, int]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queue_depth": len(self.waiters),
+            **self.stats,
+        }
+
+
+_gates: Dict[str, _Gate] = {}
+
+
+def _build_gates() -> Dict[str, _Gate]:
+    return {
+        CLASS_PUBLIC_READ: _Gate(
+            settings.ADMISSION_PUBLIC_READ_CONCURRENCY, settings.ADMISSION_PUBLIC_READ_QUEUE
+        ),
+        CLASS_ADMIN_WRITE: _Gate(
+            settings.ADMISSION_ADMIN_WRITE_CONCURRENCY, settings.ADMISSION_ADMIN_WRITE_QUEUE
+        ),
+        CLASS_AUTH: _Gate(settings.ADMISSION_AUTH_CONCURRENCY, settings.ADMISSION_AUTH_QUEUE),
+    }
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware enforcing per-route-class concurrency limits."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        if not _gates:
+            _gates.update(_build_gates())
+        self.gates = _gates
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify_request(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        gate = self.gates[route_class]
+        if not await gate.acquire(settings.ADMISSION_QUEUE_TIMEOUT_SECONDS):
+            await _reject(send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release()
+
+
+async def _reject(send: Send) -> None:
+    body = json.dumps({"detail": "Server is busy. Please retry shortly."}).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"retry-after", str(settings.ADMISSION_RETRY_AFTER_SECONDS).encode("ascii")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+register_metrics_source(
+    "admission",
+    lambda: {name: gate.snapshot() for name, gate in _gates.items()},
+)
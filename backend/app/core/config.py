@@ -8,7 +8,7 @@ This module handles all application configuration with:
 - Security best practices
 """
 
-from typing import Annotated, List, Optional, Union
+from typing import Annotated, Dict, List, Optional, Union
 from functools import lru_cache
 
 from pydantic import Field, PostgresDsn, field_validator
@@ -96,6 +96,12 @@ class Settings(BaseSettings):
         description="Echo SQL queries (useful for debugging)"
     )
     
+    SCHEMA_LOCK_WAIT_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description="Longest a booting worker waits for another process applying schema DDL"
+    )
+    
     # ============================================================================
     # CORS Settings
     # ============================================================================
@@ -139,6 +145,462 @@ class Settings(BaseSettings):
         description="API version"
     )
     
+    # ============================================================================
+    # Change Feed Settings
+    # ============================================================================
+    
+    CHANGE_FEED_MAX_WAIT_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        le=120,
+        description="Upper bound for the long-poll wait on /cms/changes"
+    )
+    
+    CHANGE_FEED_POLL_SECONDS: float = Field(
+        default=1.0,
+        gt=0,
+        description="Re-check interval while long-polling (picks up writes from other workers)"
+    )
+    
+    # ============================================================================
+    # Background Task Queue Settings
+    # ============================================================================
+    
+    TASK_WORKERS_ENABLED: bool = Field(
+        default=True,
+        description="Run background task workers inside each API process"
+    )
+    
+    TASK_WORKER_CONCURRENCY: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        description="Number of task worker coroutines per process"
+    )
+    
+    TASK_POLL_INTERVAL_SECONDS: float = Field(
+        default=5.0,
+        gt=0,
+        description="Idle poll interval for tasks enqueued by other processes"
+    )
+    
+    TASK_MAX_ATTEMPTS: int = Field(
+        default=5,
+        ge=1,
+        description="Default maximum attempts before a task is marked failed"
+    )
+    
+    TASK_RETRY_BACKOFF_SECONDS: float = Field(
+        default=2.0,
+        gt=0,
+        description="Base delay for exponential retry backoff"
+    )
+    
+    TASK_RETRY_BACKOFF_MAX_SECONDS: float = Field(
+        default=600.0,
+        gt=0,
+        description="Upper bound for retry backoff"
+    )
+    
+    TASK_LOCK_TIMEOUT_SECONDS: int = Field(
+        default=300,
+        ge=10,
+        description="Running tasks locked longer than this are returned to the queue"
+    )
+    
+    # ============================================================================
+    # Scheduled Publishing Settings
+    # ============================================================================
+    
+    SCHEDULER_ENABLED: bool = Field(
+        default=True,
+        description="Run the scheduled-publishing timer in each API process"
+    )
+    
+    SCHEDULER_RESYNC_SECONDS: int = Field(
+        default=900,
+        ge=60,
+        description="Interval for reloading the whole schedule (drops items cancelled by other processes)"
+    )
+    
+    SCHEDULER_POLL_SECONDS: float = Field(
+        default=5.0,
+        ge=1,
+        description="Interval for picking up items about to fall due that were scheduled by other processes"
+    )
+    
+    SCHEDULER_RETRY_SECONDS: int = Field(
+        default=30,
+        ge=1,
+        description="Delay before retrying a scheduled publish that failed"
+    )
+    
+    # ============================================================================
+    # View Counter Settings
+    # ============================================================================
+    
+    VIEW_COUNTER_FLUSH_SECONDS: float = Field(
+        default=10.0,
+        gt=0,
+        description="Interval for flushing buffered view counts to the database"
+    )
+    
+    VIEW_COUNTER_MAX_PENDING: int = Field(
+        default=10000,
+        ge=1,
+        description="Flush early once this many distinct items have buffered views"
+    )
+    
+    VIEW_COUNTER_MAX_BACKOFF_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="Longest wait between retries while view count flushes keep failing"
+    )
+    
+    # ============================================================================
+    # Sitemap & Feed Settings
+    # ============================================================================
+    
+    PUBLIC_SITE_URL: str = Field(
+        default="http://localhost:3000",
+        description="Public base URL of the website, used for sitemap and feed links"
+    )
+    
+    FEED_MAX_ITEMS: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="Number of most recent posts included in /feeds/blogs.xml"
+    )
+    
+    # ============================================================================
+    # Related Content Settings
+    # ============================================================================
+    
+    RELATED_CONTENT_TOP_K: int = Field(
+        default=6,
+        ge=1,
+        le=50,
+        description="Number of related items stored per blog, case study and service"
+    )
+    
+    RELATED_REFRESH_DELAY_SECONDS: float = Field(
+        default=10.0,
+        ge=0,
+        description="Delay before recomputing related content after a publish (coalesces bursts)"
+    )
+    
+    # ============================================================================
+    # Facet Settings
+    # ============================================================================
+    
+    FACET_CACHE_TTL_SECONDS: float = Field(
+        default=60.0,
+        ge=0,
+        description="Lifetime of the in-process facet count cache"
+    )
+    
+    # ============================================================================
+    # Revision History Settings
+    # ============================================================================
+    
+    REVISION_KEYFRAME_INTERVAL: int = Field(
+        default=32,
+        ge=1,
+        le=1024,
+        description="Revisions per run; each run starts with a full snapshot"
+    )
+    
+    REVISION_COMPRESSION_LEVEL: int = Field(
+        default=3,
+        ge=1,
+        le=19,
+        description="zstd compression level for stored revisions (capped at 9 for zlib)"
+    )
+    
+    # ============================================================================
+    # Soft-Delete Archival
+    # ============================================================================
+    
+    ARCHIVE_ENABLED: bool = Field(
+        default=True,
+        description="Periodically move soft-deleted content into content_archive"
+    )
+    
+    ARCHIVE_RETENTION_DAYS: float = Field(
+        default=30.0,
+        ge=0,
+        description="Days a soft-deleted item stays in its hot table before it is archived"
+    )
+    
+    ARCHIVE_BATCH_SIZE: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Rows moved per archival transaction"
+    )
+    
+    ARCHIVE_MAX_BATCHES_PER_RUN: int = Field(
+        default=20,
+        ge=1,
+        description="Batches per content type in one archival run; the rest waits for the next run"
+    )
+    
+    ARCHIVE_INTERVAL_SECONDS: float = Field(
+        default=3600.0,
+        ge=1,
+        description="Delay between archival runs"
+    )
+    
+    # ============================================================================
+    # Token Revocation and Authorization Policy
+    # ============================================================================
+    
+    TOKEN_EPOCH_REFRESH_SECONDS: float = Field(
+        default=5.0,
+        gt=0,
+        description="How often each process reloads per-user token revocation epochs"
+    )
+    
+    POLICY_REFRESH_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="How often each process recompiles the role/permission policy"
+    )
+    
+    # ============================================================================
+    # Login Throttling
+    # ============================================================================
+    
+    LOGIN_THROTTLE_WINDOW_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="Sliding window for login attempt limits"
+    )
+    
+    LOGIN_ATTEMPTS_PER_IP: int = Field(
+        default=50,
+        ge=1,
+        description="Login attempts allowed per client IP per window (per worker)"
+    )
+    
+    LOGIN_ATTEMPTS_PER_ACCOUNT: int = Field(
+        default=10,
+        ge=1,
+        description="Login attempts allowed per email address per window (per worker)"
+    )
+    
+    LOGIN_THROTTLE_MAX_KEYS: int = Field(
+        default=100000,
+        ge=1000,
+        description="Upper bound on tracked IPs and accounts per limiter"
+    )
+    
+    TRUSTED_PROXY_HOPS: int = Field(
+        default=0,
+        ge=0,
+        description="Reverse proxies in front of the app that append to X-Forwarded-For "
+                    "(1 on Render); the client IP is read that many entries from the right"
+    )
+    
+    # ============================================================================
+    # Admission Control
+    # ============================================================================
+    
+    ADMISSION_ENABLED: bool = Field(
+        default=True,
+        description="Limit concurrent requests per route class and shed excess load with 503"
+    )
+    
+    ADMISSION_PUBLIC_READ_CONCURRENCY: int = Field(
+        default=32,
+        ge=1,
+        description="Concurrent public read requests per worker"
+    )
+    
+    ADMISSION_PUBLIC_READ_QUEUE: int = Field(
+        default=128,
+        ge=0,
+        description="Public read requests allowed to wait for a slot per worker"
+    )
+    
+    ADMISSION_ADMIN_WRITE_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        description="Concurrent write requests per worker"
+    )
+    
+    ADMISSION_ADMIN_WRITE_QUEUE: int = Field(
+        default=32,
+        ge=0,
+        description="Write requests allowed to wait for a slot per worker"
+    )
+    
+    ADMISSION_AUTH_CONCURRENCY: int = Field(
+        default=2,
+        ge=1,
+        description="Concurrent /auth requests per worker (each login runs bcrypt)"
+    )
+    
+    ADMISSION_AUTH_QUEUE: int = Field(
+        default=16,
+        ge=0,
+        description="/auth requests allowed to wait for a slot per worker"
+    )
+    
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = Field(
+        default=2.0,
+        gt=0,
+        description="Longest a request waits for a slot before getting 503"
+    )
+    
+    ADMISSION_RETRY_AFTER_SECONDS: int = Field(
+        default=1,
+        ge=1,
+        description="Retry-After value sent with 503 responses"
+    )
+    
+    # ============================================================================
+    # Request Deadlines
+    # ============================================================================
+    
+    REQUEST_DEADLINE_SECONDS: float = Field(
+        default=10.0,
+        ge=0,
+        description="Default time budget per request, enforced as statement_timeout (0 disables)"
+    )
+    
+    REQUEST_DEADLINE_OVERRIDES: Dict[str, float] = Field(
+        default={
+            "/health": 0,
+            "/cms/changes": 0,
+            "/auth": 5.0,
+            "/sitemap": 60.0,
+            "/feeds": 60.0,
+        },
+        description="Per-route budgets keyed by path prefix (longest match wins; 0 disables)"
+    )
+    
+    # ============================================================================
+    # Site Settings Cache
+    # ============================================================================
+    
+    SITE_SETTINGS_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description="How long a process serves cached site settings before re-reading them"
+    )
+    
+    # ============================================================================
+    # Startup Warm-up
+    # ============================================================================
+    
+    WARMUP_ENABLED: bool = Field(
+        default=True,
+        description="Prime caches and hot queries before a worker starts serving"
+    )
+    
+    WARMUP_BUDGET_SECONDS: float = Field(
+        default=5.0,
+        gt=0,
+        description="Time limit for the whole warm-up; remaining steps are skipped after it"
+    )
+    
+    WARMUP_TOP_ITEMS: int = Field(
+        default=20,
+        ge=0,
+        description="Most-viewed published items per content type loaded during warm-up"
+    )
+    
+    # ============================================================================
+    # Server (run.py)
+    # ============================================================================
+    
+    SERVER_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        description="Worker processes (0 = one per available CPU, up to SERVER_MAX_WORKERS; each has its own DB pool)"
+    )
+    
+    SERVER_MAX_WORKERS: int = Field(
+        default=4,
+        ge=1,
+        description="Cap on the automatic worker count (host core counts can exceed the instance's CPU quota)"
+    )
+    
+    SERVER_LOOP: str = Field(
+        default="auto",
+        description="Event loop implementation (auto, uvloop, asyncio)"
+    )
+    
+    SERVER_HTTP: str = Field(
+        default="auto",
+        description="HTTP parser implementation (auto, httptools, h11)"
+    )
+    
+    SERVER_PRELOAD_APP: bool = Field(
+        default=True,
+        description="Import and warm the app in the master so workers share it copy-on-write"
+    )
+    
+    SERVER_MAX_REQUESTS: int = Field(
+        default=10000,
+        ge=0,
+        description="Recycle a worker after this many requests (0 disables)"
+    )
+    
+    SERVER_MAX_REQUESTS_JITTER: int = Field(
+        default=1000,
+        ge=0,
+        description="Random extra requests per worker so workers do not recycle together"
+    )
+    
+    SERVER_TIMEOUT_SECONDS: int = Field(
+        default=60,
+        ge=1,
+        description="Restart a worker that has not checked in with the master for this long"
+    )
+    
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = Field(
+        default=30,
+        ge=1,
+        description="Time a recycled or reloaded worker gets to finish in-flight requests"
+    )
+    
+    SERVER_KEEPALIVE_SECONDS: int = Field(
+        default=5,
+        ge=0,
+        description="Idle keep-alive timeout for client connections"
+    )
+    
+    # ============================================================================
+    # Request Summaries
+    # ============================================================================
+    
+    REQUEST_LOG_ENABLED: bool = Field(
+        default=True,
+        description="Log a one-line summary per request (slow and 5xx always, others sampled)"
+    )
+    
+    REQUEST_LOG_SLOW_MS: float = Field(
+        default=500.0,
+        ge=0,
+        description="Requests at least this slow are always logged and kept as outliers"
+    )
+    
+    REQUEST_LOG_SAMPLE_RATE: float = Field(
+        default=0.01,
+        ge=0,
+        le=1,
+        description="Fraction of fast, successful requests that get a summary line"
+    )
+    
+    REQUEST_LOG_SLOWEST_KEPT: int = Field(
+        default=20,
+        ge=0,
+        description="Slowest request summaries kept per process for /health/metrics"
+    )
+    
     # ============================================================================
     # Logging Settings
     # ============================================================================
@@ -153,6 +615,17 @@ class Settings(BaseSettings):
         description="Log format (json, text)"
     )
     
+    LOG_QUEUE_SIZE: int = Field(
+        default=10000,
+        ge=1,
+        description="Records buffered for the log writer thread; overflow is dropped and counted"
+    )
+    
+    LOG_SAMPLE_RATES: Dict[str, float] = Field(
+        default={"uvicorn.access": 0.1},
+        description="Fraction of below-WARNING records kept per logger name prefix"
+    )
+    
     # ============================================================================
     # Validation & Configuration
     # ============================================================================
@@ -200,6 +673,18 @@ class Settings(BaseSettings):
             return [item.strip() for item in v.split(",") if item.strip()]
         return []
     
+    @field_validator("SERVER_LOOP", "SERVER_HTTP")
+    @classmethod
+    def validate_server_impl(cls, v: str, info) -> str:
+        """Validate event loop / HTTP parser choice."""
+        allowed = {
+            "SERVER_LOOP": {"auto", "uvloop", "asyncio"},
+            "SERVER_HTTP": {"auto", "httptools", "h11"},
+        }[info.field_name]
+        if v.lower() not in allowed:
+            raise ValueError(f"{info.field_name} must be one of {allowed}")
+        return v.lower()
+    
     @field_validator("LOG_LEVEL")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -0,0 +1,114 @@
+"""
+Per-request deadlines.
+
+``DeadlineMiddleware`` gives every request a time budget
+(``REQUEST_DEADLINE_SECONDS``, or the longest matching prefix in
+``REQUEST_DEADLINE_OVERRIDES``) and stores the absolute deadline in a
+context variable. Each database transaction opened while handling the
+request starts with ``SET LOCAL statement_timeout`` set to the time left, so
+Postgres cancels a runaway query instead of letting it hold a pooled
+connection after the client has given up.
+
+A cancelled statement, or a transaction started after the deadline has
+already passed, raises ``DeadlineExceededError``, which the application
+turns into ``504``. Work outside a request (startup, background tasks) has
+no deadline unless it opts in with ``deadline_scope``.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, SessionTransaction
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
+from app.db.session import SessionLocal, engine
+
+# SQLSTATE for "canceling statement due to statement timeout"
+_QUERY_CANCELED = "57014"
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+_counters = Counters()
+
+
+class DeadlineExceededError(Exception):
+    pass
+
+
+def deadline_for_path(path: str) -> float:
+    """Budget in seconds for a request path (0 means no deadline)."""
+    budget = settings.REQUEST_DEADLINE_SECONDS
+    matched = -1
+    for prefix, seconds in settings.REQUEST_DEADLINE_OVERRIDES.items():
+        if path.startswith(prefix) and len(prefix) > matched:
+            budget, matched = seconds, len(prefix)
+    return budget
+
+
+def remaining_seconds() -> Optional[float]:
+    """Time left before the current request's deadline, or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[None]:
+    """Apply a deadline to database work done outside a request (e.g. warm-up)."""
+    token = _deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+class DeadlineMiddleware:
+    """ASGI middleware that starts each request's deadline clock."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = deadline_for_path(scope["path"])
+        token = _deadline.set(time.monotonic() + budget if budget > 0 else None)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _deadline.reset(token)
+
+
+@event.listens_for(SessionLocal, "after_begin")
+def _apply_statement_timeout(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    remaining = remaining_seconds()
+    if remaining is None:
+        return
+    if remaining <= 0:
+        _counters.inc("expired_before_query")
+        raise DeadlineExceededError("Request deadline exceeded")
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {max(1, int(remaining * 1000))}")
+
+
+@event.listens_for(engine, "handle_error")
+def _translate_statement_timeout(context) -> Optional[Exception]:
+    if _deadline.get() is None:
+        return None
+    if getattr(context.original_exception, "pgcode", None) != _QUERY_CANCELED:
+        return None
+    _counters.inc("statement_timeouts")
+    return DeadlineExceededError("Request deadline exceeded while waiting for the database")
+
+
+register_metrics_source("deadlines", _counters.snapshot)
@@ -2,19 +2,32 @@
 FastAPI startup and shutdown event handlers.
 
 Handles:
-- Database connectivity checks on startup
+- Database connectivity and schema fingerprint checks on startup
+- Cache and query warm-up before serving
+- Cold-start timing (logged and exposed under the "startup" metrics source)
 - Application lifecycle logging
+- Background task worker, soft-delete archival, publish scheduler, view counter, token epoch and policy lifecycle
 - Fail-fast behavior if critical services are unavailable
 """
 
 import logging
+import os
 import sys
+import time
+from typing import Any, Dict
 
 from fastapi import FastAPI
+from sqlalchemy.exc import OperationalError
 
+from app.auth.policy import ensure_default_permissions, policy
+from app.auth.revocation import token_epochs
 from app.core.config import settings
-from app.db.base import Base
-from app.db.session import check_db_connection, engine, get_db_stats
+from app.core.metrics import register_metrics_source
+from app.core.scheduler import publish_scheduler
+from app.core.tasks import start_task_workers, stop_task_workers
+from app.core.view_counts import view_counter
+from app.db.schema_sync import ensure_schema
+from app.db.session import describe_db_error, engine, get_db_stats
 
 logger = logging.getLogger(__name__)
 
@@ -23,59 +36,85 @@ logger = logging.getLogger(__name__)
 # Startup Events
 # ============================================================================
 
-def startup_db_check() -> None:
+def startup_db_check() -> str:
     """
-    Check database connectivity on startup.
+    Check database connectivity and schema on startup.
+    
+    One query compares the stored schema fingerprint with the loaded models;
+    DDL only runs (in a single process, under an advisory lock) when they
+    differ; index builds are left to the pre-fork step in ``run.py``. See
+    ``app.db.schema_sync``.
+    
+    Returns:
+        Schema sync outcome (see ``ensure_schema``)
     
     Raises:
         RuntimeError: If database is unavailable
     """
-    logger.info("Checking database connectivity...")
+    logger.info("Checking database connectivity and schema...")
     
     try:
-        success, error_message = check_db_connection()
-        if not success:
-            error_msg = error_message or "Database connection check failed"
-            logger.error(f"Database connection failed: {error_msg}")
-            logger.error(
-                f"Database URL: {settings.DATABASE_URL.host}:{settings.DATABASE_URL.port if settings.DATABASE_URL.port else 'default'}"
-            )
-            logger.error(
-                "Please ensure:\n"
-                "  1. PostgreSQL server is running\n"
-                "  2. Database exists and is accessible\n"
-                "  3. Connection credentials in .env are correct\n"
-                "  4. Network/firewall allows connection"
-            )
-            raise RuntimeError(f"Database connection failed: {error_msg}")
-        
-        # Get connection pool stats (optional, don't fail if unavailable)
-        try:
-            pool_stats = get_db_stats()
-            logger.info(
-                f"Database connection successful. Pool stats: {pool_stats}"
-            )
-        except Exception as stats_error:
-            # Log but don't fail startup if pool stats can't be retrieved
-            logger.warning(f"Could not retrieve pool stats: {stats_error}")
-            logger.info("Database connection successful")
-        
-        # Verify we can execute a simple query
-        from sqlalchemy import text
-        with engine.connect() as connection:
-            result = connection.execute(text("SELECT version()"))
-            version = result.scalar()
-            logger.info(f"PostgreSQL version: {version}")
-            
-    except RuntimeError:
-        # Re-raise RuntimeError as-is (already has good error message)
-        raise
+        # Index builds run before workers fork (run.py); a worker must not
+        # block its boot on them.
+        outcome = ensure_schema(build_indexes=False, lock_timeout=settings.SCHEMA_LOCK_WAIT_SECONDS)
+        logger.info(f"Database connection successful; schema {outcome}")
+        logger.debug(f"Pool stats: {get_db_stats()}")
+        return outcome
+    except OperationalError as e:
+        error_msg = describe_db_error(e)
+        logger.error(f"Database connection failed: {error_msg}")
+        host = next(iter(settings.DATABASE_URL.hosts()), {})
+        logger.error(f"Database URL: {host.get('host')}:{host.get('port') or 'default'}")
+        logger.error(
+            "Please ensure:\n"
+            "  1. PostgreSQL server is running\n"
+            "  2. Database exists and is accessible\n"
+            "  3. Connection credentials in .env are correct\n"
+            "  4. Network/firewall allows connection"
+        )
+        raise RuntimeError(f"Database connection failed: {error_msg}") from e
     except Exception as e:
-        error_msg = f"Failed to connect to database: {str(e)}"
+        error_msg = f"Failed to prepare database: {str(e)}"
         logger.critical(error_msg, exc_info=True)
         raise RuntimeError(error_msg) from e
 
 
+def startup_warm_up() -> None:
+    """
+    Prime caches and hot queries before the worker serves traffic.
+    
+    Bounded by ``WARMUP_BUDGET_SECONDS``; failures are logged, never fatal.
+    See ``app.core.warmup``.
+    """
+    from app.core.warmup import warm_up
+    
+    try:
+        report = warm_up()
+        logger.info(f"Warm-up finished in {report['total_ms']} ms: {report['steps']}")
+    except Exception as e:
+        logger.warning(f"Warm-up failed: {e}", exc_info=True)
+
+
+class _StartupTimer:
+    """Wall-clock duration of each startup phase, reported once boot completes."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self._mark = self.started
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._mark) * 1000, 1)
+        self._mark = now
+
+    def total_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 1)
+
+
+_startup_report: Dict[str, Any] = {}
+
+
 def startup_log_info() -> None:
     """Log application startup information."""
     logger.info("=" * 60)
@@ -98,17 +137,20 @@ def register_startup_events(app: FastAPI) -> None:
     @app.on_event("startup")
     async def startup_handler() -> None:
         """Main startup event handler."""
+        timer = _StartupTimer()
         try:
             # Log startup information
             startup_log_info()
             
             # Import models registry to ensure all models are loaded
             import app.models.registry  # noqa: F401
+            timer.lap("models")
             
-            # Check database connectivity. In development, allow startup even if DB is down.
+            # Check database connectivity and schema. In development, allow startup even if DB is down.
             db_ok = True
+            schema_outcome = None
             try:
-                startup_db_check()
+                schema_outcome = startup_db_check()
             except RuntimeError as db_err:
                 if settings.is_development:
                     db_ok = False
@@ -118,14 +160,70 @@ def register_startup_events(app: FastAPI) -> None:
                     )
                 else:
                     raise
-
-            # Ensure all tables exist (create missing ones only; safe for production).
+            timer.lap("schema")
+            
+            # Start background task workers
+            if db_ok and settings.TASK_WORKERS_ENABLED:
+                start_task_workers()
+            
+            # Backfill facet counts on first start after the table was added
+            if db_ok:
+                from app.api.services.facets import ensure_facet_counts
+                ensure_facet_counts()
+            
+            # Catch up related-content recommendations missed while stopped
+            if db_ok:
+                from app.api.services.related import schedule_related_refresh
+                from app.db.session import SessionLocal
+                with SessionLocal() as db:
+                    schedule_related_refresh(db)
+                    db.commit()
+            
+            # Queue the soft-delete archival job (no-op if a run is already pending)
+            if db_ok and settings.ARCHIVE_ENABLED:
+                from app.api.services.archive import schedule_archive
+                from app.db.session import SessionLocal
+                with SessionLocal() as db:
+                    schedule_archive(db, delay_seconds=0)
+                    db.commit()
+            
+            # Start the scheduled-publish timer
+            if db_ok and settings.SCHEDULER_ENABLED:
+                await publish_scheduler.start()
+            
+            # Start the periodic view counter flush
+            if db_ok:
+                await view_counter.start()
+            
+            # Load token revocation epochs and keep them fresh
             if db_ok:
-                logger.info("Ensuring database tables exist...")
-                Base.metadata.create_all(bind=engine)
-                logger.info("Database tables ready")
+                await token_epochs.start()
             
-            logger.info("Application startup completed successfully")
+            # Seed default permissions on first start, then compile the policy
+            if db_ok:
+                from app.db.session import SessionLocal
+                with SessionLocal() as db:
+                    if ensure_default_permissions(db):
+                        db.commit()
+                        logger.info("Seeded default roles and permissions")
+                await policy.start()
+            timer.lap("services")
+            
+            # Prime caches and hot statements before accepting traffic
+            if db_ok and settings.WARMUP_ENABLED:
+                startup_warm_up()
+                timer.lap("warmup")
+            
+            _startup_report.update(
+                pid=os.getpid(),
+                schema=schema_outcome,
+                total_ms=timer.total_ms(),
+                phases_ms=timer.phases,
+            )
+            logger.info(
+                f"Application startup completed successfully in {_startup_report['total_ms']} ms "
+                f"(schema {schema_outcome}; phases {timer.phases})"
+            )
             
         except Exception as e:
             logger.critical(
@@ -136,6 +234,9 @@ def register_startup_events(app: FastAPI) -> None:
             sys.exit(1)
 
 
+register_metrics_source("startup", lambda: dict(_startup_report))
+
+
 # ============================================================================
 # Shutdown Events
 # ============================================================================
@@ -177,6 +278,17 @@ def register_shutdown_events(app: FastAPI) -> None:
             # Log shutdown information
             shutdown_log_info()
             
+            await publish_scheduler.stop()
+            
+            await token_epochs.stop()
+            await policy.stop()
+            
+            # Write out buffered view counts
+            await view_counter.stop()
+            
+            # Let in-flight background tasks finish before closing the pool
+            await stop_task_workers()
+            
             # Perform cleanup
             shutdown_cleanup()
             
@@ -0,0 +1,181 @@
+"""
+Non-blocking log pipeline.
+
+Application threads and the event loop never write to stdout themselves.
+Loggers hand records to a ``QueueHandler`` backed by a bounded queue, and a
+single ``QueueListener`` thread formats and writes them. If the writer falls
+behind (stdout backpressure), records are dropped and counted rather than
+blocking request handling. A full queue drops records of any level, so
+``LOG_QUEUE_SIZE`` should cover the largest expected burst.
+
+Before a record is queued:
+
+- ``LOG_SAMPLE_RATES`` keeps only a fraction of sub-WARNING records from
+  noisy loggers (e.g. ``uvicorn.access``, ``sqlalchemy.engine``)
+- ``request_id`` and ``user_id`` are copied from context variables set by
+  ``bind_log_context``, so they follow the request across awaits
+
+``JSONFormatter`` encodes with ``orjson`` when it is installed.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    import json
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("log_request_id", default=None)
+user_id_var: ContextVar[Optional[str]] = ContextVar("log_user_id", default=None)
+
+_counters = Counters()
+
+
+def bind_log_context(request_id: Optional[str] = None, user_id: Optional[str] = None) -> None:
+    """Attach identifiers to every record logged from the current context."""
+    if request_id is not None:
+        request_id_var.set(request_id)
+    if user_id is not None:
+        user_id_var.set(user_id)
+
+
+class JSONFormatter(logging.Formatter):
+    """JSON formatter for structured logging."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+
+        # Add exception info if present
+        if record.exc_info:
+            log_data["exception"] = self.formatException(record.exc_info)
+            log_data["exception_type"] = record.exc_info[0].__name__ if record.exc_info else None
+
+        # Add extra fields if present
+        if hasattr(record, "extra"):
+            log_data.update(record.extra)
+
+        # Add request context if available
+        if getattr(record, "request_id", None) is not None:
+            log_data["request_id"] = record.request_id
+        if getattr(record, "user_id", None) is not None:
+            log_data["user_id"] = record.user_id
+
+        if orjson is not None:
+            return orjson.dumps(log_data, default=str).decode("utf-8")
+        return json.dumps(log_data, default=str)
+
+
+class _ContextAndSamplingFilter(logging.Filter):
+    """Drops sampled-out records and stamps request context on the rest."""
+
+    def __init__(self, sample_rates: Dict[str, float]) -> None:
+        super().__init__()
+        # Longest prefix first so "uvicorn.access" wins over "uvicorn".
+        self.sample_rates = sorted(sample_rates.items(), key=lambda item: -len(item[0]))
+
+    def _rate(self, name: str) -> float:
+        for prefix, rate in self.sample_rates:
+            if name == prefix or name.startswith(prefix + "."):
+                return rate
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING and self.sample_rates:
+            rate = self._rate(record.name)
+            if rate < 1.0 and random.random() >= rate:
+                _counters.inc("sampled_out")
+                return False
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_var.get()
+        if not hasattr(record, "user_id"):
+            record.user_id = user_id_var.get()
+        return True
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that never blocks: a full queue drops the record."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now, while they still hold their logging-time values;
+        # formatting itself happens on the writer thread.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            _counters.inc("queued")
+        except queue.Full:
+            _counters.inc(f"dropped_{record.levelname.lower()}")
+
+
+class LogPipeline:
+    """Owns the queue and writer thread; restarted in forked children."""
+
+    def __init__(self) -> None:
+        self._output: Optional[logging.Handler] = None
+        self._queue_handler: Optional[_DroppingQueueHandler] = None
+        self._listener: Optional[QueueListener] = None
+
+    def install(self, formatter: logging.Formatter, root_logger: logging.Logger) -> None:
+        """Route the root logger through the queue, writing formatted records to stdout."""
+        self.stop()
+        self._output = logging.StreamHandler(sys.stdout)
+        self._output.setFormatter(formatter)
+        self._queue_handler = _DroppingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+        self._queue_handler.addFilter(_ContextAndSamplingFilter(settings.LOG_SAMPLE_RATES))
+        root_logger.handlers.clear()
+        root_logger.addHandler(self._queue_handler)
+        self._start()
+
+    def _start(self) -> None:
+        self._listener = QueueListener(self._queue_handler.queue, self._output)
+        self._listener.start()
+
+    def _restart_in_child(self) -> None:
+        # The writer thread does not survive fork(); the queue's lock may have
+        # been held by it, so the child gets a fresh queue too.
+        if self._queue_handler is None:
+            return
+        self._queue_handler.queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+        self._start()
+
+    def stop(self) -> None:
+        """Flush queued records and stop the writer thread."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def snapshot(self) -> Dict[str, float]:
+        depth = self._queue_handler.queue.qsize() if self._queue_handler is not None else 0
+        return {"queue_depth": depth, **_counters.snapshot()}
+
+
+log_pipeline = LogPipeline()
+
+atexit.register(log_pipeline.stop)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=log_pipeline._restart_in_child)
+
+register_metrics_source("logging", log_pipeline.snapshot)
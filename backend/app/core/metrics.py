@@ -0,0 +1,69 @@
+"""
+In-process metrics registry.
+
+Subsystems register a snapshot callable under a name; ``/health/metrics``
+returns every snapshot in one document. Values are per worker process.
+"""
+
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+MetricsSource = Callable[[], Dict[str, Any]]
+
+_sources: Dict[str, MetricsSource] = {}
+
+
+class Counters:
+    """Thread-safe named counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: Dict[str, float] = defaultdict(float)
+
+    def inc(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[name] += amount
+
+    def get(self, name: str) -> float:
+        with self._lock:
+            return self._values.get(name, 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._values)
+
+
+def register_metrics_source(name: str, source: MetricsSource) -> None:
+    """Register (or replace) a metrics snapshot callable."""
+    _sources[name] = source
+
+
+def collect_metrics() -> Dict[str, Any]:
+    """Collect a snapshot from every registered source."""
+    result: Dict[str, Any] = {}
+    for name, source in list(_sources.items()):
+        try:
+            result[name] = source()
+        except Exception as e:
+            logger.warning(f"Metrics source '{name}' failed: {e}")
+            result[name] = {"error": str(e)}
+    return result
+
+
+def _process_snapshot() -> Dict[str, Any]:
+    """Resident memory of this worker process (Linux; zeros elsewhere)."""
+    rss_bytes = 0
+    try:
+        with open("/proc/self/statm") as statm:
+            rss_bytes = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    return {"pid": os.getpid(), "rss_mb": round(rss_bytes / (1024 * 1024), 1)}
+
+
+register_metrics_source("process", _process_snapshot)
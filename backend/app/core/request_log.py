@@ -0,0 +1,228 @@
+"""
+Request correlation and per-request summaries.
+
+``RequestLogMiddleware`` gives every request an id (the caller's
+``X-Request-ID`` if it sent a sane one, otherwise a new one), binds it to
+the log context so every record logged while handling the request carries
+it, and returns it in the response's ``X-Request-ID`` header.
+
+When the response finishes, one structured summary is logged: route
+template, status, total time, time spent in database calls and their count,
+cache hits/misses, and bytes sent. Slow requests (``REQUEST_LOG_SLOW_MS``)
+and server errors are always logged; the rest are sampled at
+``REQUEST_LOG_SAMPLE_RATE``. The slowest recent requests are also kept in
+the "requests" metrics source, so p99 outliers can be investigated without
+searching the logs. That source is served by the public ``/health/metrics``
+endpoint, so the kept copies leave out the request and user ids.
+
+Database time is measured by cursor-execute hooks on the engine and cache
+results are reported by the caches via ``note_cache``; both write into the
+current request's stats object found through a context variable, which is
+shared with the threadpool that runs sync handlers.
+"""
+
+import heapq
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.log_pipeline import bind_log_context
+from app.core.metrics import Counters, register_metrics_source
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "x-request-id"
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+_TIMING_KEY = "request_log_started"
+
+
+@dataclass
+class RequestStats:
+    """Counters for one request, filled in while it is handled."""
+
+    db_ms: float = 0.0
+    queries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    user_id: Optional[str] = None
+
+
+_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+_counters = Counters()
+_slowest: List[Tuple[float, int, Dict[str, Any]]] = []
+_slowest_lock = threading.Lock()
+_sequence = 0
+
+
+def note_cache(hit: bool) -> None:
+    """Record a cache lookup against the current request, if any."""
+    stats = _stats.get()
+    if stats is not None:
+        if hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
+
+
+def note_user(user_id: Any) -> None:
+    """Record the authenticated user for the current request's summary."""
+    stats = _stats.get()
+    if stats is not None:
+        stats.user_id = str(user_id)
+        bind_log_context(user_id=stats.user_id)
+
+
+def _request_id(scope: Scope) -> str:
+    for name, value in scope.get("headers", ()):
+        if name == REQUEST_ID_HEADER.encode("latin-1"):
+            candidate = value.decode("latin-1")
+            if _VALID_REQUEST_ID.match(candidate):
+                return candidate
+            break
+    return uuid.uuid4().hex
+
+
+# Summary fields that identify a caller; never exposed through metrics.
+_PRIVATE_FIELDS = ("request_id", "user_id")
+
+
+def _keep_slowest(summary: Dict[str, Any]) -> None:
+    global _sequence
+    summary = {key: value for key, value in summary.items() if key not in _PRIVATE_FIELDS}
+    with _slowest_lock:
+        _sequence += 1
+        entry = (summary["total_ms"], _sequence, summary)
+        if len(_slowest) < settings.REQUEST_LOG_SLOWEST_KEPT:
+            heapq.heappush(_slowest, entry)
+        elif entry[0] > _slowest[0][0]:
+            heapq.heapreplace(_slowest, entry)
+
+
+class RequestLogMiddleware:
+    """ASGI middleware assigning request ids and logging request summaries."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _request_id(scope)
+        stats = RequestStats()
+        stats_token = _stats.set(stats)
+        bind_log_context(request_id=request_id)
+        started = time.perf_counter()
+        response: Dict[str, int] = {"status": 500, "bytes": 0}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                headers = list(message.get("headers", ()))
+                headers.append((REQUEST_ID_HEADER.encode("latin-1"), request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                response["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _stats.reset(stats_token)
+            self._summarize(scope, request_id, stats, response, started)
+
+    def _summarize(
+        self,
+        scope: Scope,
+        request_id: str,
+        stats: RequestStats,
+        response: Dict[str, int],
+        started: float,
+    ) -> None:
+        total_ms = (time.perf_counter() - started) * 1000
+        route = scope.get("route")
+        summary = {
+            "request_id": request_id,
+            "method": scope["method"],
+            "route": getattr(route, "path", None) or scope["path"],
+            "status": response["status"],
+            "total_ms": round(total_ms, 2),
+            "db_ms": round(stats.db_ms, 2),
+            "queries": stats.queries,
+            "cache_hits": stats.cache_hits,
+            "cache_misses": stats.cache_misses,
+            "bytes_out": response["bytes"],
+            "user_id": stats.user_id,
+        }
+        _counters.inc("requests")
+        _counters.inc("queries", stats.queries)
+        _counters.inc("db_ms", stats.db_ms)
+
+        slow = total_ms >= settings.REQUEST_LOG_SLOW_MS
+        if slow:
+            _counters.inc("slow")
+            _keep_slowest(summary)
+        if not settings.REQUEST_LOG_ENABLED:
+            return
+        if not (slow or response["status"] >= 500 or random.random() < settings.REQUEST_LOG_SAMPLE_RATE):
+            return
+
+        _counters.inc("logged")
+        logger.log(
+            logging.WARNING if slow else logging.INFO,
+            f"{summary['method']} {summary['route']} {summary['status']} "
+            f"{summary['total_ms']}ms db={summary['db_ms']}ms/{summary['queries']}q",
+            extra={"extra": {**summary, "slow": slow}},
+        )
+
+
+# ============================================================================
+# Database Timing
+# ============================================================================
+
+@event.listens_for(engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _stats.get() is not None:
+        conn.info.setdefault(_TIMING_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _stats.get()
+    started = conn.info.get(_TIMING_KEY)
+    if stats is None or not started:
+        return
+    stats.db_ms += (time.perf_counter() - started.pop()) * 1000
+    stats.queries += 1
+
+
+@event.listens_for(engine, "handle_error")
+def _discard_failed_timing(context) -> None:
+    # Failed statements never reach after_cursor_execute; drop their start mark.
+    if context.connection is not None and _stats.get() is not None:
+        started = context.connection.info.get(_TIMING_KEY)
+        if started:
+            started.pop()
+
+
+def _snapshot() -> Dict[str, Any]:
+    with _slowest_lock:
+        slowest = [entry[2] for entry in sorted(_slowest, reverse=True)]
+    return {**_counters.snapshot(), "slowest": slowest}
+
+
+register_metrics_source("requests", _snapshot)
@@ -0,0 +1,261 @@
+"""
+Scheduled publishing.
+
+Editors set ``status=scheduled`` with a future ``published_at``. Each worker
+process keeps a min-heap of pending fire times, loaded once at startup from
+the ``ix_*_scheduled_publish`` partial indexes and updated in-process when
+content is saved. The loop sleeps until the earliest fire time; nothing polls
+the content tables.
+
+When an item is due, every process that knows about it races for a
+transaction-level advisory lock; the winner flips it to ``published`` with
+a conditional update, records the change (which invalidates caches) and
+enqueues post-publish work. The update matches on the scheduled time the
+heap fired for, not the database clock, so clock skew between hosts cannot
+make a due item look early.
+
+Items scheduled in another process are picked up by a poll every
+``SCHEDULER_POLL_SECONDS`` for items due before the next poll (a range scan
+of the partial indexes that usually returns nothing), so they fire on time
+even if the process that scheduled them was recycled. A slow periodic
+resync reloads the whole schedule, dropping cancelled items.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
+from app.core.tasks import enqueue_post_publish
+from app.db.session import SessionLocal
+from app.models.enums import ChangeOp, ContentStatus
+from app.models.registry import CONTENT_MODELS
+
+logger = logging.getLogger(__name__)
+
+ScheduleKey = Tuple[str, UUID]
+
+_counters = Counters()
+
+
+def _advisory_lock_key(entity_type: str, entity_id: UUID) -> int:
+    digest = hashlib.blake2b(f"publish:{entity_type}:{entity_id}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def load_scheduled_items(due_before: Optional[datetime] = None) -> List[Tuple[datetime, str, UUID]]:
+    """
+    Read scheduled, non-deleted items (served by the partial indexes).
+
+    Args:
+        due_before: Only items due before this time; None reads all of them
+    """
+    items: List[Tuple[datetime, str, UUID]] = []
+    with SessionLocal() as db:
+        for entity_type, model in CONTENT_MODELS.items():
+            query = select(model.id, model.published_at).where(
+                model.status == ContentStatus.SCHEDULED,
+                model.is_deleted == False,
+            )
+            if due_before is not None:
+                query = query.where(model.published_at < due_before)
+            rows = db.execute(query).all()
+            items.extend(
+                (published_at, entity_type, entity_id)
+                for entity_id, published_at in rows
+                if published_at is not None
+            )
+    return items
+
+
+def publish_due_item(entity_type: str, entity_id: UUID, fire_at: datetime) -> bool:
+    """
+    Publish one scheduled item if it is still scheduled for ``fire_at`` or earlier.
+
+    ``fire_at`` is the time the caller's timer fired for; comparing with it
+    rather than the database's ``now()`` keeps a clock behind the app host
+    from rejecting an item that is due.
+
+    Returns:
+        True if this call published the item
+    """
+    # Imported lazily: the services package imports this module.
+    from app.api.services.changes import record_change
+    from app.api.services.facets import apply_facet_changes, facet_values
+
+    model = CONTENT_MODELS[entity_type]
+    with SessionLocal() as db:
+        locked = db.scalar(select(func.pg_try_advisory_xact_lock(_advisory_lock_key(entity_type, entity_id))))
+        if not locked:
+            db.rollback()
+            return False
+
+        item = db.scalar(
+            select(model).where(
+                model.id == entity_id,
+                model.status == ContentStatus.SCHEDULED,
+                model.is_deleted == False,
+                model.published_at <= fire_at,
+            )
+        )
+        if item is None:
+            db.rollback()
+            return False
+
+        old_facets = facet_values(entity_type, item)
+        item.status = ContentStatus.PUBLISHED
+        record_change(db, entity_type, item.id, item.slug, ChangeOp.UPDATE)
+        apply_facet_changes(db, entity_type, old_facets, facet_values(entity_type, item))
+        enqueue_post_publish(db, entity_type, item.id)
+        db.commit()
+        logger.info(f"Published scheduled {entity_type} '{item.slug}'")
+        return True
+
+
+class PublishScheduler:
+    """Min-heap of scheduled publish times driven by a single coroutine."""
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[datetime, str, UUID]] = []
+        # Latest wanted fire time per item; heap entries that disagree are stale.
+        self._wanted: Dict[ScheduleKey, datetime] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stopping = False
+
+    @property
+    def size(self) -> int:
+        return len(self._wanted)
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="publish-scheduler")
+        await self._resync()
+        self._runner = asyncio.create_task(self._run(), name="publish-scheduler")
+        logger.info(f"Publish scheduler started with {self.size} scheduled item(s)")
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def schedule(self, entity_type: str, entity_id: UUID, when: Optional[datetime]) -> None:
+        """Add, move or (with ``when=None``) cancel an item; safe from any thread."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._apply, entity_type, entity_id, when)
+
+    def _apply(self, entity_type: str, entity_id: UUID, when: Optional[datetime]) -> None:
+        key = (entity_type, entity_id)
+        if when is None:
+            self._wanted.pop(key, None)
+            return
+        fire_at = when.replace(tzinfo=timezone.utc) if when.tzinfo is None else when
+        if self._wanted.get(key) == fire_at:
+            return
+        self._wanted[key] = fire_at
+        heapq.heappush(self._heap, (fire_at, entity_type, entity_id))
+        self._wake.set()
+
+    async def _resync(self) -> None:
+        items = await self._loop.run_in_executor(self._executor, load_scheduled_items)
+        self._heap = []
+        self._wanted = {}
+        for when, entity_type, entity_id in items:
+            self._apply(entity_type, entity_id, when)
+
+    async def _poll(self, due_before: datetime) -> None:
+        items = await self._loop.run_in_executor(self._executor, load_scheduled_items, due_before)
+        for when, entity_type, entity_id in items:
+            self._apply(entity_type, entity_id, when)
+
+    def _next_fire_at(self) -> Optional[datetime]:
+        while self._heap:
+            fire_at, entity_type, entity_id = self._heap[0]
+            if self._wanted.get((entity_type, entity_id)) == fire_at:
+                return fire_at
+            heapq.heappop(self._heap)
+        return None
+
+    async def _run(self) -> None:
+        next_resync = self._loop.time() + settings.SCHEDULER_RESYNC_SECONDS
+        next_poll = self._loop.time()
+        while not self._stopping:
+            now = datetime.now(timezone.utc)
+            fire_at = self._next_fire_at()
+
+            if fire_at is not None and fire_at <= now:
+                _, entity_type, entity_id = heapq.heappop(self._heap)
+                self._wanted.pop((entity_type, entity_id), None)
+                try:
+                    published = await self._loop.run_in_executor(
+                        self._executor, publish_due_item, entity_type, entity_id, fire_at
+                    )
+                    _counters.inc("published" if published else "skipped")
+                except Exception as e:
+                    _counters.inc("errors")
+                    logger.error(f"Scheduled publish of {entity_type} {entity_id} failed: {e}", exc_info=True)
+                    retry_at = now + timedelta(seconds=settings.SCHEDULER_RETRY_SECONDS)
+                    self._apply(entity_type, entity_id, retry_at)
+                continue
+
+            if self._loop.time() >= next_resync:
+                try:
+                    await self._resync()
+                except Exception as e:
+                    logger.warning(f"Publish scheduler resync failed: {e}")
+                next_resync = self._loop.time() + settings.SCHEDULER_RESYNC_SECONDS
+                continue
+
+            if self._loop.time() >= next_poll:
+                # Look one interval ahead so the next poll is never too late.
+                horizon = now + timedelta(seconds=2 * settings.SCHEDULER_POLL_SECONDS)
+                try:
+                    await self._poll(horizon)
+                except Exception as e:
+                    logger.warning(f"Publish scheduler poll failed: {e}")
+                next_poll = self._loop.time() + settings.SCHEDULER_POLL_SECONDS
+                continue
+
+            timeout = min(next_resync, next_poll) - self._loop.time()
+            if fire_at is not None:
+                timeout = min(timeout, (fire_at - now).total_seconds())
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), max(timeout, 0))
+            except asyncio.TimeoutError:
+                pass
+
+
+publish_scheduler = PublishScheduler()
+
+
+def reschedule_publish(entity_type: str, item) -> None:
+    """Sync the in-process schedule with a content item after a committed write."""
+    if item.status == ContentStatus.SCHEDULED and not item.is_deleted and item.published_at is not None:
+        publish_scheduler.schedule(entity_type, item.id, item.published_at)
+    else:
+        publish_scheduler.schedule(entity_type, item.id, None)
+
+
+register_metrics_source(
+    "scheduler",
+    lambda: {"scheduled": publish_scheduler.size, **_counters.snapshot()},
+)
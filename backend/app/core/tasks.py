@@ -0,0 +1,384 @@
+"""
+Durable Postgres-backed background task queue.
+
+Provides:
+- ``@task_handler(name)`` registration of sync handlers ``(db, payload)``
+- ``enqueue`` that writes a task row inside the caller's transaction,
+  optionally de-duplicated on a key
+- Worker coroutines (started from ``app.core.events``) that claim tasks with
+  ``SELECT ... FOR UPDATE SKIP LOCKED`` and retry failures with backoff
+- Post-publish hooks run off the request path after content is published
+
+Handlers must be idempotent: a task may run more than once if a worker dies
+mid-task or a later hook in the same task fails.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, event, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
+from app.db.session import SessionLocal
+from app.models.task import PENDING_DEDUP_PREDICATE, Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[Session, Dict[str, Any]], None]
+
+POST_PUBLISH_TASK = "content.post_publish"
+
+_ENQUEUED_KEY = "enqueued_tasks"
+
+_handlers: Dict[str, TaskHandler] = {}
+_post_publish_hooks: List[TaskHandler] = []
+_counters = Counters()
+
+
+class ClaimedTask(NamedTuple):
+    id: int
+    name: str
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+# ============================================================================
+# Registration & Enqueueing
+# ============================================================================
+
+def task_handler(name: str) -> Callable[[TaskHandler], TaskHandler]:
+    """Register the decorated function as the handler for task ``name``."""
+    def decorator(func: TaskHandler) -> TaskHandler:
+        _handlers[name] = func
+        return func
+    return decorator
+
+
+def enqueue(
+    db: Session,
+    name: str,
+    payload: Optional[Dict[str, Any]] = None,
+    dedup_key: Optional[str] = None,
+    delay_seconds: float = 0,
+    max_attempts: Optional[int] = None,
+) -> None:
+    """
+    Add a task to the queue as part of the caller's transaction.
+
+    The task becomes visible to workers when the caller commits. If
+    ``dedup_key`` is given and a pending task with the same key exists,
+    this call is a no-op.
+    """
+    values: Dict[str, Any] = {
+        "name": name,
+        "payload": payload or {},
+        "status": TaskStatus.PENDING,
+        "dedup_key": dedup_key,
+        "attempts": 0,
+        "max_attempts": max_attempts or settings.TASK_MAX_ATTEMPTS,
+    }
+    if delay_seconds:
+        values["run_at"] = func.now() + timedelta(seconds=delay_seconds)
+
+    stmt = insert(Task).values(**values)
+    if dedup_key:
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=[Task.dedup_key],
+            index_where=PENDING_DEDUP_PREDICATE,
+        )
+    db.execute(stmt)
+    db.info[_ENQUEUED_KEY] = True
+    _counters.inc("enqueued")
+
+
+def register_post_publish_hook(hook: TaskHandler) -> None:
+    """Register a hook run in the background after content is published or unpublished."""
+    if hook not in _post_publish_hooks:
+        _post_publish_hooks.append(hook)
+
+
+def enqueue_post_publish(db: Session, entity_type: str, entity_id: UUID) -> None:
+    """Schedule post-publish work (cache warm-up, sitemap, purge...) for an item."""
+    enqueue(
+        db,
+        POST_PUBLISH_TASK,
+        {"entity_type": entity_type, "entity_id": str(entity_id)},
+        dedup_key=f"{POST_PUBLISH_TASK}:{entity_type}:{entity_id}",
+    )
+
+
+@task_handler(POST_PUBLISH_TASK)
+def _run_post_publish_hooks(db: Session, payload: Dict[str, Any]) -> None:
+    for hook in list(_post_publish_hooks):
+        hook(db, payload)
+
+
+# ============================================================================
+# Queue Operations (run in worker threads)
+# ============================================================================
+
+def _claim_next(worker_id: str) -> Optional[ClaimedTask]:
+    with SessionLocal() as db:
+        task = db.scalar(
+            select(Task)
+            .where(Task.status == TaskStatus.PENDING, Task.run_at <= func.now())
+            .order_by(Task.run_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        if task is None:
+            db.rollback()
+            return None
+
+        task.status = TaskStatus.RUNNING
+        task.attempts += 1
+        task.locked_at = func.now()
+        task.locked_by = worker_id
+        claimed = ClaimedTask(
+            task.id, task.name, dict(task.payload or {}), task.attempts, task.max_attempts
+        )
+        db.commit()
+        return claimed
+
+
+def _complete(task_id: int) -> None:
+    with SessionLocal() as db:
+        db.execute(delete(Task).where(Task.id == task_id))
+        db.commit()
+
+
+def _retry_delay(attempts: int) -> float:
+    base = settings.TASK_RETRY_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0))
+    delay = min(base, settings.TASK_RETRY_BACKOFF_MAX_SECONDS)
+    # Full jitter on the upper half spreads out retries of a failing batch.
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _record_failure(claimed: ClaimedTask, error: Exception) -> None:
+    values: Dict[str, Any] = {
+        "last_error": f"{type(error).__name__}: {error}"[:2000],
+        "locked_at": None,
+        "locked_by": None,
+    }
+    if claimed.attempts >= claimed.max_attempts:
+        values["status"] = TaskStatus.FAILED
+        _counters.inc("failed")
+        logger.error(
+            f"Task {claimed.name}#{claimed.id} failed permanently after "
+            f"{claimed.attempts} attempts: {error}"
+        )
+    else:
+        delay = _retry_delay(claimed.attempts)
+        values["status"] = TaskStatus.PENDING
+        values["run_at"] = func.now() + timedelta(seconds=delay)
+        _counters.inc("retried")
+        logger.warning(
+            f"Task {claimed.name}#{claimed.id} attempt {claimed.attempts} failed, "
+            f"retrying in {delay:.1f}s: {error}"
+        )
+
+    with SessionLocal() as db:
+        try:
+            db.execute(update(Task).where(Task.id == claimed.id).values(**values))
+            db.commit()
+        except IntegrityError:
+            # A newer pending task with the same dedup key already covers this work.
+            db.rollback()
+            db.execute(delete(Task).where(Task.id == claimed.id))
+            db.commit()
+
+
+def _release_stale_locks() -> int:
+    """Return tasks held by dead workers to the pending state."""
+    stale = (
+        Task.status == TaskStatus.RUNNING,
+        Task.locked_at < func.now() - timedelta(seconds=settings.TASK_LOCK_TIMEOUT_SECONDS),
+    )
+    other = aliased(Task)
+    with SessionLocal() as db:
+        # A pending task with the same dedup key already covers a stale one
+        # (as in ``_record_failure``), and of several stale tasks sharing a
+        # key only the oldest can go back to pending without violating the
+        # unique index on pending dedup keys.
+        db.execute(
+            delete(Task).where(
+                *stale,
+                Task.dedup_key.is_not(None),
+                select(other.id)
+                .where(
+                    other.dedup_key == Task.dedup_key,
+                    (other.status == TaskStatus.PENDING)
+                    | ((other.status == TaskStatus.RUNNING) & (other.id < Task.id)),
+                )
+                .exists(),
+            )
+        )
+        result = db.execute(
+            update(Task)
+            .where(*stale)
+            .values(status=TaskStatus.PENDING, locked_at=None, locked_by=None)
+        )
+        db.commit()
+        return result.rowcount or 0
+
+
+def get_queue_depth(db: Session) -> Dict[str, int]:
+    """Count tasks per status."""
+    rows = db.execute(select(Task.status, func.count()).group_by(Task.status)).all()
+    return {status: count for status, count in rows}
+
+
+# ============================================================================
+# Worker Pool
+# ============================================================================
+
+class TaskWorkerPool:
+    """Worker coroutines that execute queued tasks on a dedicated thread pool."""
+
+    def __init__(self, concurrency: int) -> None:
+        self.concurrency = concurrency
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+        self._stopping = False
+        self._last_sweep = 0.0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers) and not self._stopping
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="task-worker"
+        )
+        self._workers = [
+            asyncio.create_task(self._run(index), name=f"task-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+        logger.info(f"Started {self.concurrency} task worker(s) as {self.worker_id}")
+
+    def wake(self) -> None:
+        """Wake idle workers; safe to call from any thread."""
+        if self._loop is not None and not self._loop.is_closed() and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        self._stopping = True
+        if self._wake is not None:
+            self._wake.set()
+        if self._workers:
+            _, pending = await asyncio.wait(self._workers, timeout=timeout)
+            for worker in pending:
+                worker.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        logger.info("Task workers stopped")
+
+    async def _run(self, index: int) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            ran = False
+            try:
+                if index == 0:
+                    await loop.run_in_executor(self._executor, self._maybe_sweep)
+                ran = await loop.run_in_executor(self._executor, self._run_one)
+            except Exception as e:
+                logger.error(f"Task worker {index} error: {e}", exc_info=True)
+            if ran or self._stopping:
+                continue
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), settings.TASK_POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < settings.TASK_LOCK_TIMEOUT_SECONDS / 2:
+            return
+        self._last_sweep = now
+        released = _release_stale_locks()
+        if released:
+            _counters.inc("stale_released", released)
+            logger.warning(f"Released {released} stale task lock(s)")
+
+    def _run_one(self) -> bool:
+        claimed = _claim_next(self.worker_id)
+        if claimed is None:
+            return False
+
+        started = time.perf_counter()
+        try:
+            handler = _handlers.get(claimed.name)
+            if handler is None:
+                raise LookupError(f"No handler registered for task '{claimed.name}'")
+            with SessionLocal() as db:
+                handler(db, claimed.payload)
+                db.commit()
+        except Exception as e:
+            _counters.inc("failed_attempts")
+            _record_failure(claimed, e)
+        else:
+            _complete(claimed.id)
+            _counters.inc("succeeded")
+            _counters.inc(f"seconds.{claimed.name}", time.perf_counter() - started)
+        return True
+
+
+_pool: Optional[TaskWorkerPool] = None
+
+
+def start_task_workers() -> None:
+    """Start the worker pool on the running event loop (idempotent)."""
+    global _pool
+    if _pool is not None and _pool.running:
+        return
+    _pool = TaskWorkerPool(settings.TASK_WORKER_CONCURRENCY)
+    _pool.start()
+
+
+async def stop_task_workers() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.stop()
+        _pool = None
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _wake_workers_on_enqueue(session: Session) -> None:
+    if session.info.pop(_ENQUEUED_KEY, False) and _pool is not None:
+        _pool.wake()
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _discard_enqueue_flag(session: Session, previous_transaction) -> None:
+    if not session.in_transaction():
+        session.info.pop(_ENQUEUED_KEY, None)
+
+
+def _metrics() -> Dict[str, Any]:
+    return {
+        "workers": _pool.concurrency if _pool is not None and _pool.running else 0,
+        "handlers": sorted(_handlers),
+        **_counters.snapshot(),
+    }
+
+
+register_metrics_source("tasks", _metrics)
@@ -0,0 +1,188 @@
+"""
+Write-behind view counters.
+
+Public slug endpoints call ``record_view``, which only bumps an in-memory
+counter. A flusher coroutine periodically swaps the buffer out and writes the
+aggregated deltas to ``content_view_counts`` in one batched upsert, so reads
+never turn into per-request UPDATEs on the content tables.
+
+Counts buffered in a process are lost if it is killed without a clean
+shutdown; that is the accepted trade-off for view statistics. While flushes
+fail (database down), retries back off exponentially up to
+``VIEW_COUNTER_MAX_BACKOFF_SECONDS`` and a full buffer no longer triggers
+an early flush.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
+from app.db.session import SessionLocal
+from app.models.view_count import ContentViewCount
+
+logger = logging.getLogger(__name__)
+
+ViewKey = Tuple[str, UUID]
+
+# Rows per INSERT statement; all chunks of a flush share one transaction.
+_UPSERT_CHUNK_SIZE = 5000
+
+_counters = Counters()
+
+
+class ViewCounter:
+    """In-memory accumulator of view deltas with a periodic batched flush."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: Dict[ViewKey, int] = defaultdict(int)
+        self._flush_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stopping = False
+        self._failures = 0
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._failures
+
+    def record(self, entity_type: str, entity_id: UUID) -> None:
+        with self._lock:
+            self._pending[(entity_type, entity_id)] += 1
+            size = len(self._pending)
+        _counters.inc("recorded")
+        # Only flush early while flushes succeed; after a failure the flusher
+        # is backing off and waking it would retry on every view.
+        if size >= settings.VIEW_COUNTER_MAX_PENDING and not self._failures:
+            self._request_flush()
+
+    def _request_flush(self) -> None:
+        if self._loop is not None and not self._loop.is_closed() and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def flush(self) -> int:
+        """
+        Write buffered deltas to the database.
+
+        Returns:
+            Number of items written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, defaultdict(int)
+            if not batch:
+                return 0
+
+            # Stable key order keeps concurrent flushes from deadlocking on row locks.
+            rows = [
+                {"entity_type": entity_type, "entity_id": entity_id, "views": views}
+                for (entity_type, entity_id), views in sorted(batch.items(), key=lambda i: (i[0][0], str(i[0][1])))
+            ]
+            try:
+                with SessionLocal() as db:
+                    for start in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+                        stmt = insert(ContentViewCount).values(rows[start:start + _UPSERT_CHUNK_SIZE])
+                        db.execute(
+                            stmt.on_conflict_do_update(
+                                index_elements=[ContentViewCount.entity_type, ContentViewCount.entity_id],
+                                set_={
+                                    "views": ContentViewCount.views + stmt.excluded.views,
+                                    "updated_at": func.now(),
+                                },
+                            )
+                        )
+                    db.commit()
+            except Exception:
+                # Put the deltas back so the next flush retries them.
+                with self._lock:
+                    for key, views in batch.items():
+                        self._pending[key] += views
+                _counters.inc("flush_errors")
+                raise
+
+            _counters.inc("flushes")
+            _counters.inc("flushed_items", len(rows))
+            return len(rows)
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="view-counter")
+        self._stopping = False
+        self._runner = asyncio.create_task(self._run(), name="view-counter")
+
+    async def stop(self) -> None:
+        if self._loop is None:
+            return
+        self._stopping = True
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+        try:
+            await self._loop.run_in_executor(self._executor, self.flush)
+        except Exception as e:
+            logger.error(f"Final view counter flush failed: {e}")
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _retry_delay(self) -> float:
+        delay = settings.VIEW_COUNTER_FLUSH_SECONDS * (2 ** min(self._failures, 16))
+        return min(delay, max(settings.VIEW_COUNTER_MAX_BACKOFF_SECONDS, settings.VIEW_COUNTER_FLUSH_SECONDS))
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            if self._failures:
+                await asyncio.sleep(self._retry_delay())
+            else:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), settings.VIEW_COUNTER_FLUSH_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+            try:
+                await self._loop.run_in_executor(self._executor, self.flush)
+            except Exception as e:
+                self._failures += 1
+                logger.warning(f"View counter flush failed, retrying in {self._retry_delay():.0f}s: {e}")
+            else:
+                if self._failures:
+                    logger.info(f"View counter flush recovered after {self._failures} failure(s)")
+                self._failures = 0
+
+
+view_counter = ViewCounter()
+
+
+def record_view(entity_type: str, entity_id: UUID) -> None:
+    """Count one public view of a content item."""
+    view_counter.record(entity_type, entity_id)
+
+
+register_metrics_source(
+    "views",
+    lambda: {
+        "pending": view_counter.pending,
+        "consecutive_failures": view_counter.consecutive_failures,
+        **_counters.snapshot(),
+    },
+)
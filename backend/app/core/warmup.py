@@ -0,0 +1,127 @@
+"""
+Startup warm-up.
+
+Before a worker serves its first request it primes what the first visitors
+after a deploy would otherwise pay for:
+
+- every site setting, loaded into the settings cache with one query
+- facet counts for the filterable content types
+- the most-viewed published pages, services, blogs and case studies,
+  loaded with one projected query per type and run through their response
+  schemas, so their rows are in Postgres' buffer cache and the model and
+  serializer code paths are warm
+- one execution of each hot list and slug query, so SQLAlchemy's compiled
+  statement cache already holds them
+
+The whole stage runs under ``WARMUP_BUDGET_SECONDS``: queries carry a
+statement timeout for the time left, remaining steps are skipped once it
+runs out, and failures are logged without failing startup.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.schemas.blog import BlogOut
+from app.api.schemas.case_study import CaseStudyOut
+from app.api.schemas.page import PageOut
+from app.api.schemas.service import ServiceOut
+from app.api.services.blog import get_blog_by_slug, list_blogs
+from app.api.services.case_study import get_case_study_by_slug, list_case_studies
+from app.api.services.facets import FACET_FIELDS, get_facet_counts
+from app.api.services.page import get_page_by_slug, list_pages
+from app.api.services.service import get_service_by_slug, list_services
+from app.api.services.site_settings import prime_settings_cache
+from app.api.services.view_counts import order_by_popularity
+from app.core.config import settings
+from app.core.deadlines import deadline_scope
+from app.core.metrics import register_metrics_source
+from app.db.session import SessionLocal
+from app.models.enums import ContentStatus
+from app.models.registry import CONTENT_MODELS
+
+logger = logging.getLogger(__name__)
+
+# entity type -> (response schema, slug lookup, list query)
+_WARM_TYPES: Dict[str, Tuple[Any, Callable, Callable]] = {
+    "page": (PageOut, get_page_by_slug, list_pages),
+    "service": (ServiceOut, get_service_by_slug, list_services),
+    "blog": (BlogOut, get_blog_by_slug, list_blogs),
+    "case_study": (CaseStudyOut, get_case_study_by_slug, list_case_studies),
+}
+
+_report: Dict[str, Any] = {}
+
+
+def _warm_content(db: Session, entity_type: str) -> int:
+    schema, get_by_slug, list_items = _WARM_TYPES[entity_type]
+    model = CONTENT_MODELS[entity_type]
+    published = select(model.slug).where(
+        model.is_deleted == False,
+        model.status == ContentStatus.PUBLISHED,
+    )
+    slugs: List[str] = list(
+        db.scalars(
+            order_by_popularity(published, model, entity_type).limit(settings.WARMUP_TOP_ITEMS)
+        )
+    )
+    if slugs:
+        items = db.scalars(select(model).where(model.slug.in_(slugs))).all()
+        for item in items:
+            schema.model_validate(item).model_dump_json()
+        get_by_slug(db, slugs[0])
+    list_items(db, status=ContentStatus.PUBLISHED)
+    return len(slugs)
+
+
+def _steps() -> List[Tuple[str, Callable[[Session], Any]]]:
+    steps: List[Tuple[str, Callable[[Session], Any]]] = [("site_settings", prime_settings_cache)]
+    steps.extend(
+        (f"facets:{entity_type}", lambda db, t=entity_type: len(get_facet_counts(db, t)))
+        for entity_type in FACET_FIELDS
+    )
+    steps.extend(
+        (f"content:{entity_type}", lambda db, t=entity_type: _warm_content(db, t))
+        for entity_type in _WARM_TYPES
+    )
+    return steps
+
+
+def warm_up() -> Dict[str, Any]:
+    """
+    Run the warm-up steps within the time budget.
+
+    Returns:
+        Report with per-step results and timings
+    """
+    started = time.monotonic()
+    budget_ends = started + settings.WARMUP_BUDGET_SECONDS
+    steps: Dict[str, Any] = {}
+
+    with SessionLocal() as db:
+        for name, step in _steps():
+            remaining = budget_ends - time.monotonic()
+            if remaining <= 0:
+                steps[name] = {"skipped": "budget"}
+                continue
+            step_started = time.monotonic()
+            try:
+                with deadline_scope(remaining):
+                    result = step(db)
+                db.commit()
+                steps[name] = {"result": result}
+            except Exception as e:
+                db.rollback()
+                steps[name] = {"error": str(e)}
+                logger.warning(f"Warm-up step {name} failed: {e}")
+            steps[name]["ms"] = round((time.monotonic() - step_started) * 1000, 1)
+
+    _report.clear()
+    _report.update(total_ms=round((time.monotonic() - started) * 1000, 1), steps=steps)
+    return _report
+
+
+register_metrics_source("warmup", lambda: dict(_report))
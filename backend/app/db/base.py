@@ -41,7 +41,6 @@ class UUIDPrimaryKeyMixin:
         default=uuid.uuid4,
         server_default=func.gen_random_uuid(),
         nullable=False,
-        index=True,
         comment="Primary key UUID"
     )
 
@@ -59,7 +58,6 @@ class TimestampMixin:
         default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False,
-        index=True,
         comment="Record creation timestamp"
     )
     
@@ -69,7 +67,6 @@ class TimestampMixin:
         onupdate=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False,
-        index=True,
         comment="Record last update timestamp"
     )
 
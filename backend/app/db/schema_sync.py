@@ -0,0 +1,316 @@
+"""
+Schema synchronisation at boot.
+
+The model metadata, the enum labels and the column patches that
+``create_all`` cannot apply are hashed into a fingerprint. At boot every
+worker reads the stored fingerprint with one query; when it matches, no DDL
+or catalog inspection happens at all.
+
+On a mismatch (first boot, or a deploy that changed the models) the worker
+takes a Postgres advisory lock, re-reads the fingerprint, and only if it is
+still stale applies the DDL and stores the new hash. Workers booting at the
+same time wait on the lock and then find the schema already current, so
+DDL runs exactly once per deploy instead of racing in every process.
+
+``create_all`` only creates the indexes of tables it creates, so the sync
+also builds model indexes missing from existing tables and drops the ones
+listed in ``DROPPED_INDEXES``, both ``CONCURRENTLY`` so that writes carry on
+while a large table is indexed. Those builds can take minutes, so they never
+run in a worker's startup (where gunicorn would kill a worker that misses
+its heartbeat): ``run.py`` runs ``ensure_schema()`` once in the master before
+forking, and ``python -m app.db.schema_sync`` does the same by hand. Workers
+call it with ``build_indexes=False`` and wait at most
+``SCHEMA_LOCK_WAIT_SECONDS`` for the lock.
+
+So that a worker never repeats DDL while index changes are pending, the
+fingerprint has two parts, each stored in its own row: the DDL part (tables,
+enums and patches) and the full schema (DDL plus indexes). A worker that
+finds the DDL part current only logs a warning about the pending indexes.
+"""
+
+import hashlib
+import logging
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Enum, Index, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.core.metrics import Counters, register_metrics_source
+from app.db.base import Base
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary application-wide key for pg_advisory_lock.
+SCHEMA_LOCK_KEY = 4_180_127_331
+
+# Changes ``create_all`` cannot make to objects that already exist. Each must
+# be idempotent; they are part of the fingerprint, so adding one triggers a
+# sync on the next deploy.
+ENUM_PATCHES: Tuple[Tuple[str, str], ...] = (
+    ("content_status", "ALTER TYPE content_status ADD VALUE IF NOT EXISTS 'SCHEDULED'"),
+)
+
+COLUMN_PATCHES: Tuple[str, ...] = (
+    "ALTER TABLE users ADD COLUMN IF NOT EXISTS token_epoch INTEGER NOT NULL DEFAULT 0",
+    # Renumber items whose concurrent writes produced duplicate change-log
+    # versions, so uq_change_log_entity_version can be built.
+    "UPDATE change_log SET version = renumbered.version "
+    "FROM (SELECT id, row_number() OVER (PARTITION BY entity_type, entity_id ORDER BY id) AS version "
+    "FROM change_log WHERE (entity_type, entity_id) IN ("
+    "SELECT entity_type, entity_id FROM change_log "
+    "GROUP BY entity_type, entity_id, version HAVING count(*) > 1)) AS renumbered "
+    "WHERE change_log.id = renumbered.id AND change_log.version <> renumbered.version",
+)
+
+_CONTENT_TABLES = ("pages", "services", "blogs", "case_studies", "jobs")
+
+# Indexes the models no longer declare: single-column indexes the queries
+# never use (or that duplicate a primary key), each of which still cost
+# every write. See the composite and partial indexes next to each model.
+DROPPED_INDEXES: Tuple[str, ...] = (
+    *(
+        f"ix_{table}_{column}"
+        for table in _CONTENT_TABLES
+        for column in (
+            "id", "created_at", "updated_at", "title", "status", "published_at",
+            "created_by", "updated_by", "published_by", "is_deleted",
+        )
+    ),
+    "ix_blogs_author_id",
+    "ix_blogs_category",
+    "ix_case_studies_industry",
+    "ix_jobs_job_type",
+    "ix_pages_template",
+    *(f"ix_{table}_{column}" for table in ("roles", "site_settings") for column in ("id", "created_at", "updated_at")),
+    "ix_users_id",
+    "ix_users_updated_at",
+    "ix_users_is_active",
+    # Superseded by the unique uq_change_log_entity_version.
+    "ix_change_log_entity",
+)
+
+# Rows of the schema_fingerprint table.
+SCHEMA_ROW = 1
+DDL_ROW = 2
+
+_counters = Counters()
+_fingerprint: Optional[str] = None
+_ddl_fingerprint: Optional[str] = None
+
+
+def _compute_fingerprints() -> None:
+    global _fingerprint, _ddl_fingerprint
+
+    import app.models.registry  # noqa: F401  (all models must be mapped)
+
+    dialect = postgresql.dialect()
+    digest = hashlib.sha256()
+    enums = {}
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode("utf-8"))
+        for column in table.columns:
+            if isinstance(column.type, Enum) and column.type.name:
+                enums[column.type.name] = tuple(column.type.enums)
+    for name in sorted(enums):
+        digest.update(f"{name}={','.join(enums[name])}".encode("utf-8"))
+    for _, statement in ENUM_PATCHES:
+        digest.update(statement.encode("utf-8"))
+    for statement in COLUMN_PATCHES:
+        digest.update(statement.encode("utf-8"))
+    _ddl_fingerprint = digest.hexdigest()
+
+    for table in Base.metadata.sorted_tables:
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode("utf-8"))
+    for name in DROPPED_INDEXES:
+        digest.update(name.encode("utf-8"))
+    _fingerprint = digest.hexdigest()
+
+
+def schema_fingerprint() -> str:
+    """SHA-256 over the DDL of every mapped table, index, enum and patch."""
+    if _fingerprint is None:
+        _compute_fingerprints()
+    return _fingerprint
+
+
+def ddl_fingerprint() -> str:
+    """The part of ``schema_fingerprint`` that leaves out indexes."""
+    if _ddl_fingerprint is None:
+        _compute_fingerprints()
+    return _ddl_fingerprint
+
+
+def _stored_fingerprints(connection: Connection) -> Dict[int, str]:
+    try:
+        return dict(connection.execute(text("SELECT id, fingerprint FROM schema_fingerprint")).all())
+    except ProgrammingError:
+        # Table not created yet: a brand-new database.
+        connection.rollback()
+        return {}
+
+
+def _store_fingerprint(connection: Connection, row: int, fingerprint: str) -> None:
+    connection.execute(
+        text(
+            "INSERT INTO schema_fingerprint (id, fingerprint, applied_at) "
+            "VALUES (:id, :fingerprint, now()) "
+            "ON CONFLICT (id) DO UPDATE "
+            "SET fingerprint = EXCLUDED.fingerprint, applied_at = EXCLUDED.applied_at"
+        ),
+        {"id": row, "fingerprint": fingerprint},
+    )
+
+
+def _warn_indexes_pending() -> None:
+    logger.warning(
+        "Schema DDL is current but index changes are pending; they run before workers "
+        "fork in run.py, or via 'python -m app.db.schema_sync'"
+    )
+
+
+def create_index_concurrently(index: Index) -> str:
+    """``CREATE INDEX CONCURRENTLY IF NOT EXISTS`` for a model index."""
+    statement = str(CreateIndex(index, if_not_exists=True).compile(dialect=postgresql.dialect()))
+    return statement.replace(" INDEX ", " INDEX CONCURRENTLY ", 1)
+
+
+def _index_changes(connection: Connection) -> Tuple[List[str], List[Index]]:
+    """Retired indexes still present, and model indexes missing or invalid."""
+    existing = dict(
+        connection.execute(
+            text(
+                "SELECT index_class.relname, ix.indisvalid FROM pg_index ix "
+                "JOIN pg_class index_class ON index_class.oid = ix.indexrelid "
+                "WHERE index_class.relnamespace = CAST(current_schema() AS regnamespace)"
+            )
+        ).all()
+    )
+    retired = [name for name in DROPPED_INDEXES if name in existing]
+    missing = [
+        index
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+        if not existing.get(index.name)
+    ]
+    return retired, missing
+
+
+def _sync_indexes(connection: Connection) -> None:
+    """Drop retired indexes and build missing ones without blocking writes."""
+    retired, missing = _index_changes(connection)
+    for name in retired:
+        connection.exec_driver_sql(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+        _counters.inc("indexes_dropped")
+    for index in missing:
+        # Drops what an interrupted concurrent build left INVALID.
+        connection.exec_driver_sql(f'DROP INDEX CONCURRENTLY IF EXISTS "{index.name}"')
+        logger.info(f"Building index {index.name}")
+        connection.exec_driver_sql(create_index_concurrently(index))
+        _counters.inc("indexes_built")
+
+
+def _apply_ddl(connection: Connection) -> None:
+    """Run the schema DDL, apart from index changes, on an autocommit connection."""
+    # ALTER TYPE ... ADD VALUE cannot run inside a transaction block.
+    for type_name, statement in ENUM_PATCHES:
+        exists = connection.scalar(
+            text("SELECT 1 FROM pg_type WHERE typname = :name"), {"name": type_name}
+        )
+        if exists:
+            connection.execute(text(statement))
+    Base.metadata.create_all(bind=connection)
+    for statement in COLUMN_PATCHES:
+        connection.execute(text(statement))
+
+
+def _acquire_lock(connection: Connection, timeout: Optional[float]) -> bool:
+    if timeout is None:
+        connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+        return True
+    deadline = time.monotonic() + timeout
+    while True:
+        if connection.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": SCHEMA_LOCK_KEY}):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.5)
+
+
+def ensure_schema(build_indexes: bool = True, lock_timeout: Optional[float] = None) -> str:
+    """
+    Bring the database schema up to date if its fingerprint is stale.
+
+    Args:
+        build_indexes: Also drop retired and build missing indexes
+            concurrently. Worker startup passes False.
+        lock_timeout: Seconds to wait for another process holding the schema
+            lock; None waits indefinitely.
+
+    Returns:
+        "current" if nothing was needed, "applied" if this process ran the
+        DDL, "waited" if another process applied it while we held off,
+        "indexes_pending" if the DDL is current but index changes are left
+        for a ``build_indexes`` run, or "busy" if the lock wait timed out
+    """
+    fingerprint = schema_fingerprint()
+    ddl = ddl_fingerprint()
+    with engine.connect() as connection:
+        stored = _stored_fingerprints(connection)
+    if stored.get(SCHEMA_ROW) == fingerprint:
+        _counters.inc("current")
+        return "current"
+    if not build_indexes and stored.get(DDL_ROW) == ddl:
+        _warn_indexes_pending()
+        _counters.inc("indexes_pending")
+        return "indexes_pending"
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        if not _acquire_lock(connection, lock_timeout):
+            logger.warning(
+                f"Schema lock still held after {lock_timeout:.0f}s (another process is applying "
+                "DDL); starting without waiting for it"
+            )
+            _counters.inc("busy")
+            return "busy"
+        try:
+            stored = _stored_fingerprints(connection)
+            if stored.get(SCHEMA_ROW) == fingerprint:
+                _counters.inc("waited")
+                return "waited"
+
+            if stored.get(DDL_ROW) != ddl:
+                logger.info(f"Schema fingerprint changed; applying DDL ({fingerprint[:12]})")
+                _apply_ddl(connection)
+                _store_fingerprint(connection, DDL_ROW, ddl)
+
+            if build_indexes:
+                _sync_indexes(connection)
+            elif any(_index_changes(connection)):
+                _warn_indexes_pending()
+                _counters.inc("indexes_pending")
+                return "indexes_pending"
+            _store_fingerprint(connection, SCHEMA_ROW, fingerprint)
+            _counters.inc("applied")
+            return "applied"
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SCHEMA_LOCK_KEY})
+
+
+register_metrics_source(
+    "schema",
+    lambda: {"fingerprint": _fingerprint, **_counters.snapshot()},
+)
+
+
+if __name__ == "__main__":
+    # Deploy step: apply the schema, including concurrent index builds.
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    print(f"Schema {ensure_schema()}")
+    sys.exit(0)
@@ -8,13 +8,14 @@ Provides:
 - Production-safe defaults
 """
 
-from typing import Generator, Optional, Tuple
+from typing import Any, Generator, Optional, Tuple
 
 from sqlalchemy import create_engine, event, pool
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.core.metrics import Counters, register_metrics_source
 from app.db.base import Base
 
 
@@ -83,6 +84,57 @@ SessionLocal = sessionmaker(
 )
 
 
+# ============================================================================
+# Lazy Request Sessions
+# ============================================================================
+
+_CONNECTED_KEY = "connected"
+
+_session_counters = Counters()
+
+
+@event.listens_for(SessionLocal, "after_begin")
+def _mark_connected(session, transaction, connection) -> None:
+    session.info[_CONNECTED_KEY] = True
+
+
+class LazySession:
+    """
+    Stand-in for a ``Session`` that creates the real one on first use.
+
+    Attribute access is forwarded to a ``SessionLocal()`` session created on
+    demand, so a request whose handler never touches the database (a cache
+    hit, a token-only auth check) neither builds a session nor checks out a
+    pooled connection.
+    """
+
+    __slots__ = ("_session",)
+
+    def __init__(self) -> None:
+        self._session: Optional[Session] = None
+
+    @property
+    def used(self) -> bool:
+        return self._session is not None
+
+    def _materialize(self) -> Session:
+        if self._session is None:
+            self._session = SessionLocal()
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._materialize(), name)
+
+    def close(self) -> None:
+        session = self._session
+        if session is None:
+            _session_counters.inc("requests_without_session")
+            return
+        connected = session.info.get(_CONNECTED_KEY, False)
+        _session_counters.inc("requests_connected" if connected else "requests_session_only")
+        session.close()
+
+
 # ============================================================================
 # FastAPI Dependency
 # ============================================================================
@@ -91,8 +143,9 @@ def get_db() -> Generator[Session, None, None]:
     """
     FastAPI dependency to get database session.
     
-    Creates a new session for each request and ensures it's closed
-    after the request completes, even if an error occurs.
+    Yields a ``LazySession``: the underlying session (and its pooled
+    connection) is only created if the request actually uses it. The session
+    is closed after the request completes, even if an error occurs.
     
     Usage in FastAPI:
         @app.get("/users")
@@ -102,13 +155,16 @@ def get_db() -> Generator[Session, None, None]:
     Yields:
         Database session
     """
-    db = SessionLocal()
+    db = LazySession()
     try:
         yield db
     finally:
         db.close()
 
 
+register_metrics_source("db_sessions", _session_counters.snapshot)
+
+
 # ============================================================================
 # Database Initialization
 # ============================================================================
@@ -150,15 +206,20 @@ def check_db_connection() -> Tuple[bool, Optional[str]]:
             connection.execute(text("SELECT 1"))
         return True, None
     except Exception as e:
-        error_msg = str(e)
-        # Provide more helpful error messages for common issues
-        if "could not connect" in error_msg.lower() or "connection refused" in error_msg.lower():
-            error_msg = f"Database server is not running or unreachable: {error_msg}"
-        elif "authentication failed" in error_msg.lower():
-            error_msg = f"Database authentication failed. Check username/password: {error_msg}"
-        elif "does not exist" in error_msg.lower():
-            error_msg = f"Database does not exist. Create it first: {error_msg}"
-        return False, error_msg
+        return False, describe_db_error(e)
+
+
+def describe_db_error(error: Exception) -> str:
+    """Connection error message with a hint for common causes."""
+    error_msg = str(error)
+    # Provide more helpful error messages for common issues
+    if "could not connect" in error_msg.lower() or "connection refused" in error_msg.lower():
+        error_msg = f"Database server is not running or unreachable: {error_msg}"
+    elif "authentication failed" in error_msg.lower():
+        error_msg = f"Database authentication failed. Check username/password: {error_msg}"
+    elif "does not exist" in error_msg.lower():
+        error_msg = f"Database does not exist. Create it first: {error_msg}"
+    return error_msg
 
 
 def get_db_stats() -> dict:
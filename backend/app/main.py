@@ -5,22 +5,26 @@ Creates and configures the FastAPI application with:
 - Settings from core.config
 - Startup and shutdown events
 - Health check router
-- CORS middleware
+- Request logging, deadline, admission control and CORS middleware
 - Structured logging
 """
 
 import logging
-import sys
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api.routes.page import router as page_router
 from app.api.routes.service import router as service_router
 from app.auth.routes import router as auth_router
+from app.core.admission import AdmissionControlMiddleware
 from app.core.config import settings
+from app.core.deadlines import DeadlineExceededError, DeadlineMiddleware
 from app.core.events import register_lifecycle_events
+from app.core.log_pipeline import JSONFormatter, log_pipeline
+from app.core.request_log import RequestLogMiddleware
 from app.utils.health import router as health_router
 
 
@@ -35,48 +39,16 @@ def setup_logging() -> None:
     Sets up logging based on configuration:
     - LOG_LEVEL: Controls verbosity
     - LOG_FORMAT: json or text format
+    - LOG_QUEUE_SIZE / LOG_SAMPLE_RATES: see app.core.log_pipeline
     
     Provides specific loggers for different modules:
     - app.*: Application-specific modules
     - uvicorn: Server logs
     - sqlalchemy: Database queries
     """
-    import json
-    
     # Determine log format
     if settings.LOG_FORMAT.lower() == "json":
         # JSON format for production (structured logging)
-        class JSONFormatter(logging.Formatter):
-            """JSON formatter for structured logging."""
-            
-            def format(self, record: logging.LogRecord) -> str:
-                log_data = {
-                    "timestamp": self.formatTime(record, self.datefmt),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "module": record.module,
-                    "function": record.funcName,
-                    "line": record.lineno,
-                    "message": record.getMessage(),
-                }
-                
-                # Add exception info if present
-                if record.exc_info:
-                    log_data["exception"] = self.formatException(record.exc_info)
-                    log_data["exception_type"] = record.exc_info[0].__name__ if record.exc_info else None
-                
-                # Add extra fields if present
-                if hasattr(record, "extra"):
-                    log_data.update(record.extra)
-                
-                # Add request context if available
-                if hasattr(record, "request_id"):
-                    log_data["request_id"] = record.request_id
-                if hasattr(record, "user_id"):
-                    log_data["user_id"] = record.user_id
-                
-                return json.dumps(log_data)
-        
         formatter = JSONFormatter()
     else:
         # Colorful text format for development (human-readable)
@@ -146,14 +118,11 @@ def setup_logging() -> None:
                 datefmt="%Y-%m-%d %H:%M:%S"
             )
     
-    # Configure root logger
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    
+    # Configure root logger: records are queued and written to stdout by a
+    # background thread, so logging never blocks the event loop
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
-    root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    log_pipeline.install(formatter, root_logger)
     
     # Application-specific loggers with specific levels
     app_logger = logging.getLogger("app")
@@ -227,6 +196,24 @@ def create_app() -> FastAPI:
     # Middleware
     # ========================================================================
     
+    # Request deadlines, enforced on the database as statement_timeout.
+    # Added first so it runs inside admission control: queueing time is
+    # bounded separately and does not eat into the query budget.
+    app.add_middleware(DeadlineMiddleware)
+    
+    @app.exception_handler(DeadlineExceededError)
+    async def deadline_exceeded_handler(request: Request, exc: DeadlineExceededError):
+        return JSONResponse(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            content={"detail": str(exc)},
+        )
+    
+    # Per-route-class concurrency limits; added before CORS so that 503
+    # responses still carry CORS headers
+    if settings.ADMISSION_ENABLED:
+        app.add_middleware(AdmissionControlMiddleware)
+        logger.info("Admission control middleware configured")
+    
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -241,11 +228,15 @@ def create_app() -> FastAPI:
     async def add_cache_control(request, call_next):
         response = await call_next(request)
         if request.method == "GET" and request.url.path.startswith("/cms/"):
-            response.headers["Cache-Control"] = "public, max-age=60, stale-while-revalidate=120"
+            response.headers.setdefault("Cache-Control", "public, max-age=60, stale-while-revalidate=120")
         return response
 
     logger.info("CORS middleware configured")
     
+    # Request ids and per-request summary logs; outermost so timings cover
+    # queueing and every other middleware
+    app.add_middleware(RequestLogMiddleware)
+    
     # ========================================================================
     # Event Handlers
     # ========================================================================
@@ -297,6 +288,18 @@ def create_app() -> FastAPI:
     app.include_router(site_settings_router)
     logger.info("CMS site settings router registered")
     
+    from app.api.routes.changes import router as changes_router
+    app.include_router(changes_router)
+    logger.info("CMS change feed router registered")
+    
+    from app.api.routes.feeds import router as feeds_router
+    app.include_router(feeds_router)
+    logger.info("Sitemap and feed router registered")
+    
+    from app.api.routes.archive import router as archive_router
+    app.include_router(archive_router)
+    logger.info("CMS archive router registered")
+    
     # TODO: Add API routers here when ready
     # Example:
     # from app.api.v1 import api_router
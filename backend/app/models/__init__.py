@@ -5,7 +5,7 @@ This package contains all database models.
 """
 
 # Import enums
-from app.models.enums import ContentStatus, ContentStatusEnum  # noqa: F401
+from app.models.enums import ChangeOp, ContentStatus, ContentStatusEnum  # noqa: F401
 
 # Import models here to ensure they're registered with SQLAlchemy
 from app.models.user import User  # noqa: F401
@@ -15,4 +15,13 @@ from app.models.rbac import UserRole, RolePermission  # noqa: F401
 from app.models.service import Service  # noqa: F401
 from app.models.page import Page  # noqa: F401
 from app.models.case_study import CaseStudy  # noqa: F401
-from app.models.site_settings import SiteSettings  # noqa: F401
\ No newline at end of file
+from app.models.site_settings import SiteSettings  # noqa: F401
+from app.models.change_log import ChangeLog  # noqa: F401
+from app.models.task import Task  # noqa: F401
+from app.models.view_count import ContentViewCount  # noqa: F401
+from app.models.related_content import RelatedContent  # noqa: F401
+from app.models.facet_count import ContentFacetCount  # noqa: F401
+from app.models.revision import ContentRevision  # noqa: F401
+from app.models.content_archive import ContentArchive  # noqa: F401
+from app.models.refresh_token import RefreshToken  # noqa: F401
+from app.models.schema_fingerprint import SchemaFingerprint  # noqa: F401
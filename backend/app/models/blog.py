@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,8 +22,7 @@ class Blog(BaseModel):
     
     title: Mapped[str] = mapped_column(
         String(255),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     excerpt: Mapped[Optional[str]] = mapped_column(
@@ -43,14 +42,12 @@ class Blog(BaseModel):
     
     author_id: Mapped[UUID] = mapped_column(
         ForeignKey("users.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     category: Mapped[Optional[str]] = mapped_column(
         String(100),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     tags: Mapped[Optional[List[str]]] = mapped_column(
@@ -61,14 +58,12 @@ class Blog(BaseModel):
     status: Mapped[ContentStatus] = mapped_column(
         ContentStatusEnum,
         default=ContentStatus.DRAFT,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     published_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     meta_title: Mapped[Optional[str]] = mapped_column(
@@ -93,27 +88,23 @@ class Blog(BaseModel):
     
     created_by: Mapped[UUID] = mapped_column(
         ForeignKey("users.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     updated_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     published_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     is_deleted: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     author: Mapped["User"] = relationship(
@@ -139,3 +130,55 @@ class Blog(BaseModel):
         foreign_keys=[published_by],
         back_populates="published_blogs"
     )
+    
+    related_content: Mapped[Optional["RelatedContent"]] = relationship(
+        "RelatedContent",
+        primaryjoin="and_(foreign(RelatedContent.entity_id) == Blog.id, "
+        "RelatedContent.entity_type == 'blog')",
+        viewonly=True,
+        uselist=False
+    )
+    
+    @property
+    def related(self) -> List[Dict[str, Any]]:
+        """Precomputed related items (empty until the first refresh)."""
+        return self.related_content.items if self.related_content else []
+
+
+# Scheduled items only: loaded by the publish scheduler at startup.
+Index(
+    "ix_blogs_scheduled_publish",
+    Blog.published_at,
+    postgresql_where=(Blog.status == ContentStatus.SCHEDULED) & (Blog.is_deleted == False),
+)
+
+# List queries: is_deleted = false AND status = ? ORDER BY created_at DESC.
+# Also answers published counts for the sitemap from the index alone.
+Index(
+    "ix_blogs_live_status_created",
+    Blog.status,
+    Blog.created_at,
+    postgresql_where=Blog.is_deleted == False,
+)
+
+# Admin list queries without a status filter, newest first.
+Index(
+    "ix_blogs_live_created",
+    Blog.created_at,
+    postgresql_where=Blog.is_deleted == False,
+)
+
+# Archival: soft-deleted rows by deletion time (app/api/services/archive.py).
+Index(
+    "ix_blogs_tombstones",
+    Blog.updated_at,
+    postgresql_where=Blog.is_deleted == True,
+)
+
+# RSS feed: published blogs, most recently published first.
+Index(
+    "ix_blogs_published_feed",
+    Blog.published_at.desc().nulls_last(),
+    Blog.created_at.desc(),
+    postgresql_where=(Blog.status == ContentStatus.PUBLISHED) & (Blog.is_deleted == False),
+)
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,8 +22,7 @@ class CaseStudy(BaseModel):
     
     title: Mapped[str] = mapped_column(
         String(255),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     client_name: Mapped[Optional[str]] = mapped_column(
@@ -73,8 +72,7 @@ class CaseStudy(BaseModel):
     
     industry: Mapped[Optional[str]] = mapped_column(
         String(100),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     tags: Mapped[Optional[List[str]]] = mapped_column(
@@ -85,14 +83,12 @@ class CaseStudy(BaseModel):
     status: Mapped[ContentStatus] = mapped_column(
         ContentStatusEnum,
         default=ContentStatus.DRAFT,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     published_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     meta_title: Mapped[Optional[str]] = mapped_column(
@@ -117,27 +113,23 @@ class CaseStudy(BaseModel):
     
     created_by: Mapped[UUID] = mapped_column(
         ForeignKey("users.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     updated_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     published_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     is_deleted: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     creator: Mapped["User"] = relationship(
@@ -157,3 +149,61 @@ class CaseStudy(BaseModel):
         foreign_keys=[published_by],
         back_populates="published_case_studies"
     )
+    
+    related_content: Mapped[Optional["RelatedContent"]] = relationship(
+        "RelatedContent",
+        primaryjoin="and_(foreign(RelatedContent.entity_id) == CaseStudy.id, "
+        "RelatedContent.entity_type == 'case_study')",
+        viewonly=True,
+        uselist=False
+    )
+    
+    @property
+    def related(self) -> List[Dict[str, Any]]:
+        """Precomputed related items (empty until the first refresh)."""
+        return self.related_content.items if self.related_content else []
+
+
+# Scheduled items only: loaded by the publish scheduler at startup.
+Index(
+    "ix_case_studies_scheduled_publish",
+    CaseStudy.published_at,
+    postgresql_where=(CaseStudy.status == ContentStatus.SCHEDULED) & (CaseStudy.is_deleted == False),
+)
+
+# List queries: is_deleted = false AND status = ? ORDER BY created_at DESC.
+# Also answers published counts for the sitemap from the index alone.
+Index(
+    "ix_case_studies_live_status_created",
+    CaseStudy.status,
+    CaseStudy.created_at,
+    postgresql_where=CaseStudy.is_deleted == False,
+)
+
+# Admin list queries without a status filter, newest first.
+Index(
+    "ix_case_studies_live_created",
+    CaseStudy.created_at,
+    postgresql_where=CaseStudy.is_deleted == False,
+)
+
+# Archival: soft-deleted rows by deletion time (app/api/services/archive.py).
+Index(
+    "ix_case_studies_tombstones",
+    CaseStudy.updated_at,
+    postgresql_where=CaseStudy.is_deleted == True,
+)
+
+# Category filter: industry = ? OR tags @> ARRAY[?], combined as a BitmapOr.
+Index(
+    "ix_case_studies_live_industry",
+    CaseStudy.industry,
+    postgresql_where=CaseStudy.is_deleted == False,
+)
+
+Index(
+    "ix_case_studies_live_tags",
+    CaseStudy.tags,
+    postgresql_using="gin",
+    postgresql_where=CaseStudy.is_deleted == False,
+)
@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Integer, String, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ChangeLog(Base):
+    """
+    Append-only log of content writes.
+
+    One row is written in the same transaction as every create/update/delete
+    of a content item or site setting. The bigint identity doubles as the
+    cursor handed out by ``/cms/changes``; ``version`` counts the changes of
+    one item and is unique per item.
+    """
+    __tablename__ = "change_log"
+    
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(always=False),
+        primary_key=True
+    )
+    
+    entity_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False
+    )
+    
+    entity_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=False
+    )
+    
+    slug: Mapped[Optional[str]] = mapped_column(
+        String(255),
+        nullable=True
+    )
+    
+    op: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False
+    )
+    
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1
+    )
+    
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    
+    __table_args__ = (
+        Index(
+            "uq_change_log_entity_version",
+            "entity_type", "entity_id", "version",
+            unique=True
+        ),
+    )
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index, String, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ContentArchive(Base):
+    """
+    A soft-deleted content item moved out of its hot table.
+
+    ``data`` is the complete row as ``to_jsonb`` produced it, so restoring
+    re-inserts exactly what was archived. ``deleted_at`` is the row's
+    ``updated_at`` at archival time (deleted items cannot be edited, so that
+    is when it was deleted). Rows are written by the ``content.archive``
+    background task (``app.api.services.archive``).
+    """
+    __tablename__ = "content_archive"
+    
+    entity_type: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True
+    )
+    
+    entity_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True
+    )
+    
+    slug: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False
+    )
+    
+    title: Mapped[Optional[str]] = mapped_column(
+        String(255),
+        nullable=True
+    )
+    
+    data: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False
+    )
+    
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
+    
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+
+Index("ix_content_archive_type_archived", ContentArchive.entity_type, ContentArchive.archived_at)
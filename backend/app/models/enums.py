@@ -7,6 +7,13 @@ class ContentStatus(str, enum.Enum):
     DRAFT = "draft"
     PUBLISHED = "published"
     ARCHIVED = "archived"
+    SCHEDULED = "scheduled"
+
+
+class ChangeOp(str, enum.Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
 
 
 ContentStatusEnum = PG_ENUM(
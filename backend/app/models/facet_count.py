@@ -0,0 +1,35 @@
+from sqlalchemy import Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ContentFacetCount(Base):
+    """
+    Number of published items per facet value (tag, category, industry).
+
+    Maintained incrementally by ``app.api.services.facets`` in the same
+    transaction as each content write, so facet chips never scan content rows.
+    """
+    __tablename__ = "content_facet_counts"
+    
+    entity_type: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True
+    )
+    
+    facet: Mapped[str] = mapped_column(
+        String(20),
+        primary_key=True
+    )
+    
+    value: Mapped[str] = mapped_column(
+        Text,
+        primary_key=True
+    )
+    
+    count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,12 +22,10 @@ class Job(BaseModel):
     title: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        index=True,
     )
     job_type: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,
         default="permanent",
     )  # internship | permanent
     location: Mapped[Optional[str]] = mapped_column(
@@ -54,33 +52,27 @@ class Job(BaseModel):
         ContentStatusEnum,
         default=ContentStatus.DRAFT,
         nullable=False,
-        index=True,
     )
     published_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
-        index=True,
     )
     created_by: Mapped[UUID] = mapped_column(
         ForeignKey("users.id"),
         nullable=False,
-        index=True,
     )
     updated_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"),
         nullable=True,
-        index=True,
     )
     published_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"),
         nullable=True,
-        index=True,
     )
     is_deleted: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
         nullable=False,
-        index=True,
     )
 
     creator: Mapped["User"] = relationship(
@@ -98,3 +90,34 @@ class Job(BaseModel):
         foreign_keys=[published_by],
         back_populates="published_jobs",
     )
+
+
+# Scheduled items only: loaded by the publish scheduler at startup.
+Index(
+    "ix_jobs_scheduled_publish",
+    Job.published_at,
+    postgresql_where=(Job.status == ContentStatus.SCHEDULED) & (Job.is_deleted == False),
+)
+
+# List queries: is_deleted = false AND status = ? ORDER BY created_at DESC.
+# Also answers published counts for the sitemap from the index alone.
+Index(
+    "ix_jobs_live_status_created",
+    Job.status,
+    Job.created_at,
+    postgresql_where=Job.is_deleted == False,
+)
+
+# Admin list queries without a status filter, newest first.
+Index(
+    "ix_jobs_live_created",
+    Job.created_at,
+    postgresql_where=Job.is_deleted == False,
+)
+
+# Archival: soft-deleted rows by deletion time (app/api/services/archive.py).
+Index(
+    "ix_jobs_tombstones",
+    Job.updated_at,
+    postgresql_where=Job.is_deleted == True,
+)
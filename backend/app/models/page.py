@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,8 +22,7 @@ class Page(BaseModel):
     
     title: Mapped[str] = mapped_column(
         String(255),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     content: Mapped[Dict[str, Any]] = mapped_column(
@@ -33,21 +32,18 @@ class Page(BaseModel):
     
     template: Mapped[Optional[str]] = mapped_column(
         String(100),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     status: Mapped[ContentStatus] = mapped_column(
         ContentStatusEnum,
         default=ContentStatus.DRAFT,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     published_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     meta_title: Mapped[Optional[str]] = mapped_column(
@@ -72,27 +68,23 @@ class Page(BaseModel):
     
     created_by: Mapped[UUID] = mapped_column(
         ForeignKey("users.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     updated_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     published_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     is_deleted: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     creator: Mapped["User"] = relationship(
@@ -112,3 +104,34 @@ class Page(BaseModel):
         foreign_keys=[published_by],
         back_populates="published_pages"
     )
+
+
+# Scheduled items only: loaded by the publish scheduler at startup.
+Index(
+    "ix_pages_scheduled_publish",
+    Page.published_at,
+    postgresql_where=(Page.status == ContentStatus.SCHEDULED) & (Page.is_deleted == False),
+)
+
+# List queries: is_deleted = false AND status = ? ORDER BY created_at DESC.
+# Also answers published counts for the sitemap from the index alone.
+Index(
+    "ix_pages_live_status_created",
+    Page.status,
+    Page.created_at,
+    postgresql_where=Page.is_deleted == False,
+)
+
+# Admin list queries without a status filter, newest first.
+Index(
+    "ix_pages_live_created",
+    Page.created_at,
+    postgresql_where=Page.is_deleted == False,
+)
+
+# Archival: soft-deleted rows by deletion time (app/api/services/archive.py).
+Index(
+    "ix_pages_tombstones",
+    Page.updated_at,
+    postgresql_where=Page.is_deleted == True,
+)
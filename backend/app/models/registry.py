@@ -3,19 +3,37 @@ import logging
 from app.db.base import Base
 
 from app.models.case_study import CaseStudy
+from app.models.change_log import ChangeLog
+from app.models.content_archive import ContentArchive
 from app.models.blog import Blog
 from app.models.job import Job
 from app.models.enums import ContentStatus, ContentStatusEnum
+from app.models.facet_count import ContentFacetCount
 from app.models.page import Page
 from app.models.permission import Permission
 from app.models.rbac import RolePermission, UserRole
+from app.models.refresh_token import RefreshToken
+from app.models.related_content import RelatedContent
+from app.models.revision import ContentRevision
 from app.models.role import Role
+from app.models.schema_fingerprint import SchemaFingerprint
 from app.models.service import Service
+from app.models.task import Task
 from app.models.user import User
+from app.models.view_count import ContentViewCount
 from app.models.site_settings import SiteSettings
 
 logger = logging.getLogger(__name__)
 
+# Content types addressable by entity_type in the change feed, scheduler, etc.
+CONTENT_MODELS = {
+    "page": Page,
+    "service": Service,
+    "blog": Blog,
+    "case_study": CaseStudy,
+    "job": Job,
+}
+
 _registered_tables = sorted(Base.metadata.tables.keys())
 logger.info(f"Models registered successfully: {len(_registered_tables)} tables")
 logger.debug(f"Registered tables: {', '.join(_registered_tables)}")
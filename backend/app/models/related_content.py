@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class RelatedContent(Base):
+    """
+    Precomputed related items for one content item.
+
+    ``items`` holds the top-k most similar published items, most similar
+    first, as ``{"type", "id", "slug", "title", "score"}`` objects so a
+    detail response needs a single primary-key lookup. Rows are rebuilt by
+    the ``related.refresh`` background task.
+    """
+    __tablename__ = "related_content"
+    
+    entity_type: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True
+    )
+    
+    entity_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True
+    )
+    
+    items: Mapped[List[Dict[str, Any]]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=list
+    )
+    
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
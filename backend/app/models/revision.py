@@ -0,0 +1,101 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Integer,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ContentRevision(Base):
+    """
+    One saved revision of a content item's editable fields.
+
+    Keyframe rows store the full snapshot; other rows store a JSON patch
+    against ``base_revision`` (a skip-delta base, see
+    ``app.api.services.revisions``). ``data`` is compressed with ``codec``.
+    """
+    __tablename__ = "content_revisions"
+    
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(always=False),
+        primary_key=True
+    )
+    
+    entity_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False
+    )
+    
+    entity_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=False
+    )
+    
+    revision: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False
+    )
+    
+    is_keyframe: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False
+    )
+    
+    base_revision: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True
+    )
+    
+    codec: Mapped[str] = mapped_column(
+        String(10),
+        nullable=False
+    )
+    
+    data: Mapped[bytes] = mapped_column(
+        LargeBinary,
+        nullable=False
+    )
+    
+    checksum: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False
+    )
+    
+    size_raw: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False
+    )
+    
+    created_by: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey("users.id"),
+        nullable=True
+    )
+    
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    
+    __table_args__ = (
+        UniqueConstraint(
+            "entity_type", "entity_id", "revision",
+            name="uq_content_revisions_entity_revision"
+        ),
+    )
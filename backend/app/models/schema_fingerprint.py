@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SchemaFingerprint(Base):
+    """
+    Hash of the schema the database was last brought up to.
+
+    Written by ``app.db.schema_sync``: row ``id = 1`` holds the full schema
+    hash, stored once DDL and index changes are applied; row ``id = 2`` the
+    hash of the DDL alone. Workers compare them with the hashes of the
+    loaded models at boot and skip schema work when they match.
+    """
+    __tablename__ = "schema_fingerprint"
+    
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True
+    )
+    
+    fingerprint: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False
+    )
+    
+    applied_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,8 +22,7 @@ class Service(BaseModel):
     
     title: Mapped[str] = mapped_column(
         String(255),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     subtitle: Mapped[Optional[str]] = mapped_column(
@@ -54,14 +53,12 @@ class Service(BaseModel):
     status: Mapped[ContentStatus] = mapped_column(
         ContentStatusEnum,
         default=ContentStatus.DRAFT,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     published_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     meta_title: Mapped[Optional[str]] = mapped_column(
@@ -86,27 +83,23 @@ class Service(BaseModel):
     
     created_by: Mapped[UUID] = mapped_column(
         ForeignKey("users.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     updated_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     published_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     is_deleted: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     creator: Mapped["User"] = relationship(
@@ -126,3 +119,47 @@ class Service(BaseModel):
         foreign_keys=[published_by],
         back_populates="published_services"
     )
+    
+    related_content: Mapped[Optional["RelatedContent"]] = relationship(
+        "RelatedContent",
+        primaryjoin="and_(foreign(RelatedContent.entity_id) == Service.id, "
+        "RelatedContent.entity_type == 'service')",
+        viewonly=True,
+        uselist=False
+    )
+    
+    @property
+    def related(self) -> List[Dict[str, Any]]:
+        """Precomputed related items (empty until the first refresh)."""
+        return self.related_content.items if self.related_content else []
+
+
+# Scheduled items only: loaded by the publish scheduler at startup.
+Index(
+    "ix_services_scheduled_publish",
+    Service.published_at,
+    postgresql_where=(Service.status == ContentStatus.SCHEDULED) & (Service.is_deleted == False),
+)
+
+# List queries: is_deleted = false AND status = ? ORDER BY created_at DESC.
+# Also answers published counts for the sitemap from the index alone.
+Index(
+    "ix_services_live_status_created",
+    Service.status,
+    Service.created_at,
+    postgresql_where=Service.is_deleted == False,
+)
+
+# Admin list queries without a status filter, newest first.
+Index(
+    "ix_services_live_created",
+    Service.created_at,
+    postgresql_where=Service.is_deleted == False,
+)
+
+# Archival: soft-deleted rows by deletion time (app/api/services/archive.py).
+Index(
+    "ix_services_tombstones",
+    Service.updated_at,
+    postgresql_where=Service.is_deleted == True,
+)
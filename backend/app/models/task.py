@@ -0,0 +1,118 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TaskStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    FAILED = "failed"
+
+
+# Predicate of the partial unique index on dedup_key; ON CONFLICT must repeat it.
+PENDING_DEDUP_PREDICATE = text("dedup_key IS NOT NULL AND status = 'pending'")
+
+
+class Task(Base):
+    """
+    Durable background task.
+
+    Rows are claimed by workers with ``SELECT ... FOR UPDATE SKIP LOCKED``
+    and deleted on success; exhausted tasks are kept with status ``failed``.
+    """
+    __tablename__ = "tasks"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(always=False),
+        primary_key=True
+    )
+
+    name: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False
+    )
+
+    payload: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default=TaskStatus.PENDING
+    )
+
+    dedup_key: Mapped[Optional[str]] = mapped_column(
+        String(255),
+        nullable=True
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
+
+    max_attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=5
+    )
+
+    run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    locked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+
+    locked_by: Mapped[Optional[str]] = mapped_column(
+        String(100),
+        nullable=True
+    )
+
+    last_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    __table_args__ = (
+        # Claim path: oldest runnable task first.
+        Index(
+            "ix_tasks_pending_run_at",
+            "run_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # Stale-lock recovery path.
+        Index(
+            "ix_tasks_running_locked_at",
+            "locked_at",
+            postgresql_where=text("status = 'running'"),
+        ),
+        # At most one pending task per dedup key. Running tasks are excluded so
+        # that work enqueued while a task runs is not lost.
+        Index(
+            "uq_tasks_pending_dedup_key",
+            "dedup_key",
+            unique=True,
+            postgresql_where=PENDING_DEDUP_PREDICATE,
+        ),
+    )
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, List, Optional
 if TYPE_CHECKING:
     from app.models.job import Job
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import BaseModel
@@ -50,8 +50,7 @@ class User(BaseModel):
     is_active: Mapped[bool] = mapped_column(
         Boolean,
         default=True,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     is_email_verified: Mapped[bool] = mapped_column(
@@ -65,6 +64,14 @@ class User(BaseModel):
         nullable=True
     )
     
+    # Bumped to revoke every access token issued before the change.
+    token_epoch: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False
+    )
+    
     user_roles: Mapped[List["UserRole"]] = relationship(
         "UserRole",
         foreign_keys="UserRole.user_id",
@@ -183,3 +190,7 @@ class User(BaseModel):
         back_populates="publisher",
         lazy="dynamic"
     )
+
+
+# User list, newest first.
+Index("ix_users_created_at", User.created_at)
@@ -0,0 +1,41 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ContentViewCount(Base):
+    """
+    Aggregated public view count per content item.
+
+    Kept out of the content tables so that counting views never rewrites
+    content rows. Written only by the batched flush in
+    ``app.core.view_counts``.
+    """
+    __tablename__ = "content_view_counts"
+    
+    entity_type: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True
+    )
+    
+    entity_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True
+    )
+    
+    views: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0
+    )
+    
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
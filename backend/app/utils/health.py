@@ -4,17 +4,22 @@ Health check router for monitoring application status.
 Provides:
 - Basic health check endpoint
 - Application status and metadata
+- Per-process metrics and task queue depth
 - No authentication required
 """
 
 from datetime import datetime, timezone
-from typing import Dict, Literal
+from typing import Any, Dict, Literal
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.metrics import collect_metrics
+from app.core.tasks import get_queue_depth
 from app.db.session import check_db_connection as _check_db_connection
+from app.db.session import get_db
 
 router = APIRouter(
     prefix="/health",
@@ -121,3 +126,37 @@ async def detailed_health_check() -> DetailedHealthResponse:
             "connected": db_healthy
         }
     )
+
+
+@router.get(
+    "/metrics",
+    response_model=Dict[str, Any],
+    summary="Process metrics",
+    description="Returns in-process counters from every registered metrics source"
+)
+async def metrics() -> Dict[str, Any]:
+    """
+    Metrics endpoint.
+    
+    Values are per worker process; aggregate across workers externally.
+    
+    Returns:
+        Mapping of metrics source name to its snapshot
+    """
+    return collect_metrics()
+
+
+@router.get(
+    "/tasks",
+    response_model=Dict[str, int],
+    summary="Task queue depth",
+    description="Returns the number of background tasks per status"
+)
+async def task_queue_depth(db: Session = Depends(get_db)) -> Dict[str, int]:
+    """
+    Task queue depth endpoint.
+    
+    Returns:
+        Mapping of task status to count
+    """
+    return get_queue_depth(db)
@@ -0,0 +1,153 @@
+"""
+Minimal RFC 6902 JSON Patch support.
+
+``make_patch`` produces ``add``/``remove``/``replace`` operations that turn
+one JSON document into another; ``apply_patch`` applies them. Lists are
+diffed by trimming the common prefix and suffix and aligning the rest with
+``difflib``, which keeps block-editor saves (a few blocks edited, inserted,
+removed or moved) small.
+"""
+
+import copy
+import json
+from difflib import SequenceMatcher
+from typing import Any, Dict, List
+
+Patch = List[Dict[str, Any]]
+
+
+class JsonPatchError(Exception):
+    pass
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(source: Any, target: Any) -> Patch:
+    """Return operations transforming ``source`` into ``target``."""
+    operations: Patch = []
+    _diff(source, target, "", operations)
+    return operations
+
+
+def _diff(source: Any, target: Any, path: str, operations: Patch) -> None:
+    if type(source) is not type(target):
+        operations.append({"op": "replace", "path": path, "value": target})
+        return
+
+    if isinstance(source, dict):
+        for key in source:
+            if key not in target:
+                operations.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in target.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in source:
+                operations.append({"op": "add", "path": child, "value": value})
+            elif source[key] != value:
+                _diff(source[key], value, child, operations)
+        return
+
+    if isinstance(source, list):
+        _diff_list(source, target, path, operations)
+        return
+
+    if source != target:
+        operations.append({"op": "replace", "path": path, "value": target})
+
+
+def _diff_list(source: list, target: list, path: str, operations: Patch) -> None:
+    prefix = 0
+    limit = min(len(source), len(target))
+    while prefix < limit and source[prefix] == target[prefix]:
+        prefix += 1
+
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and source[len(source) - 1 - suffix] == target[len(target) - 1 - suffix]
+    ):
+        suffix += 1
+
+    old = source[prefix:len(source) - suffix]
+    new = target[prefix:len(target) - suffix]
+
+    # Align the changed middle so a block inserted or removed near the top
+    # doesn't turn into a replace of every following element. Operations are
+    # emitted left to right, tracking how far earlier ones shifted indices.
+    matcher = SequenceMatcher(None, [_key(v) for v in old], [_key(v) for v in new], autojunk=False)
+    shift = 0
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        base = prefix + i1 + shift
+        if tag == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        for offset in range(paired):
+            _diff(old[i1 + offset], new[j1 + offset], f"{path}/{base + offset}", operations)
+        for _ in range(i2 - i1 - paired):
+            operations.append({"op": "remove", "path": f"{path}/{base + paired}"})
+        for offset in range(paired, j2 - j1):
+            operations.append({"op": "add", "path": f"{path}/{base + offset}", "value": new[j1 + offset]})
+        shift += (j2 - j1) - (i2 - i1)
+
+
+def _key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def apply_patch(document: Any, operations: Patch, in_place: bool = False) -> Any:
+    """Apply operations to a document (a deep copy unless ``in_place``)."""
+    if not in_place:
+        document = copy.deepcopy(document)
+    for operation in operations:
+        document = _apply_one(document, operation)
+    return document
+
+
+def _apply_one(document: Any, operation: Dict[str, Any]) -> Any:
+    op = operation.get("op")
+    path = operation.get("path", "")
+    if path == "":
+        if op in ("add", "replace"):
+            return copy.deepcopy(operation["value"])
+        raise JsonPatchError(f"Cannot {op} the document root")
+
+    tokens = [_unescape(token) for token in path.split("/")[1:]]
+    parent = document
+    try:
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+    except (KeyError, IndexError, ValueError, TypeError) as e:
+        raise JsonPatchError(f"Invalid path '{path}'") from e
+
+    last = tokens[-1]
+    value = copy.deepcopy(operation.get("value"))
+    try:
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if op == "add":
+                parent.insert(index, value)
+            elif op == "replace":
+                parent[index] = value
+            elif op == "remove":
+                del parent[index]
+            else:
+                raise JsonPatchError(f"Unsupported operation '{op}'")
+        elif isinstance(parent, dict):
+            if op in ("add", "replace"):
+                if op == "replace" and last not in parent:
+                    raise JsonPatchError(f"Invalid path '{path}'")
+                parent[last] = value
+            elif op == "remove":
+                del parent[last]
+            else:
+                raise JsonPatchError(f"Unsupported operation '{op}'")
+        else:
+            raise JsonPatchError(f"Invalid path '{path}'")
+    except (KeyError, IndexError, ValueError) as e:
+        raise JsonPatchError(f"Invalid path '{path}'") from e
+    return document
@@ -0,0 +1,31 @@
+"""
+Endpoint benchmark suite.
+
+Run from the backend directory against a disposable local database:
+
+    # 1. Seed a synthetic corpus with COPY (defaults: 100k blogs,
+    #    10k case studies, 1k users with role assignments)
+    python -m benchmarks.seed --reset
+
+    # 2. Start the API with a single worker so per-process metrics cover
+    #    every request, and with login throttling opened up
+    LOGIN_ATTEMPTS_PER_IP=1000000 LOGIN_ATTEMPTS_PER_ACCOUNT=1000000 \\
+        uvicorn app.main:app --port 8000
+
+    # 3. Drive every endpoint and write a JSON report
+    python -m benchmarks.runner --out bench.json
+
+    # 4. Later, compare against the saved report
+    python -m benchmarks.runner --out bench-new.json --baseline bench.json
+
+    # 5. Regression gate: check the hot queries' plans (EXPLAIN) against
+    #    benchmarks/plan_snapshots.json, recorded on the default corpus;
+    #    exits non-zero on a large-table seq scan or a plan regression
+    python -m benchmarks.plans
+    python -m benchmarks.plans --update   # re-record after an intended change
+
+    # 6. Compare write throughput with and without the retired indexes
+    python -m benchmarks.writes
+
+The runner needs ``httpx`` (see ``benchmarks/requirements.txt``).
+"""
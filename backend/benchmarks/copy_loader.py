@@ -0,0 +1,179 @@
+"""
+Bulk loading with ``COPY ... FROM STDIN``.
+
+Rows are the same plain column dicts the corpus generators yield. They are
+encoded to CSV with each column's own bind processor (so enums, JSONB and
+UUIDs are written the way the ORM would write them) and streamed to the
+server without building the whole table in memory.
+
+``deferred_indexes`` drops a table's secondary indexes for the duration of a
+load and rebuilds them afterwards, which is much faster than maintaining
+them row by row. Everything runs in the caller's transaction: if the load
+fails, the rollback brings the indexes back with it.
+"""
+
+import csv
+import io
+import itertools
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from sqlalchemy import Column, Table, text
+from sqlalchemy.engine import Connection
+
+# NULL marker in the CSV stream; unquoted, so it never collides with a
+# quoted empty string.
+NULL = r"\N"
+
+# Rows encoded per chunk handed to the COPY stream.
+CHUNK_ROWS = 1000
+
+# Session memory for rebuilding indexes after a load.
+INDEX_BUILD_MEMORY = "512MB"
+
+_SECONDARY_INDEXES = text(
+    """
+    SELECT index_class.relname, pg_get_indexdef(ix.indexrelid)
+    FROM pg_index ix
+    JOIN pg_class index_class ON index_class.oid = ix.indexrelid
+    WHERE ix.indrelid = CAST(:table AS regclass)
+      AND NOT ix.indisprimary
+      AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = ix.indexrelid)
+    ORDER BY index_class.relname
+    """
+)
+
+
+def _array_literal(values: Iterable[Any]) -> str:
+    items = []
+    for value in values:
+        if value is None:
+            items.append("NULL")
+        else:
+            escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+            items.append(f'"{escaped}"')
+    return "{" + ",".join(items) + "}"
+
+
+def _encoder(column: Column, dialect) -> Callable[[Any], str]:
+    process = column.type.bind_processor(dialect)
+
+    def encode(value: Any) -> str:
+        if value is not None and process is not None:
+            value = process(value)
+        if value is None:
+            return NULL
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        if isinstance(value, (list, tuple)):
+            return _array_literal(value)
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return str(value)
+
+    return encode
+
+
+def _copy_columns(table: Table, first_row: Dict[str, Any]) -> List[Column]:
+    """Columns present in the rows, plus any with a Python-side default.
+
+    COPY only applies server defaults, so columns whose default lives in the
+    model are filled in here; columns with neither are left to the server.
+    """
+    return [
+        column
+        for column in table.columns
+        if column.name in first_row
+        or (column.default is not None and not column.default.is_sequence)
+    ]
+
+
+def _default(column: Column) -> Callable[[], Any]:
+    default = column.default
+    if default.is_callable:
+        return lambda: default.arg(None)
+    return lambda: default.arg
+
+
+class _CsvStream:
+    """File-like ``read()`` over CSV chunks, as ``copy_expert`` expects."""
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def copy_rows(connection: Connection, table: Table, rows: Iterable[Dict[str, Any]]) -> int:
+    """Stream ``rows`` into ``table`` with COPY; returns the row count."""
+    iterator = iter(rows)
+    first = next(iterator, None)
+    if first is None:
+        return 0
+
+    columns = _copy_columns(table, first)
+    encoders = [_encoder(column, connection.dialect) for column in columns]
+    defaults = {column.name: _default(column) for column in columns if column.name not in first}
+    count = 0
+
+    def chunks() -> Iterator[str]:
+        nonlocal count
+        source = itertools.chain([first], iterator)
+        while True:
+            batch = list(itertools.islice(source, CHUNK_ROWS))
+            if not batch:
+                return
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            for row in batch:
+                writer.writerow(
+                    encode(row[column.name] if column.name in row else defaults[column.name]())
+                    for column, encode in zip(columns, encoders)
+                )
+            count += len(batch)
+            yield buffer.getvalue()
+
+    quote = connection.dialect.identifier_preparer.quote
+    statement = (
+        f"COPY {quote(table.name)} ({', '.join(quote(column.name) for column in columns)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{NULL}')"
+    )
+    with connection.connection.driver_connection.cursor() as cursor:
+        cursor.copy_expert(statement, _CsvStream(chunks()))
+    return count
+
+
+@contextmanager
+def deferred_indexes(connection: Connection, table_name: str) -> Iterator[Dict[str, Any]]:
+    """Drop ``table_name``'s secondary indexes, then rebuild them on exit.
+
+    Primary keys and indexes backing constraints (including ones referenced
+    by foreign keys) are kept. Yields a dict that gets ``indexes`` and
+    ``index_seconds`` for the report.
+    """
+    definitions = connection.execute(_SECONDARY_INDEXES, {"table": table_name}).all()
+    quote = connection.dialect.identifier_preparer.quote
+    for name, _ in definitions:
+        connection.execute(text(f"DROP INDEX {quote(name)}"))
+    timing: Dict[str, Any] = {"indexes": len(definitions)}
+
+    yield timing
+
+    started = time.perf_counter()
+    connection.execute(text(f"SET LOCAL maintenance_work_mem = '{INDEX_BUILD_MEMORY}'"))
+    for _, definition in definitions:
+        connection.execute(text(definition))
+    timing["index_seconds"] = round(time.perf_counter() - started, 2)
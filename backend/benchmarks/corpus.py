@@ -0,0 +1,277 @@
+"""
+Synthetic content corpus.
+
+Row generators yield plain column dicts for the content tables, seeded so
+the same spec always produces the same corpus. Every slug starts with
+``bench-`` so benchmark data can be removed without touching real content.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List
+
+from app.models.enums import ContentStatus
+
+SLUG_PREFIX = "bench-"
+HOME_SLUG = f"{SLUG_PREFIX}home"
+USER_PREFIX = f"{SLUG_PREFIX}user-"
+
+BENCH_ADMIN_EMAIL = "bench-admin@example.com"
+BENCH_ADMIN_PASSWORD = "bench-password"
+
+CATEGORIES = [
+    "engineering", "design", "marketing", "cloud", "ai-ml", "security",
+    "mobile", "data", "devops", "product", "strategy", "culture",
+]
+TAGS = [
+    "python", "react", "nextjs", "aws", "gcp", "azure", "kubernetes", "docker",
+    "postgres", "seo", "ux", "ui", "llm", "analytics", "automation", "testing",
+    "performance", "accessibility", "startup", "enterprise", "fintech", "health",
+    "retail", "education", "logistics", "saas", "api", "graphql", "serverless",
+    "observability",
+]
+INDUSTRIES = [
+    "Healthcare", "Finance", "Retail", "Education", "Logistics", "Manufacturing",
+    "Real Estate", "Travel", "Media", "Government",
+]
+FIRST_NAMES = [
+    "Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Meera", "Arjun", "Kavya",
+    "Sam", "Alex", "Jordan", "Taylor", "Chris", "Morgan", "Riya", "Dev",
+]
+LAST_NAMES = [
+    "Sharma", "Iyer", "Patel", "Reddy", "Nair", "Gupta", "Khan", "Das",
+    "Smith", "Lee", "Garcia", "Brown", "Martin", "Singh", "Rao", "Menon",
+]
+# Share of generated users per assigned role; the rest are viewers.
+ROLE_SHARES = (("admin", 0.02), ("editor", 0.28))
+WORDS = (
+    "build ship scale cloud native platform secure fast reliable modern data "
+    "driven customer journey growth design system mobile first api product "
+    "team delivery pipeline insight automation experience performance launch"
+).split()
+
+
+@dataclass
+class CorpusSpec:
+    """How much of each content type to generate."""
+
+    blogs: int = 100_000
+    case_studies: int = 10_000
+    services: int = 50
+    jobs: int = 200
+    pages: int = 20
+    homepage_sections: int = 200
+    users: int = 1_000
+    published_ratio: float = 0.8
+    deleted_ratio: float = 0.02
+    seed: int = 42
+
+
+class CorpusGenerator:
+    """Deterministic row generators for one spec and author."""
+
+    def __init__(self, spec: CorpusSpec, author_id: uuid.UUID) -> None:
+        self.spec = spec
+        self.author_id = author_id
+        self.now = datetime.now(timezone.utc)
+
+    def _rng(self, entity_type: str) -> random.Random:
+        # One stream per type so changing one count does not reshuffle the others.
+        return random.Random(f"{self.spec.seed}:{entity_type}")
+
+    def _sentence(self, rng: random.Random, words: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+    def _paragraphs(self, rng: random.Random, count: int) -> List[str]:
+        return [" ".join(self._sentence(rng, rng.randint(8, 20)) for _ in range(4)) for _ in range(count)]
+
+    def _common(self, rng: random.Random, index: int, total: int) -> Dict[str, Any]:
+        # Creation times step back from now, one every 7 minutes; newest last.
+        created_at = self.now - timedelta(minutes=(total - index) * 7)
+        roll = rng.random()
+        if roll < self.spec.published_ratio:
+            status = ContentStatus.PUBLISHED
+        elif roll < self.spec.published_ratio + (1 - self.spec.published_ratio) / 2:
+            status = ContentStatus.DRAFT
+        else:
+            status = ContentStatus.ARCHIVED
+        return {
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "status": status,
+            "published_at": created_at if status == ContentStatus.PUBLISHED else None,
+            "published_by": self.author_id if status == ContentStatus.PUBLISHED else None,
+            "created_by": self.author_id,
+            "is_deleted": rng.random() < self.spec.deleted_ratio,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+    def _seo(self, rng: random.Random, title: str) -> Dict[str, Any]:
+        return {
+            "meta_title": title[:255],
+            "meta_description": self._sentence(rng, 18),
+            "meta_keywords": rng.sample(TAGS, 4),
+            "og_image_url": f"https://cdn.example.com/og/{rng.getrandbits(32):08x}.jpg",
+        }
+
+    def blogs(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("blog")
+        total = self.spec.blogs
+        for i in range(total):
+            title = self._sentence(rng, rng.randint(4, 9)).rstrip(".")
+            yield {
+                **self._common(rng, i, total),
+                "slug": f"{SLUG_PREFIX}blog-{i:07d}",
+                "title": title,
+                "excerpt": self._sentence(rng, 25),
+                "content": {"body": self._paragraphs(rng, rng.randint(3, 8))},
+                "featured_image_url": f"https://cdn.example.com/blog/{i}.jpg",
+                "author_id": self.author_id,
+                "category": rng.choice(CATEGORIES),
+                "tags": rng.sample(TAGS, rng.randint(1, 5)),
+                **self._seo(rng, title),
+            }
+
+    def case_studies(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("case_study")
+        total = self.spec.case_studies
+        for i in range(total):
+            title = self._sentence(rng, rng.randint(4, 8)).rstrip(".")
+            yield {
+                **self._common(rng, i, total),
+                "slug": f"{SLUG_PREFIX}case-study-{i:06d}",
+                "title": title,
+                "client_name": f"Client {rng.randint(1, 5000)}",
+                "client_logo_url": f"https://cdn.example.com/logos/{i}.png",
+                "excerpt": self._sentence(rng, 20),
+                "challenge": " ".join(self._paragraphs(rng, 1)),
+                "solution": " ".join(self._paragraphs(rng, 2)),
+                "results": " ".join(self._paragraphs(rng, 1)),
+                "content": {"sections": [{"heading": self._sentence(rng, 4), "body": p} for p in self._paragraphs(rng, 3)]},
+                "featured_image_url": f"https://cdn.example.com/cases/{i}.jpg",
+                "gallery_images": [f"https://cdn.example.com/cases/{i}/{n}.jpg" for n in range(rng.randint(0, 6))],
+                "industry": rng.choice(INDUSTRIES),
+                "tags": rng.sample(TAGS, rng.randint(1, 5)),
+                **self._seo(rng, title),
+            }
+
+    def services(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("service")
+        total = self.spec.services
+        for i in range(total):
+            title = self._sentence(rng, rng.randint(2, 4)).rstrip(".")
+            yield {
+                **self._common(rng, i, total),
+                "slug": f"{SLUG_PREFIX}service-{i:04d}",
+                "title": title,
+                "subtitle": self._sentence(rng, 8),
+                "description": " ".join(self._paragraphs(rng, 2)),
+                "content": {"features": [self._sentence(rng, 6) for _ in range(8)], "body": self._paragraphs(rng, 4)},
+                "featured_image_url": f"https://cdn.example.com/services/{i}.jpg",
+                "icon_url": f"https://cdn.example.com/icons/{i}.svg",
+                **self._seo(rng, title),
+            }
+
+    def jobs(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("job")
+        total = self.spec.jobs
+        for i in range(total):
+            yield {
+                **self._common(rng, i, total),
+                "slug": f"{SLUG_PREFIX}job-{i:05d}",
+                "title": self._sentence(rng, rng.randint(2, 4)).rstrip("."),
+                "job_type": rng.choice(["permanent", "internship"]),
+                "location": rng.choice(["Remote", "Bengaluru", "Mumbai", "Pune", "Hybrid"]),
+                "employment_type": rng.choice(["Full-time", "Part-time", "Contract"]),
+                "description": " ".join(self._paragraphs(rng, 2)),
+                "requirements": [self._sentence(rng, 6) for _ in range(rng.randint(3, 8))],
+                "content": {"benefits": [self._sentence(rng, 5) for _ in range(5)]},
+            }
+
+    def _section(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        return {
+            "id": f"section-{index}",
+            "type": rng.choice(["hero", "features", "testimonials", "cta", "stats", "gallery"]),
+            "title": self._sentence(rng, 5),
+            "subtitle": self._sentence(rng, 10),
+            "items": [
+                {
+                    "title": self._sentence(rng, 3),
+                    "body": self._sentence(rng, 20),
+                    "image": f"https://cdn.example.com/home/{index}/{n}.jpg",
+                    "link": {"label": "Learn more", "href": f"/services/{SLUG_PREFIX}service-{n:04d}"},
+                }
+                for n in range(rng.randint(3, 8))
+            ],
+            "style": {"background": rng.choice(["light", "dark", "brand"]), "columns": rng.randint(1, 4)},
+        }
+
+    def pages(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("page")
+        total = self.spec.pages
+        for i in range(total):
+            home = i == 0
+            sections = self.spec.homepage_sections if home else rng.randint(3, 12)
+            title = "Home" if home else self._sentence(rng, 3).rstrip(".")
+            common = self._common(rng, i, total)
+            if home:
+                common.update(
+                    status=ContentStatus.PUBLISHED,
+                    is_deleted=False,
+                    published_at=common["created_at"],
+                    published_by=self.author_id,
+                )
+            yield {
+                **common,
+                "slug": HOME_SLUG if home else f"{SLUG_PREFIX}page-{i:04d}",
+                "title": title,
+                "content": [self._section(rng, n) for n in range(sections)],
+                "template": "home" if home else "default",
+                **self._seo(rng, title),
+            }
+
+    def users(self, password_hash: str) -> Iterator[Dict[str, Any]]:
+        # Every user shares one precomputed hash; hashing per row would
+        # dominate the load time.
+        rng = self._rng("user")
+        total = self.spec.users
+        for i in range(total):
+            created_at = self.now - timedelta(hours=(total - i) * 3)
+            yield {
+                "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                "email": f"{USER_PREFIX}{i:06d}@example.com",
+                "username": f"{USER_PREFIX}{i:06d}",
+                "password_hash": password_hash,
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": rng.choice(LAST_NAMES),
+                "avatar_url": f"https://cdn.example.com/avatars/{i}.png" if rng.random() < 0.5 else None,
+                "is_active": rng.random() > 0.05,
+                "is_email_verified": rng.random() < 0.7,
+                "last_login_at": created_at + timedelta(hours=rng.randint(1, 2000)) if rng.random() < 0.8 else None,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def role_assignments(self, user_ids: List[uuid.UUID], role_ids: Dict[str, uuid.UUID]) -> Iterator[Dict[str, Any]]:
+        """One role per user, drawn from ``ROLE_SHARES``."""
+        rng = self._rng("user_role")
+        for user_id in user_ids:
+            roll, role = rng.random(), "viewer"
+            for name, share in ROLE_SHARES:
+                if roll < share:
+                    role = name
+                    break
+                roll -= share
+            yield {"user_id": user_id, "role_id": role_ids[role], "assigned_by": self.author_id}
+
+    def by_type(self) -> Dict[str, Iterator[Dict[str, Any]]]:
+        """Generators keyed by entity type, in insertion order."""
+        return {
+            "page": self.pages(),
+            "service": self.services(),
+            "blog": self.blogs(),
+            "case_study": self.case_studies(),
+            "job": self.jobs(),
+        }
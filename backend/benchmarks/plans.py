@@ -0,0 +1,369 @@
+"""
+Query-plan checks for the hot service queries.
+
+    python -m benchmarks.plans [--snapshot FILE] [--update] [--only REGEX]
+        [--large-table-rows N] [--tolerance 0.2] [--verbose]
+
+Runs each hot service call (the list, slug and id lookups behind the public
+endpoints, facets, the change feed, sitemap and feed, revisions and users)
+against a seeded database, capturing every SELECT it issues. Each captured
+statement is then run again, with its original parameters, under
+``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)``, and the plan is reduced to its
+shape (node types, relations and indexes), estimated cost, execution time
+and shared buffers touched.
+
+It fails when:
+
+- a plan sequentially scans a table with at least ``--large-table-rows``
+  rows (by ``pg_class.reltuples``), snapshot or not, unless the call is
+  listed in ``FULL_SCANS`` for that table
+- compared with the snapshot, a call issues more queries, a plan changes
+  shape, or estimated cost or buffers grow by more than ``--tolerance``
+
+``--update`` writes the current plans as the new snapshot instead of
+comparing. Seed the corpus first (``python -m benchmarks.seed``); plans on
+an almost empty database say nothing about production. The committed
+``plan_snapshots.json`` was recorded against the default corpus
+(``python -m benchmarks.seed --reset``); re-record it with ``--update`` in
+the same change as anything that moves a plan on purpose.
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import Session
+
+from app.api.schemas.blog import BlogOut
+from app.api.schemas.case_study import CaseStudyOut
+from app.api.schemas.job import JobOut
+from app.api.schemas.page import PageOut
+from app.api.schemas.service import ServiceOut
+from app.api.schemas.user import UserOut
+from app.api.services.blog import get_blog_by_id, get_blog_by_slug, list_blogs
+from app.api.services.case_study import get_case_study_by_slug, list_case_studies
+from app.api.services.changes import get_latest_cursor, list_changes
+from app.api.services.facets import get_facet_counts
+from app.api.services.feeds import generate_blog_feed, generate_sitemap, get_sitemap_layout
+from app.api.services.job import get_job_by_slug, list_jobs
+from app.api.services.page import get_page_by_slug, list_pages
+from app.api.services.revisions import list_revisions
+from app.api.services.service import get_service_by_slug, list_services
+from app.api.services.user import list_users
+from app.api.services.view_counts import SORT_POPULAR
+from app.core.config import settings
+from app.db.session import SessionLocal, engine
+from app.models.case_study import CaseStudy
+from app.models.enums import ContentStatus
+from app.models.registry import CONTENT_MODELS
+from benchmarks.corpus import HOME_SLUG
+
+DEFAULT_SNAPSHOT = Path(__file__).with_name("plan_snapshots.json")
+
+PUBLISHED = ContentStatus.PUBLISHED
+
+
+# ============================================================================
+# Hot Calls
+# ============================================================================
+
+@dataclass
+class Sample:
+    """Real keys from the seeded database for the lookups to use."""
+
+    slugs: Dict[str, str] = field(default_factory=dict)
+    ids: Dict[str, Any] = field(default_factory=dict)
+    industry: str = ""
+    tag: str = ""
+
+
+def _serialized(schema, result):
+    # Serialize like the endpoints do, so lazy loads are captured too.
+    items = result if isinstance(result, list) else [result]
+    for item in items:
+        schema.model_validate(item).model_dump_json()
+    return result
+
+
+HOT_CALLS: Dict[str, Callable[[Session, Sample], Any]] = {
+    "blog.list_recent": lambda db, s: _serialized(BlogOut, list_blogs(db, limit=20, status=PUBLISHED)),
+    "blog.list_recent_page_50": lambda db, s: list_blogs(db, skip=1000, limit=20, status=PUBLISHED),
+    "blog.list_popular": lambda db, s: list_blogs(db, limit=20, status=PUBLISHED, sort=SORT_POPULAR),
+    "blog.list_admin": lambda db, s: list_blogs(db, limit=20),
+    "blog.get_by_slug": lambda db, s: _serialized(BlogOut, get_blog_by_slug(db, s.slugs["blog"])),
+    "blog.get_by_id": lambda db, s: get_blog_by_id(db, s.ids["blog"]),
+    "blog.facets": lambda db, s: get_facet_counts(db, "blog"),
+    "blog.revisions": lambda db, s: list_revisions(db, "blog", s.ids["blog"]),
+    "case_study.list_recent": lambda db, s: _serialized(
+        CaseStudyOut, list_case_studies(db, limit=20, status=PUBLISHED)
+    ),
+    "case_study.list_by_industry": lambda db, s: list_case_studies(
+        db, limit=20, status=PUBLISHED, category=s.industry
+    ),
+    "case_study.list_by_tag": lambda db, s: list_case_studies(db, limit=20, status=PUBLISHED, category=s.tag),
+    "case_study.list_popular": lambda db, s: list_case_studies(db, limit=20, status=PUBLISHED, sort=SORT_POPULAR),
+    "case_study.get_by_slug": lambda db, s: get_case_study_by_slug(db, s.slugs["case_study"]),
+    "case_study.facets": lambda db, s: get_facet_counts(db, "case_study"),
+    "service.list_recent": lambda db, s: _serialized(ServiceOut, list_services(db, status=PUBLISHED)),
+    "service.get_by_slug": lambda db, s: get_service_by_slug(db, s.slugs["service"]),
+    "page.list_recent": lambda db, s: list_pages(db, status=PUBLISHED),
+    "page.get_home": lambda db, s: _serialized(PageOut, get_page_by_slug(db, HOME_SLUG)),
+    "job.list_recent": lambda db, s: _serialized(JobOut, list_jobs(db, status=PUBLISHED)),
+    "job.get_by_slug": lambda db, s: get_job_by_slug(db, s.slugs["job"]),
+    "changes.list_from_start": lambda db, s: list_changes(db, since=0),
+    "changes.list_blog_from_start": lambda db, s: list_changes(db, since=0, entity_type="blog"),
+    "changes.latest_cursor": lambda db, s: get_latest_cursor(db),
+    "feeds.sitemap": lambda db, s: "".join(generate_sitemap(get_sitemap_layout(db))),
+    "feeds.blog_rss": lambda db, s: "".join(generate_blog_feed()),
+    "user.list": lambda db, s: _serialized(UserOut, list_users(db, limit=20)),
+}
+
+
+# Calls that read (nearly) every live row of these tables, where a sequential
+# scan is the right plan.
+FULL_SCANS: Dict[str, Tuple[str, ...]] = {
+    # Every published URL goes into the sitemap.
+    "feeds.sitemap": ("blogs", "case_studies", "jobs", "pages", "services"),
+    # The view count lives in another table, so no index orders live rows by
+    # it; the sort reads every live row until counts move onto the items.
+    "blog.list_popular": ("blogs", "content_view_counts"),
+    "case_study.list_popular": ("case_studies", "content_view_counts"),
+}
+
+
+def load_sample(db: Session) -> Sample:
+    sample = Sample()
+    for entity_type, model in CONTENT_MODELS.items():
+        row = db.execute(
+            select(model.slug, model.id)
+            .where(model.is_deleted == False, model.status == PUBLISHED)
+            .order_by(model.created_at.desc())
+            .limit(1)
+        ).first()
+        if row is None:
+            raise SystemExit(f"No published {entity_type} rows; seed the database first")
+        sample.slugs[entity_type], sample.ids[entity_type] = row
+    sample.industry = db.scalar(select(CaseStudy.industry).where(CaseStudy.industry.isnot(None)).limit(1)) or ""
+    sample.tag = db.scalar(select(CaseStudy.tags[1]).where(CaseStudy.tags.isnot(None)).limit(1)) or ""
+    return sample
+
+
+# ============================================================================
+# Capture and Explain
+# ============================================================================
+
+class QueryCapture:
+    """``before_cursor_execute`` hook recording SELECTs while active."""
+
+    def __init__(self) -> None:
+        self.active = False
+        self.statements: List[Tuple[str, Any]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self.active and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            self.statements.append((statement, parameters))
+
+    def run(self, call: Callable[[], Any]) -> List[Tuple[str, Any]]:
+        self.statements = []
+        self.active = True
+        try:
+            call()
+        finally:
+            self.active = False
+        return self.statements
+
+
+def _nodes(plan: Dict[str, Any], depth: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    yield depth, plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child, depth + 1)
+
+
+def _describe(node: Dict[str, Any]) -> str:
+    label = node["Node Type"]
+    if node.get("Scan Direction") == "Backward":
+        label += " Backward"
+    if "Index Name" in node:
+        label += f" using {node['Index Name']}"
+    if "Relation Name" in node:
+        label += f" on {node['Relation Name']}"
+    return label
+
+
+def explain(db: Session, statement: str, parameters: Any) -> Dict[str, Any]:
+    cursor = db.connection().connection.driver_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters)
+        result = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]
+
+
+def summarize(explained: Dict[str, Any], table_rows: Dict[str, float], large_table_rows: int) -> Dict[str, Any]:
+    plan = explained["Plan"]
+    nodes = list(_nodes(plan))
+    return {
+        "shape": ["  " * depth + _describe(node) for depth, node in nodes],
+        "total_cost": plan["Total Cost"],
+        "rows": plan.get("Actual Rows"),
+        "execution_ms": round(explained.get("Execution Time", 0.0), 3),
+        "planning_ms": round(explained.get("Planning Time", 0.0), 3),
+        "shared_hit": plan.get("Shared Hit Blocks", 0),
+        "shared_read": plan.get("Shared Read Blocks", 0),
+        "indexes": sorted({node["Index Name"] for _, node in nodes if "Index Name" in node}),
+        "seq_scans": sorted({
+            node["Relation Name"]
+            for _, node in nodes
+            if node["Node Type"] == "Seq Scan"
+            and table_rows.get(node.get("Relation Name", ""), 0) >= large_table_rows
+        }),
+    }
+
+
+def table_sizes(db: Session) -> Dict[str, float]:
+    return dict(
+        db.execute(
+            text(
+                "SELECT relname, reltuples FROM pg_class "
+                "WHERE relkind = 'r' AND relnamespace = CAST('public' AS regnamespace)"
+            )
+        ).all()
+    )
+
+
+def unused_indexes(db: Session, results: Dict[str, List[Dict[str, Any]]]) -> List[str]:
+    """Indexes on the content tables that no hot plan used."""
+    used = {name for plans in results.values() for plan in plans for name in plan["indexes"]}
+    rows = db.execute(
+        text(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE schemaname = 'public' AND tablename = ANY(:tables) ORDER BY indexname"
+        ),
+        {"tables": [model.__tablename__ for model in CONTENT_MODELS.values()]},
+    )
+    return [name for (name,) in rows if name not in used]
+
+
+# ============================================================================
+# Checks
+# ============================================================================
+
+def _grew(before: float, after: float, tolerance: float, floor: float) -> bool:
+    return after - before > floor and after > before * (1 + tolerance)
+
+
+def compare(
+    current: Dict[str, List[Dict[str, Any]]],
+    snapshot: Dict[str, List[Dict[str, Any]]],
+    tolerance: float,
+) -> List[str]:
+    problems: List[str] = []
+    for name, plans in current.items():
+        old_plans = snapshot.get(name)
+        if old_plans is None:
+            continue
+        if len(plans) > len(old_plans):
+            problems.append(f"{name}: {len(old_plans)} -> {len(plans)} queries")
+        for index, (old, new) in enumerate(zip(old_plans, plans)):
+            label = f"{name}#{index}"
+            if new["shape"] != old["shape"]:
+                problems.append(
+                    f"{label}: plan changed\n    was: " + "\n         ".join(old["shape"])
+                    + "\n    now: " + "\n         ".join(new["shape"])
+                )
+            if _grew(old["total_cost"], new["total_cost"], tolerance, floor=1.0):
+                problems.append(f"{label}: estimated cost {old['total_cost']} -> {new['total_cost']}")
+            old_buffers = old["shared_hit"] + old["shared_read"]
+            new_buffers = new["shared_hit"] + new["shared_read"]
+            if _grew(old_buffers, new_buffers, tolerance, floor=10):
+                problems.append(f"{label}: shared buffers {old_buffers} -> {new_buffers}")
+    return problems
+
+
+def run(args: argparse.Namespace) -> Dict[str, List[Dict[str, Any]]]:
+    # Every call should reach the database, not a warm cache.
+    settings.FACET_CACHE_TTL_SECONDS = 0
+
+    pattern = re.compile(args.only) if args.only else None
+    capture = QueryCapture()
+    event.listen(engine, "before_cursor_execute", capture)
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    try:
+        with SessionLocal() as db:
+            sample = load_sample(db)
+            sizes = table_sizes(db)
+            for name, call in HOT_CALLS.items():
+                if pattern and not pattern.search(name):
+                    continue
+                statements = capture.run(lambda: call(db, sample))
+                db.rollback()
+                results[name] = [
+                    summarize(explain(db, statement, parameters), sizes, args.large_table_rows)
+                    for statement, parameters in statements
+                ]
+                db.rollback()
+                for index, plan in enumerate(results[name]):
+                    print(
+                        f"{name + '#' + str(index):40} cost {plan['total_cost']:>10.2f}  "
+                        f"{plan['execution_ms']:>8.2f} ms  buffers {plan['shared_hit']}+{plan['shared_read']}",
+                        flush=True,
+                    )
+                    if args.verbose:
+                        print("    " + "\n    ".join(plan["shape"]))
+            if not pattern:
+                # Informational: candidates for dropping, since every write pays for them.
+                print("\nContent-table indexes no hot plan used:")
+                print("  " + ("\n  ".join(unused_indexes(db, results)) or "(none)"))
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return results
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--snapshot", type=Path, default=DEFAULT_SNAPSHOT)
+    parser.add_argument("--update", action="store_true", help="Write the current plans as the snapshot")
+    parser.add_argument("--only", default=None, help="Regex selecting call names")
+    parser.add_argument("--large-table-rows", type=int, default=10_000)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--verbose", action="store_true", help="Print every plan's shape")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    problems = []
+    for name, plans in results.items():
+        for index, plan in enumerate(plans):
+            scans = [table for table in plan["seq_scans"] if table not in FULL_SCANS.get(name, ())]
+            if scans:
+                problems.append(f"{name}#{index}: sequential scan on {', '.join(scans)}")
+
+    if args.update:
+        snapshot: Dict[str, Any] = {}
+        if args.snapshot.exists() and args.only:
+            snapshot = json.loads(args.snapshot.read_text())
+        snapshot.update(results)
+        args.snapshot.write_text(json.dumps(snapshot, indent=2, sort_keys=True) + "\n")
+        print(f"Snapshot written to {args.snapshot}")
+    elif args.snapshot.exists():
+        problems += compare(results, json.loads(args.snapshot.read_text()), args.tolerance)
+    else:
+        print(f"No snapshot at {args.snapshot}; run with --update to create one")
+
+    if problems:
+        print(f"\n{len(problems)} plan problem(s):")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
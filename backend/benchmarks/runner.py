@@ -0,0 +1,430 @@
+"""
+Drive the API's endpoints at controlled concurrency and report latency.
+
+    python -m benchmarks.runner [--base-url URL] [--concurrency N]
+        [--duration SECONDS] [--only REGEX] [--skip-writes]
+        [--out report.json] [--baseline old.json] [--tolerance 0.1]
+
+Each scenario runs for ``--duration`` seconds (or ``--requests`` requests)
+with ``--concurrency`` requests in flight. The report records, per scenario:
+request count, status codes, RPS, mean/p50/p95/p99 latency, and queries and
+DB time per request (from the server's "requests" metrics). It also records
+the resident memory of every worker seen in ``/health/metrics``. Per-process
+metrics only cover every request when the server runs a single worker.
+
+With ``--baseline``, scenarios are compared with a saved report. Latency
+percentiles that grow, or RPS that drops, by more than ``--tolerance`` count
+as regressions, and the exit status is 1 if there are any.
+
+Write scenarios create, update and delete their own ``bench-run-`` items as
+the benchmark admin from ``benchmarks.seed``.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import re
+import sys
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from benchmarks.corpus import BENCH_ADMIN_EMAIL, BENCH_ADMIN_PASSWORD, HOME_SLUG
+
+# Entity type -> collection path
+CONTENT_PATHS = {
+    "page": "/cms/pages",
+    "service": "/cms/services",
+    "blog": "/cms/blogs",
+    "case_study": "/cms/case-studies",
+    "job": "/cms/jobs",
+}
+SITE_SETTINGS = (
+    "header", "hero", "footer", "theme", "ui",
+    "services-ai-ml-section", "about-page", "contact-info",
+)
+PERCENTILES = (50, 95, 99)
+
+
+# ============================================================================
+# Run Context
+# ============================================================================
+
+@dataclass
+class Context:
+    """Identifiers discovered before the run and shared by scenarios."""
+
+    run_id: str
+    token: str = ""
+    admin_id: str = ""
+    slugs: Dict[str, List[str]] = field(default_factory=dict)
+    ids: Dict[str, List[str]] = field(default_factory=dict)
+    categories: List[str] = field(default_factory=list)
+    created: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def auth(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+async def prepare(client: httpx.AsyncClient, ctx: Context) -> None:
+    response = await client.post(
+        "/auth/login", json={"email": BENCH_ADMIN_EMAIL, "password": BENCH_ADMIN_PASSWORD}
+    )
+    response.raise_for_status()
+    body = response.json()
+    ctx.token = body["access_token"]
+    ctx.admin_id = body["user"]["id"]
+
+    for entity_type, path in CONTENT_PATHS.items():
+        items = (await client.get(path, params={"limit": 200})).json()
+        ctx.slugs[entity_type] = [item["slug"] for item in items] or ["missing"]
+        ctx.ids[entity_type] = [item["id"] for item in items]
+        ctx.created[entity_type] = []
+    facets = (await client.get("/cms/case-studies/facets")).json()
+    ctx.categories = [entry["value"] for entry in facets.get("industry", [])] or ["all"]
+    ctx.created["user"] = []
+
+
+# ============================================================================
+# Scenarios
+# ============================================================================
+
+Request = Callable[[httpx.AsyncClient, Context, int], Awaitable[httpx.Response]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    kind: str  # read | write | auth
+    request: Request
+
+
+def _pick(values: List[str], n: int) -> str:
+    return values[n % len(values)]
+
+
+def _content_payload(entity_type: str, ctx: Context, n: int) -> Dict[str, Any]:
+    slug = f"bench-run-{ctx.run_id}-{entity_type.replace('_', '-')}-{n}"
+    payload: Dict[str, Any] = {"slug": slug, "title": f"Benchmark {entity_type} {n}", "status": "published"}
+    if entity_type == "blog":
+        payload.update(author_id=ctx.admin_id, category="engineering", tags=["python", "performance"])
+    elif entity_type == "case_study":
+        payload.update(industry="Finance", tags=["fintech"])
+    elif entity_type == "page":
+        payload.update(content=[{"type": "text", "body": "Benchmark page"}])
+    return payload
+
+
+def _read_scenarios() -> List[Scenario]:
+    scenarios: List[Scenario] = []
+    for entity_type, path in CONTENT_PATHS.items():
+        scenarios.append(Scenario(
+            f"list_{entity_type}", "read",
+            lambda c, ctx, n, path=path: c.get(path, params={"limit": 20, "skip": (n % 50) * 20}),
+        ))
+        scenarios.append(Scenario(
+            f"get_{entity_type}_by_slug", "read",
+            lambda c, ctx, n, path=path, t=entity_type: c.get(f"{path}/slug/{_pick(ctx.slugs[t], n)}"),
+        ))
+        scenarios.append(Scenario(
+            f"get_{entity_type}_by_id", "read",
+            lambda c, ctx, n, path=path, t=entity_type: c.get(f"{path}/{_pick(ctx.ids[t] or [str(uuid.uuid4())], n)}"),
+        ))
+    scenarios += [
+        Scenario("list_blog_popular", "read",
+                 lambda c, ctx, n: c.get("/cms/blogs", params={"limit": 20, "sort": "popular"})),
+        Scenario("list_case_study_by_category", "read",
+                 lambda c, ctx, n: c.get("/cms/case-studies", params={"limit": 20, "category": _pick(ctx.categories, n)})),
+        Scenario("blog_facets", "read", lambda c, ctx, n: c.get("/cms/blogs/facets")),
+        Scenario("case_study_facets", "read", lambda c, ctx, n: c.get("/cms/case-studies/facets")),
+        Scenario("get_home_page", "read", lambda c, ctx, n: c.get(f"/cms/pages/slug/{HOME_SLUG}")),
+        Scenario("blog_revisions", "read",
+                 lambda c, ctx, n: c.get(f"/cms/blogs/{_pick(ctx.ids['blog'], n)}/revisions", headers=ctx.auth)),
+        Scenario("list_users", "read", lambda c, ctx, n: c.get("/cms/users", headers=ctx.auth)),
+        Scenario("list_roles", "read", lambda c, ctx, n: c.get("/cms/roles", headers=ctx.auth)),
+        Scenario("changes", "read", lambda c, ctx, n: c.get("/cms/changes", params={"limit": 100})),
+        Scenario("sitemap", "read", lambda c, ctx, n: c.get("/sitemap.xml")),
+        Scenario("blog_feed", "read", lambda c, ctx, n: c.get("/feeds/blogs.xml")),
+    ]
+    for key in SITE_SETTINGS:
+        scenarios.append(Scenario(
+            f"site_settings_{key.replace('-', '_')}", "read",
+            lambda c, ctx, n, key=key: c.get(f"/cms/site-settings/{key}"),
+        ))
+    return scenarios
+
+
+async def _create(c: httpx.AsyncClient, ctx: Context, n: int, entity_type: str) -> httpx.Response:
+    response = await c.post(CONTENT_PATHS[entity_type], json=_content_payload(entity_type, ctx, n), headers=ctx.auth)
+    if response.status_code == 201:
+        ctx.created[entity_type].append(response.json()["id"])
+    return response
+
+
+async def _update(c: httpx.AsyncClient, ctx: Context, n: int, entity_type: str) -> httpx.Response:
+    item_id = _pick(ctx.created[entity_type] or ctx.ids[entity_type], n)
+    return await c.put(
+        f"{CONTENT_PATHS[entity_type]}/{item_id}",
+        json={"title": f"Benchmark {entity_type} {n} (edited)"},
+        headers=ctx.auth,
+    )
+
+
+async def _delete(c: httpx.AsyncClient, ctx: Context, n: int, entity_type: str) -> httpx.Response:
+    if not ctx.created[entity_type]:
+        return httpx.Response(204)  # nothing left to delete; not timed meaningfully
+    item_id = ctx.created[entity_type].pop()
+    return await c.delete(f"{CONTENT_PATHS[entity_type]}/{item_id}", headers=ctx.auth)
+
+
+async def _update_hero(c: httpx.AsyncClient, ctx: Context, n: int) -> httpx.Response:
+    hero = (await c.get("/cms/site-settings/hero")).json()
+    return await c.put("/cms/site-settings/hero", json=hero, headers=ctx.auth)
+
+
+async def _create_user(c: httpx.AsyncClient, ctx: Context, n: int) -> httpx.Response:
+    response = await c.post(
+        "/cms/users",
+        json={
+            "email": f"bench-run-{ctx.run_id}-{n}@example.com",
+            "username": f"bench-run-{ctx.run_id}-{n}",
+            "password": "bench-password",
+        },
+        headers=ctx.auth,
+    )
+    if response.status_code == 201:
+        ctx.created["user"].append(response.json()["id"])
+    return response
+
+
+async def _delete_user(c: httpx.AsyncClient, ctx: Context, n: int) -> httpx.Response:
+    if not ctx.created["user"]:
+        return httpx.Response(204)
+    return await c.delete(f"/cms/users/{ctx.created['user'].pop()}", headers=ctx.auth)
+
+
+def _write_scenarios() -> List[Scenario]:
+    scenarios: List[Scenario] = []
+    for entity_type in CONTENT_PATHS:
+        for verb, fn in (("create", _create), ("update", _update), ("delete", _delete)):
+            scenarios.append(Scenario(
+                f"{verb}_{entity_type}", "write",
+                lambda c, ctx, n, fn=fn, t=entity_type: fn(c, ctx, n, t),
+            ))
+    scenarios += [
+        Scenario("update_site_settings_hero", "write", _update_hero),
+        Scenario("create_user", "write", _create_user),
+        Scenario("delete_user", "write", _delete_user),
+    ]
+    return scenarios
+
+
+def _auth_scenarios() -> List[Scenario]:
+    return [
+        Scenario(
+            "login", "auth",
+            lambda c, ctx, n: c.post("/auth/login", json={"email": BENCH_ADMIN_EMAIL, "password": BENCH_ADMIN_PASSWORD}),
+        ),
+    ]
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class MetricsProbe:
+    """Reads /health/metrics and remembers the peak RSS of each worker seen."""
+
+    def __init__(self) -> None:
+        self.workers: Dict[int, float] = {}
+
+    async def read(self, client: httpx.AsyncClient) -> Dict[str, Any]:
+        try:
+            metrics = (await client.get("/health/metrics")).json()
+        except (httpx.HTTPError, ValueError):
+            return {}
+        process = metrics.get("process") or {}
+        if "pid" in process:
+            pid = process["pid"]
+            self.workers[pid] = max(self.workers.get(pid, 0.0), process.get("rss_mb", 0.0))
+        return metrics.get("requests") or {}
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    ctx: Context,
+    scenario: Scenario,
+    probe: MetricsProbe,
+    concurrency: int,
+    duration: float,
+    max_requests: Optional[int],
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    sequence = itertools.count()
+    before = await probe.read(client)
+    started = time.perf_counter()
+    stop_at = started + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < stop_at:
+            n = next(sequence)
+            if max_requests is not None and n >= max_requests:
+                return
+            request_started = time.perf_counter()
+            try:
+                response = await scenario.request(client, ctx, n)
+                statuses[str(response.status_code)] += 1
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+            latencies.append((time.perf_counter() - request_started) * 1000)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    after = await probe.read(client)
+
+    latencies.sort()
+    count = len(latencies)
+    # The metrics read itself is one request the server counted.
+    served = (after.get("requests", 0) - before.get("requests", 0)) - 1
+    result: Dict[str, Any] = {
+        "kind": scenario.kind,
+        "requests": count,
+        "statuses": dict(statuses),
+        "errors": sum(v for k, v in statuses.items() if not k.startswith(("2", "3"))),
+        "seconds": round(elapsed, 3),
+        "rps": round(count / elapsed, 1) if elapsed else None,
+        "mean_ms": round(sum(latencies) / count, 3) if count else None,
+    }
+    for pct in PERCENTILES:
+        value = percentile(latencies, pct)
+        result[f"p{pct}_ms"] = round(value, 3) if value is not None else None
+    if served > 0:
+        result["queries_per_request"] = round((after.get("queries", 0) - before.get("queries", 0)) / served, 2)
+        result["db_ms_per_request"] = round((after.get("db_ms", 0) - before.get("db_ms", 0)) / served, 3)
+    return result
+
+
+# ============================================================================
+# Baseline Comparison
+# ============================================================================
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print a comparison table and return the regressions found."""
+    regressions: List[str] = []
+    print(f"\n{'scenario':38} {'metric':8} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in current["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if not old:
+            continue
+        for metric in [f"p{pct}_ms" for pct in PERCENTILES] + ["rps"]:
+            before, after = old.get(metric), result.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            worse = change > tolerance if metric != "rps" else change < -tolerance
+            flag = "  REGRESSION" if worse else ""
+            print(f"{name:38} {metric:8} {before:10.2f} {after:10.2f} {change:+7.1%}{flag}")
+            if worse:
+                regressions.append(f"{name} {metric} {change:+.1%}")
+    return regressions
+
+
+# ============================================================================
+# Entry Point
+# ============================================================================
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    scenarios = _read_scenarios()
+    if not args.skip_writes:
+        scenarios += _write_scenarios() + _auth_scenarios()
+    if args.only:
+        pattern = re.compile(args.only)
+        scenarios = [s for s in scenarios if pattern.search(s.name)]
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        ctx = Context(run_id=uuid.uuid4().hex[:8])
+        await prepare(client, ctx)
+        probe = MetricsProbe()
+        report: Dict[str, Any] = {
+            "meta": {
+                "base_url": args.base_url,
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "max_requests": args.requests,
+                "started_at": datetime.now(timezone.utc).isoformat(),
+            },
+            "scenarios": {},
+        }
+        for scenario in scenarios:
+            result = await run_scenario(
+                client, ctx, scenario, probe, args.concurrency, args.duration, args.requests
+            )
+            report["scenarios"][scenario.name] = result
+            print(
+                f"{scenario.name:38} {result['rps'] or 0:9.1f} rps  "
+                f"p50 {result['p50_ms'] or 0:8.2f}  p95 {result['p95_ms'] or 0:8.2f}  "
+                f"p99 {result['p99_ms'] or 0:8.2f} ms  q/req {result.get('queries_per_request', '-')}  "
+                f"errors {result['errors']}",
+                flush=True,
+            )
+
+        # Clean up anything the write scenarios left behind.
+        for entity_type in CONTENT_PATHS:
+            while ctx.created[entity_type]:
+                await _delete(client, ctx, 0, entity_type)
+        while ctx.created["user"]:
+            await _delete_user(client, ctx, 0)
+
+        report["workers"] = {str(pid): {"rss_mb": rss} for pid, rss in sorted(probe.workers.items())}
+    return report
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per scenario")
+    parser.add_argument("--requests", type=int, default=None, help="Stop each scenario after N requests")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--only", default=None, help="Regex selecting scenario names")
+    parser.add_argument("--skip-writes", action="store_true", help="Run read scenarios only")
+    parser.add_argument("--out", default=None, help="Write the JSON report here")
+    parser.add_argument("--baseline", default=None, help="Compare with a saved JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    if args.out:
+        with open(args.out, "w") as out:
+            json.dump(report, out, indent=2)
+        print(f"Report written to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,253 @@
+"""
+Seed a local database with the synthetic benchmark corpus.
+
+    python -m benchmarks.seed [--blogs N] [--case-studies N] [--users N]
+        [--loader copy|insert] [--reset]
+
+Creates (or reuses) the benchmark admin account, loads users with role
+assignments and the content corpus, gives a Zipf-like share of published
+items view counts so "popular" sorts have data, rebuilds facet counts and
+runs ANALYZE. Reports rows per second for every table.
+
+The default ``copy`` loader streams each table with ``COPY FROM STDIN`` in a
+single transaction and drops the table's secondary indexes until the load
+is done (see ``benchmarks.copy_loader``); ``insert`` uses batched multi-row
+INSERTs with indexes in place. Refuses to run when benchmark rows already
+exist unless ``--reset`` is given, which deletes every ``bench-`` row first.
+Never point this at production: deferred index builds lock the tables.
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List
+from uuid import UUID
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.api.services.facets import rebuild_facet_counts
+from app.auth.policy import ensure_default_permissions
+from app.auth.security import hash_password
+from app.db.schema_sync import ensure_schema
+from app.db.session import SessionLocal
+from app.models.enums import ContentStatus
+from app.models.rbac import UserRole
+from app.models.registry import CONTENT_MODELS
+from app.models.related_content import RelatedContent
+from app.models.role import Role
+from app.models.user import User
+from app.models.view_count import ContentViewCount
+from benchmarks.copy_loader import copy_rows, deferred_indexes
+from benchmarks.corpus import (
+    BENCH_ADMIN_EMAIL,
+    BENCH_ADMIN_PASSWORD,
+    SLUG_PREFIX,
+    USER_PREFIX,
+    CorpusGenerator,
+    CorpusSpec,
+)
+
+# Share of published items that get view counts.
+VIEWED_SHARE = 0.2
+
+LOADERS = ("copy", "insert")
+
+
+def _batches(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def ensure_bench_admin(db: Session) -> User:
+    """Get or create the benchmark admin user with the admin role."""
+    if ensure_default_permissions(db):
+        db.flush()
+    user = db.scalar(select(User).where(User.email == BENCH_ADMIN_EMAIL))
+    if user is None:
+        user = User(
+            email=BENCH_ADMIN_EMAIL,
+            username="bench-admin",
+            password_hash=hash_password(BENCH_ADMIN_PASSWORD),
+            first_name="Bench",
+            last_name="Admin",
+            is_active=True,
+        )
+        db.add(user)
+        db.flush()
+    admin_role = db.scalar(select(Role).where(Role.name == "admin"))
+    has_role = db.scalar(
+        select(UserRole.user_id).where(UserRole.user_id == user.id, UserRole.role_id == admin_role.id)
+    )
+    if has_role is None:
+        db.add(UserRole(user_id=user.id, role_id=admin_role.id, assigned_by=user.id))
+    db.commit()
+    return user
+
+
+def bench_rows_exist(db: Session) -> bool:
+    if db.scalar(select(User.id).where(User.email.like(f"{USER_PREFIX}%")).limit(1)) is not None:
+        return True
+    return any(
+        db.scalar(select(model.id).where(model.slug.like(f"{SLUG_PREFIX}%")).limit(1)) is not None
+        for model in CONTENT_MODELS.values()
+    )
+
+
+def delete_bench_rows(db: Session) -> None:
+    """Remove all benchmark content and the per-item rows that hang off it."""
+    for entity_type, model in CONTENT_MODELS.items():
+        ids = select(model.id).where(model.slug.like(f"{SLUG_PREFIX}%"))
+        db.execute(
+            delete(ContentViewCount).where(
+                ContentViewCount.entity_type == entity_type, ContentViewCount.entity_id.in_(ids)
+            )
+        )
+        db.execute(
+            delete(RelatedContent).where(
+                RelatedContent.entity_type == entity_type, RelatedContent.entity_id.in_(ids)
+            )
+        )
+        db.execute(delete(model).where(model.slug.like(f"{SLUG_PREFIX}%")))
+    # Role assignments go with their users (ON DELETE CASCADE).
+    db.execute(delete(User).where(User.email.like(f"{USER_PREFIX}%")))
+    db.commit()
+
+
+def insert_rows(db: Session, model, rows: Iterable[Dict[str, Any]], batch_size: int) -> int:
+    """Multi-row INSERT in batches, one commit per batch."""
+    written = 0
+    for batch in _batches(rows, batch_size):
+        db.execute(insert(model), batch)
+        db.commit()
+        written += len(batch)
+    return written
+
+
+def load_rows(
+    db: Session, model, rows: Iterable[Dict[str, Any]], loader: str, batch_size: int
+) -> Dict[str, Any]:
+    """Load ``rows`` into ``model``'s table and time it."""
+    started = time.perf_counter()
+    stats: Dict[str, Any] = {}
+    if loader == "copy":
+        connection = db.connection()
+        connection.execute(text("SET LOCAL synchronous_commit = off"))
+        with deferred_indexes(connection, model.__tablename__) as stats:
+            count = copy_rows(connection, model.__table__, rows)
+        db.commit()
+    else:
+        count = insert_rows(db, model, rows, batch_size)
+    elapsed = time.perf_counter() - started
+    stats.update(
+        rows=count,
+        seconds=round(elapsed, 2),
+        rows_per_second=round(count / elapsed) if elapsed else None,
+    )
+    print(
+        f"{model.__tablename__}: {count} rows in {elapsed:.1f}s "
+        f"({stats['rows_per_second']} rows/s)",
+        flush=True,
+    )
+    return stats
+
+
+def _tracking(rows: Iterable[Dict[str, Any]], ids: List[UUID], keep) -> Iterator[Dict[str, Any]]:
+    """Pass rows through, collecting the ids of those ``keep`` accepts."""
+    for row in rows:
+        if keep(row):
+            ids.append(row["id"])
+        yield row
+
+
+def _view_count_rows(entity_type: str, ids: List[UUID], seed: int) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(f"{seed}:views:{entity_type}")
+    viewed = rng.sample(ids, int(len(ids) * VIEWED_SHARE))
+    for rank, entity_id in enumerate(viewed, start=1):
+        yield {"entity_type": entity_type, "entity_id": entity_id, "views": 100_000 // rank + rng.randint(0, 9)}
+
+
+def seed(spec: CorpusSpec, loader: str, batch_size: int, reset: bool) -> Dict[str, Any]:
+    ensure_schema()
+    report: Dict[str, Any] = {"loader": loader, "tables": {}}
+    with SessionLocal() as db:
+        if bench_rows_exist(db):
+            if not reset:
+                raise SystemExit("Benchmark rows already exist; rerun with --reset to replace them")
+            delete_bench_rows(db)
+
+        admin = ensure_bench_admin(db)
+        generator = CorpusGenerator(spec, admin.id)
+        started = time.perf_counter()
+
+        user_ids: List[UUID] = []
+        users = _tracking(generator.users(hash_password(BENCH_ADMIN_PASSWORD)), user_ids, lambda row: True)
+        report["tables"]["users"] = load_rows(db, User, users, loader, batch_size)
+        role_ids = dict(db.execute(select(Role.name, Role.id)).all())
+        report["tables"]["user_roles"] = load_rows(
+            db, UserRole, generator.role_assignments(user_ids, role_ids), loader, batch_size
+        )
+
+        views = 0
+        for entity_type, rows in generator.by_type().items():
+            model = CONTENT_MODELS[entity_type]
+            published: List[UUID] = []
+            rows = _tracking(
+                rows, published,
+                lambda row: row["status"] == ContentStatus.PUBLISHED and not row["is_deleted"],
+            )
+            report["tables"][model.__tablename__] = load_rows(db, model, rows, loader, batch_size)
+            views += insert_rows(db, ContentViewCount, _view_count_rows(entity_type, published, spec.seed), batch_size)
+        report["tables"][ContentViewCount.__tablename__] = {"rows": views}
+
+        rebuild_facet_counts(db)
+        db.execute(text("ANALYZE"))
+        db.commit()
+        elapsed = time.perf_counter() - started
+        total = sum(table.get("rows", 0) for table in report["tables"].values())
+        report["seconds"] = round(elapsed, 2)
+        report["rows_per_second"] = round(total / elapsed) if elapsed else None
+    return report
+
+
+def parse_spec(argv: List[str]) -> argparse.Namespace:
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--blogs", type=int, default=defaults.blogs)
+    parser.add_argument("--case-studies", type=int, default=defaults.case_studies)
+    parser.add_argument("--services", type=int, default=defaults.services)
+    parser.add_argument("--jobs", type=int, default=defaults.jobs)
+    parser.add_argument("--pages", type=int, default=defaults.pages)
+    parser.add_argument("--homepage-sections", type=int, default=defaults.homepage_sections)
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--loader", choices=LOADERS, default="copy")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per INSERT (insert loader)")
+    parser.add_argument("--reset", action="store_true", help="Delete existing benchmark rows first")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> None:
+    args = parse_spec(argv)
+    spec = CorpusSpec(
+        blogs=args.blogs,
+        case_studies=args.case_studies,
+        services=args.services,
+        jobs=args.jobs,
+        pages=max(args.pages, 1),
+        homepage_sections=args.homepage_sections,
+        users=args.users,
+        seed=args.seed,
+    )
+    report = seed(spec, args.loader, args.batch_size, args.reset)
+    print(f"Seeded in {report['seconds']}s ({report['rows_per_second']} rows/s)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,166 @@
+"""
+Write throughput with the current index set versus the retired one.
+
+    python -m benchmarks.writes [--entity-type blog] [--rows 2000]
+        [--configs current,legacy] [--out writes.json]
+
+For each configuration, times three write phases on one content table, one
+row per transaction as the API does them:
+
+- insert: new items
+- edit: title and ``updated_at`` changes (with no index on those columns
+  Postgres can make these HOT updates and skip index maintenance)
+- soft delete: ``is_deleted = true``
+
+``current`` is the table as the models define it. ``legacy`` temporarily adds
+back the single-column indexes listed in ``schema_sync.DROPPED_INDEXES`` for
+that table, and drops the ones it had to create afterwards. The rows written
+are deleted at the end. Run it against the benchmark database from
+``benchmarks.seed``.
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+import uuid
+from typing import Any, Dict, List
+
+from sqlalchemy import delete, func, insert, text, update
+
+from app.db.schema_sync import DROPPED_INDEXES
+from app.db.session import SessionLocal, engine
+from app.models.registry import CONTENT_MODELS
+from benchmarks.corpus import CorpusGenerator, CorpusSpec
+from benchmarks.seed import ensure_bench_admin
+
+CONFIGS = ("current", "legacy")
+WRITE_PREFIX = "bench-write-"
+
+
+def legacy_indexes(table_name: str) -> Dict[str, str]:
+    """Retired index name -> column for ``table_name``."""
+    prefix = f"ix_{table_name}_"
+    return {name: name[len(prefix):] for name in DROPPED_INDEXES if name.startswith(prefix)}
+
+
+def _index_stats(table_name: str) -> Dict[str, Any]:
+    with engine.connect() as connection:
+        count, size = connection.execute(
+            text(
+                "SELECT count(*), coalesce(sum(pg_relation_size(indexrelid)), 0) "
+                "FROM pg_index WHERE indrelid = CAST(:table AS regclass)"
+            ),
+            {"table": table_name},
+        ).one()
+    return {"indexes": count, "index_mb": round(size / 1_048_576, 1)}
+
+
+def _add_legacy_indexes(table_name: str) -> List[str]:
+    """Create the retired indexes missing from ``table_name``; returns their names."""
+    added = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        existing = set(
+            connection.scalars(text("SELECT indexname FROM pg_indexes WHERE tablename = :table"), {"table": table_name})
+        )
+        for name, column in legacy_indexes(table_name).items():
+            if name not in existing:
+                connection.exec_driver_sql(f'CREATE INDEX CONCURRENTLY "{name}" ON "{table_name}" ("{column}")')
+                added.append(name)
+    return added
+
+
+def _drop_indexes(names: List[str]) -> None:
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for name in names:
+            connection.exec_driver_sql(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+
+def _timed(label: str, count: int, fn) -> Dict[str, Any]:
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    result = {"rows": count, "seconds": round(elapsed, 3), "rows_per_second": round(count / elapsed) if elapsed else None}
+    print(f"  {label:12} {count} rows in {elapsed:.2f}s ({result['rows_per_second']} rows/s)", flush=True)
+    return result
+
+
+def run_config(config: str, entity_type: str, rows: int, author_id: uuid.UUID) -> Dict[str, Any]:
+    model = CONTENT_MODELS[entity_type]
+    spec = CorpusSpec(blogs=rows, case_studies=rows, services=rows, jobs=rows, pages=rows, homepage_sections=5)
+    generated = list(itertools.islice(CorpusGenerator(spec, author_id).by_type()[entity_type], rows))
+    for n, row in enumerate(generated):
+        row.update(id=uuid.uuid4(), slug=f"{WRITE_PREFIX}{config}-{n}", is_deleted=False)
+    ids = [row["id"] for row in generated]
+
+    report: Dict[str, Any] = _index_stats(model.__tablename__)
+    print(f"{config}: {report['indexes']} indexes ({report['index_mb']} MB) on {model.__tablename__}")
+
+    with SessionLocal() as db:
+        def inserts() -> None:
+            for row in generated:
+                db.execute(insert(model), [row])
+                db.commit()
+
+        def edits() -> None:
+            for n, item_id in enumerate(ids):
+                db.execute(update(model).where(model.id == item_id).values(title=f"Edited {n}", updated_at=func.now()))
+                db.commit()
+
+        def soft_deletes() -> None:
+            for item_id in ids:
+                db.execute(update(model).where(model.id == item_id).values(is_deleted=True, updated_at=func.now()))
+                db.commit()
+
+        try:
+            report["insert"] = _timed("insert", rows, inserts)
+            report["edit"] = _timed("edit", rows, edits)
+            report["soft_delete"] = _timed("soft delete", rows, soft_deletes)
+        finally:
+            db.rollback()
+            db.execute(delete(model).where(model.slug.like(f"{WRITE_PREFIX}%")))
+            db.commit()
+    return report
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entity-type", choices=sorted(CONTENT_MODELS), default="blog")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--configs", default=",".join(CONFIGS))
+    parser.add_argument("--out", default=None, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    configs = [config for config in args.configs.split(",") if config]
+    unknown = set(configs) - set(CONFIGS)
+    if unknown:
+        parser.error(f"unknown configs: {', '.join(sorted(unknown))}")
+
+    table_name = CONTENT_MODELS[args.entity_type].__tablename__
+    with SessionLocal() as db:
+        author_id = ensure_bench_admin(db).id
+
+    report: Dict[str, Any] = {"entity_type": args.entity_type, "rows": args.rows, "configs": {}}
+    for config in configs:
+        added = _add_legacy_indexes(table_name) if config == "legacy" else []
+        try:
+            report["configs"][config] = run_config(config, args.entity_type, args.rows, author_id)
+        finally:
+            _drop_indexes(added)
+
+    if set(CONFIGS) <= set(report["configs"]):
+        current, legacy = report["configs"]["current"], report["configs"]["legacy"]
+        print("\ncurrent vs legacy rows/s:")
+        for phase in ("insert", "edit", "soft_delete"):
+            ratio = current[phase]["rows_per_second"] / legacy[phase]["rows_per_second"]
+            print(f"  {phase:12} {ratio:.2f}x")
+
+    if args.out:
+        with open(args.out, "w") as out:
+            json.dump(report, out, indent=2)
+        print(f"Report written to {args.out}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,26 @@
+-- Add change_log table backing the /cms/changes incremental feed
+CREATE TABLE IF NOT EXISTS change_log (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    entity_type VARCHAR(50) NOT NULL,
+    entity_id UUID NOT NULL,
+    slug VARCHAR(255),
+    op VARCHAR(20) NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Versions are unique per item (app/api/services/changes.py serialises
+-- writers). Renumber any duplicates left by concurrent writes first.
+UPDATE change_log SET version = renumbered.version
+FROM (
+    SELECT id, row_number() OVER (PARTITION BY entity_type, entity_id ORDER BY id) AS version
+    FROM change_log
+    WHERE (entity_type, entity_id) IN (
+        SELECT entity_type, entity_id FROM change_log
+        GROUP BY entity_type, entity_id, version HAVING count(*) > 1
+    )
+) AS renumbered
+WHERE change_log.id = renumbered.id AND change_log.version <> renumbered.version;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_change_log_entity_version ON change_log(entity_type, entity_id, version);
+DROP INDEX IF EXISTS ix_change_log_entity;
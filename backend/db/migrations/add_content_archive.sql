@@ -0,0 +1,21 @@
+-- Add content_archive table for archived soft-deleted content (app/api/services/archive.py)
+CREATE TABLE IF NOT EXISTS content_archive (
+    entity_type VARCHAR(50) NOT NULL,
+    entity_id UUID NOT NULL,
+    slug VARCHAR(255) NOT NULL,
+    title VARCHAR(255),
+    data JSONB NOT NULL,
+    deleted_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    archived_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (entity_type, entity_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_content_archive_type_archived ON content_archive (entity_type, archived_at);
+
+-- Soft-deleted rows by deletion time, for the archival batches. Run with
+-- autocommit (CONCURRENTLY cannot run inside a transaction block).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pages_tombstones ON pages (updated_at) WHERE is_deleted = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_services_tombstones ON services (updated_at) WHERE is_deleted = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_blogs_tombstones ON blogs (updated_at) WHERE is_deleted = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_case_studies_tombstones ON case_studies (updated_at) WHERE is_deleted = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_tombstones ON jobs (updated_at) WHERE is_deleted = true;
@@ -0,0 +1,32 @@
+-- Add content_facet_counts aggregate for /cms/blogs/facets and /cms/case-studies/facets
+-- (app/api/services/facets.py). Counts only published, non-deleted items.
+CREATE TABLE IF NOT EXISTS content_facet_counts (
+    entity_type VARCHAR(50) NOT NULL,
+    facet VARCHAR(20) NOT NULL,
+    value TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (entity_type, facet, value)
+);
+
+-- Initial backfill (the API also backfills on startup when the table is empty).
+INSERT INTO content_facet_counts (entity_type, facet, value, count)
+SELECT 'blog', 'tag', tag, count(DISTINCT id)
+FROM blogs, unnest(tags) AS tag
+WHERE status = 'PUBLISHED' AND is_deleted = false AND tag <> ''
+GROUP BY tag
+UNION ALL
+SELECT 'blog', 'category', category, count(*)
+FROM blogs
+WHERE status = 'PUBLISHED' AND is_deleted = false AND category IS NOT NULL AND category <> ''
+GROUP BY category
+UNION ALL
+SELECT 'case_study', 'tag', tag, count(DISTINCT id)
+FROM case_studies, unnest(tags) AS tag
+WHERE status = 'PUBLISHED' AND is_deleted = false AND tag <> ''
+GROUP BY tag
+UNION ALL
+SELECT 'case_study', 'industry', industry, count(*)
+FROM case_studies
+WHERE status = 'PUBLISHED' AND is_deleted = false AND industry IS NOT NULL AND industry <> ''
+GROUP BY industry
+ON CONFLICT DO NOTHING;
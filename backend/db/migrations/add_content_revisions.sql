@@ -0,0 +1,16 @@
+-- Add content_revisions table for page/blog revision history (app/api/services/revisions.py)
+CREATE TABLE IF NOT EXISTS content_revisions (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    entity_type VARCHAR(50) NOT NULL,
+    entity_id UUID NOT NULL,
+    revision INTEGER NOT NULL,
+    is_keyframe BOOLEAN NOT NULL DEFAULT false,
+    base_revision INTEGER,
+    codec VARCHAR(10) NOT NULL,
+    data BYTEA NOT NULL,
+    checksum VARCHAR(64) NOT NULL,
+    size_raw INTEGER NOT NULL,
+    created_by UUID REFERENCES users(id),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_content_revisions_entity_revision UNIQUE (entity_type, entity_id, revision)
+);
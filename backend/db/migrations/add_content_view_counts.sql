@@ -0,0 +1,8 @@
+-- Add content_view_counts table for write-behind view counters (app/core/view_counts.py)
+CREATE TABLE IF NOT EXISTS content_view_counts (
+    entity_type VARCHAR(50) NOT NULL,
+    entity_id UUID NOT NULL,
+    views BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (entity_type, entity_id)
+);
@@ -0,0 +1,8 @@
+-- Add related_content table for precomputed recommendations (app/api/services/related.py)
+CREATE TABLE IF NOT EXISTS related_content (
+    entity_type VARCHAR(50) NOT NULL,
+    entity_id UUID NOT NULL,
+    items JSONB NOT NULL DEFAULT '[]'::jsonb,
+    computed_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY (entity_type, entity_id)
+);
@@ -0,0 +1,16 @@
+-- Scheduled publishing (app/core/scheduler.py)
+-- The ORM stores enum member names, so the new label is upper-case.
+-- ADD VALUE cannot run inside a transaction block; run this file with autocommit.
+ALTER TYPE content_status ADD VALUE IF NOT EXISTS 'SCHEDULED';
+
+-- Partial indexes read once per process at startup to load the schedule.
+CREATE INDEX IF NOT EXISTS ix_pages_scheduled_publish ON pages(published_at)
+    WHERE status = 'SCHEDULED' AND is_deleted = false;
+CREATE INDEX IF NOT EXISTS ix_services_scheduled_publish ON services(published_at)
+    WHERE status = 'SCHEDULED' AND is_deleted = false;
+CREATE INDEX IF NOT EXISTS ix_blogs_scheduled_publish ON blogs(published_at)
+    WHERE status = 'SCHEDULED' AND is_deleted = false;
+CREATE INDEX IF NOT EXISTS ix_case_studies_scheduled_publish ON case_studies(published_at)
+    WHERE status = 'SCHEDULED' AND is_deleted = false;
+CREATE INDEX IF NOT EXISTS ix_jobs_scheduled_publish ON jobs(published_at)
+    WHERE status = 'SCHEDULED' AND is_deleted = false;
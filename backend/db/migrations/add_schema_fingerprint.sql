@@ -0,0 +1,8 @@
+-- Schema fingerprint (app/db/schema_sync.py)
+-- Single row holding the hash of the model metadata the database was last
+-- synced to; workers skip DDL at boot when it matches.
+CREATE TABLE IF NOT EXISTS schema_fingerprint (
+    id INTEGER PRIMARY KEY,
+    fingerprint VARCHAR(64) NOT NULL,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
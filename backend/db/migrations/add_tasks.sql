@@ -0,0 +1,20 @@
+-- Add tasks table for the durable background task queue (app/core/tasks.py)
+CREATE TABLE IF NOT EXISTS tasks (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    dedup_key VARCHAR(255),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    run_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    locked_at TIMESTAMP WITH TIME ZONE,
+    locked_by VARCHAR(100),
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_tasks_pending_run_at ON tasks(run_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS ix_tasks_running_locked_at ON tasks(locked_at) WHERE status = 'running';
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tasks_pending_dedup_key ON tasks(dedup_key)
+    WHERE dedup_key IS NOT NULL AND status = 'pending';
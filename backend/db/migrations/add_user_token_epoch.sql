@@ -0,0 +1,3 @@
+-- Access token revocation epochs (app/auth/revocation.py)
+-- Tokens carry the epoch current at login; bumping it revokes older tokens.
+ALTER TABLE users ADD COLUMN IF NOT EXISTS token_epoch INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,152 @@
+-- Hot-path indexes (app/models: composite and partial indexes next to each model)
+-- Replaces the single-column indexes on nearly every column with indexes that
+-- match the queries in app/api/services. run.py applies the same change
+-- through app/db/schema_sync.py before workers fork (workers never build
+-- indexes); running this first keeps deploys from building them.
+-- CONCURRENTLY cannot run inside a transaction block: run this file with
+-- autocommit (plain psql, without -1). Builds first, so lists keep an index
+-- to use while the old ones are dropped. If a build is interrupted, drop the
+-- INVALID index it leaves and rerun.
+
+-- List queries: is_deleted = false AND status = ? ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pages_live_status_created ON pages (status, created_at) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_services_live_status_created ON services (status, created_at) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_blogs_live_status_created ON blogs (status, created_at) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_case_studies_live_status_created ON case_studies (status, created_at) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_live_status_created ON jobs (status, created_at) WHERE is_deleted = false;
+
+-- Admin lists without a status filter
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pages_live_created ON pages (created_at) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_services_live_created ON services (created_at) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_blogs_live_created ON blogs (created_at) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_case_studies_live_created ON case_studies (created_at) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_live_created ON jobs (created_at) WHERE is_deleted = false;
+
+-- Blog RSS feed
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_blogs_published_feed ON blogs (published_at DESC NULLS LAST, created_at DESC) WHERE status = 'PUBLISHED' AND is_deleted = false;
+
+-- Case study category filter: industry = ? OR tags @> ARRAY[?]
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_case_studies_live_industry ON case_studies (industry) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_case_studies_live_tags ON case_studies USING gin (tags) WHERE is_deleted = false;
+
+-- Archival sweep: is_deleted = true AND updated_at < ? ORDER BY updated_at
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pages_tombstones ON pages (updated_at) WHERE is_deleted = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_services_tombstones ON services (updated_at) WHERE is_deleted = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_blogs_tombstones ON blogs (updated_at) WHERE is_deleted = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_case_studies_tombstones ON case_studies (updated_at) WHERE is_deleted = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_tombstones ON jobs (updated_at) WHERE is_deleted = true;
+
+-- User list; was created by the timestamp mixin, now declared on the model
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_created_at ON users (created_at);
+
+-- Retired model indexes (schema_sync.DROPPED_INDEXES)
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_updated_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_title;
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_status;
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_published_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_created_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_updated_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_published_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_is_deleted;
+DROP INDEX CONCURRENTLY IF EXISTS ix_services_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_services_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_services_updated_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_services_title;
+DROP INDEX CONCURRENTLY IF EXISTS ix_services_status;
+DROP INDEX CONCURRENTLY IF EXISTS ix_services_published_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_services_created_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_services_updated_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_services_published_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_services_is_deleted;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_updated_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_title;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_status;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_published_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_created_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_updated_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_published_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_is_deleted;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_updated_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_title;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_status;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_published_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_created_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_updated_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_published_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_is_deleted;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_updated_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_title;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_status;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_published_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_created_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_updated_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_published_by;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_is_deleted;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_author_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_blogs_category;
+DROP INDEX CONCURRENTLY IF EXISTS ix_case_studies_industry;
+DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_job_type;
+DROP INDEX CONCURRENTLY IF EXISTS ix_pages_template;
+DROP INDEX CONCURRENTLY IF EXISTS ix_roles_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_roles_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_roles_updated_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_site_settings_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_site_settings_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_site_settings_updated_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_users_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_users_updated_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_users_is_active;
+
+-- Indexes from db/schema.sql that duplicate the above or that no query uses
+DROP INDEX CONCURRENTLY IF EXISTS idx_users_is_active;
+DROP INDEX CONCURRENTLY IF EXISTS idx_users_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_services_slug;
+DROP INDEX CONCURRENTLY IF EXISTS idx_services_status;
+DROP INDEX CONCURRENTLY IF EXISTS idx_services_published_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_services_created_by;
+DROP INDEX CONCURRENTLY IF EXISTS idx_services_published_by;
+DROP INDEX CONCURRENTLY IF EXISTS idx_services_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_services_content_gin;
+DROP INDEX CONCURRENTLY IF EXISTS idx_services_is_deleted;
+DROP INDEX CONCURRENTLY IF EXISTS idx_services_published_only;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_slug;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_status;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_published_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_author_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_category;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_created_by;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_published_by;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_content_gin;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_tags_gin;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_is_deleted;
+DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_published_only;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_slug;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_status;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_published_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_template;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_created_by;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_published_by;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_content_gin;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_is_deleted;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_published_only;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_slug;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_status;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_published_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_industry;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_created_by;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_published_by;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_content_gin;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_tags_gin;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_is_deleted;
+DROP INDEX CONCURRENTLY IF EXISTS idx_case_studies_published_only;
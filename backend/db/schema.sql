@@ -194,11 +194,11 @@ CREATE TABLE case_studies (
 -- Indexes for Performance
 -- ============================================================================
 
--- Users indexes
-CREATE INDEX idx_users_email ON users(email);
-CREATE INDEX idx_users_username ON users(username);
-CREATE INDEX idx_users_is_active ON users(is_active);
-CREATE INDEX idx_users_created_at ON users(created_at);
+-- Mirrors the indexes the models declare (app/models). Only indexes that a
+-- query in app/api/services uses: every extra index is paid for on each write.
+
+-- Users indexes (email and username are covered by their UNIQUE constraints)
+CREATE INDEX ix_users_created_at ON users(created_at);
 
 -- RBAC indexes
 CREATE INDEX idx_user_roles_user_id ON user_roles(user_id);
@@ -207,59 +207,38 @@ CREATE INDEX idx_role_permissions_role_id ON role_permissions(role_id);
 CREATE INDEX idx_role_permissions_permission_id ON role_permissions(permission_id);
 CREATE INDEX idx_permissions_resource_action ON permissions(resource, action);
 
--- Services indexes
-CREATE INDEX idx_services_slug ON services(slug);
-CREATE INDEX idx_services_status ON services(status);
-CREATE INDEX idx_services_published_at ON services(published_at);
-CREATE INDEX idx_services_created_by ON services(created_by);
-CREATE INDEX idx_services_published_by ON services(published_by);
-CREATE INDEX idx_services_created_at ON services(created_at);
-CREATE INDEX idx_services_content_gin ON services USING GIN(content); -- GIN index for JSONB queries
-CREATE INDEX idx_services_is_deleted ON services(is_deleted);
--- Partial index for published content only (performance boost)
-CREATE INDEX idx_services_published_only ON services(published_at) WHERE status = 'published' AND is_deleted = FALSE;
-
--- Blogs indexes
-CREATE INDEX idx_blogs_slug ON blogs(slug);
-CREATE INDEX idx_blogs_status ON blogs(status);
-CREATE INDEX idx_blogs_published_at ON blogs(published_at);
-CREATE INDEX idx_blogs_author_id ON blogs(author_id);
-CREATE INDEX idx_blogs_category ON blogs(category);
-CREATE INDEX idx_blogs_created_by ON blogs(created_by);
-CREATE INDEX idx_blogs_published_by ON blogs(published_by);
-CREATE INDEX idx_blogs_created_at ON blogs(created_at);
-CREATE INDEX idx_blogs_content_gin ON blogs USING GIN(content); -- GIN index for JSONB queries
-CREATE INDEX idx_blogs_tags_gin ON blogs USING GIN(tags); -- GIN index for array queries
-CREATE INDEX idx_blogs_is_deleted ON blogs(is_deleted);
--- Partial index for published content only (performance boost)
-CREATE INDEX idx_blogs_published_only ON blogs(published_at) WHERE status = 'published' AND is_deleted = FALSE;
-
--- Pages indexes
-CREATE INDEX idx_pages_slug ON pages(slug);
-CREATE INDEX idx_pages_status ON pages(status);
-CREATE INDEX idx_pages_published_at ON pages(published_at);
-CREATE INDEX idx_pages_template ON pages(template);
-CREATE INDEX idx_pages_created_by ON pages(created_by);
-CREATE INDEX idx_pages_published_by ON pages(published_by);
-CREATE INDEX idx_pages_created_at ON pages(created_at);
-CREATE INDEX idx_pages_content_gin ON pages USING GIN(content); -- GIN index for JSONB queries
-CREATE INDEX idx_pages_is_deleted ON pages(is_deleted);
--- Partial index for published content only (performance boost)
-CREATE INDEX idx_pages_published_only ON pages(published_at) WHERE status = 'published' AND is_deleted = FALSE;
-
--- Case Studies indexes
-CREATE INDEX idx_case_studies_slug ON case_studies(slug);
-CREATE INDEX idx_case_studies_status ON case_studies(status);
-CREATE INDEX idx_case_studies_published_at ON case_studies(published_at);
-CREATE INDEX idx_case_studies_industry ON case_studies(industry);
-CREATE INDEX idx_case_studies_created_by ON case_studies(created_by);
-CREATE INDEX idx_case_studies_published_by ON case_studies(published_by);
-CREATE INDEX idx_case_studies_created_at ON case_studies(created_at);
-CREATE INDEX idx_case_studies_content_gin ON case_studies USING GIN(content); -- GIN index for JSONB queries
-CREATE INDEX idx_case_studies_tags_gin ON case_studies USING GIN(tags); -- GIN index for array queries
-CREATE INDEX idx_case_studies_is_deleted ON case_studies(is_deleted);
--- Partial index for published content only (performance boost)
-CREATE INDEX idx_case_studies_published_only ON case_studies(published_at) WHERE status = 'published' AND is_deleted = FALSE;
+-- Services indexes (slug is covered by its UNIQUE constraint)
+-- Lists: is_deleted = FALSE AND status = ? ORDER BY created_at DESC
+CREATE INDEX ix_services_live_status_created ON services(status, created_at) WHERE is_deleted = FALSE;
+CREATE INDEX ix_services_live_created ON services(created_at) WHERE is_deleted = FALSE;
+-- Archival: soft-deleted rows by deletion time
+CREATE INDEX ix_services_tombstones ON services(updated_at) WHERE is_deleted = TRUE;
+
+-- Blogs indexes (slug is covered by its UNIQUE constraint)
+-- Lists: is_deleted = FALSE AND status = ? ORDER BY created_at DESC
+CREATE INDEX ix_blogs_live_status_created ON blogs(status, created_at) WHERE is_deleted = FALSE;
+CREATE INDEX ix_blogs_live_created ON blogs(created_at) WHERE is_deleted = FALSE;
+-- Archival: soft-deleted rows by deletion time
+CREATE INDEX ix_blogs_tombstones ON blogs(updated_at) WHERE is_deleted = TRUE;
+-- RSS feed
+CREATE INDEX ix_blogs_published_feed ON blogs(published_at DESC NULLS LAST, created_at DESC) WHERE status = 'published' AND is_deleted = FALSE;
+
+-- Pages indexes (slug is covered by its UNIQUE constraint)
+-- Lists: is_deleted = FALSE AND status = ? ORDER BY created_at DESC
+CREATE INDEX ix_pages_live_status_created ON pages(status, created_at) WHERE is_deleted = FALSE;
+CREATE INDEX ix_pages_live_created ON pages(created_at) WHERE is_deleted = FALSE;
+-- Archival: soft-deleted rows by deletion time
+CREATE INDEX ix_pages_tombstones ON pages(updated_at) WHERE is_deleted = TRUE;
+
+-- Case Studies indexes (slug is covered by its UNIQUE constraint)
+-- Lists: is_deleted = FALSE AND status = ? ORDER BY created_at DESC
+CREATE INDEX ix_case_studies_live_status_created ON case_studies(status, created_at) WHERE is_deleted = FALSE;
+CREATE INDEX ix_case_studies_live_created ON case_studies(created_at) WHERE is_deleted = FALSE;
+-- Archival: soft-deleted rows by deletion time
+CREATE INDEX ix_case_studies_tombstones ON case_studies(updated_at) WHERE is_deleted = TRUE;
+-- Category filter: industry = ? OR tags @> ARRAY[?]
+CREATE INDEX ix_case_studies_live_industry ON case_studies(industry) WHERE is_deleted = FALSE;
+CREATE INDEX ix_case_studies_live_tags ON case_studies USING GIN(tags) WHERE is_deleted = FALSE;
 
 -- ============================================================================
 -- Triggers for updated_at timestamps
@@ -1,16 +1,178 @@
 #!/usr/bin/env python3
 """
 Production run script. Reads PORT from environment (default 10000) and runs the ASGI app.
-Use this for Render or: uvicorn app.main:app --host 0.0.0.0 --port $PORT
+
+Runs gunicorn with uvicorn workers, configured from the SERVER_* settings in
+app/core/config.py:
+
+- SERVER_WORKERS processes (default: one per CPU this container may use,
+  by affinity and cgroup CPU quota, at most SERVER_MAX_WORKERS; each worker
+  has its own DB pool, so the master logs the connection budget)
+- SERVER_LOOP / SERVER_HTTP select uvloop/httptools (or asyncio/h11)
+- SERVER_PRELOAD_APP imports and warms the app once in the master, so
+  workers share modules, mappers and the OpenAPI schema copy-on-write
+- SERVER_MAX_REQUESTS (+ jitter) recycles workers one at a time
+
+Before anything forks, ``prepare_schema`` applies pending schema changes,
+including concurrent index builds that could outlast a worker's boot
+timeout. Each worker then runs the app's startup handler (which skips index
+builds) before it accepts connections.
+``kill -HUP <master pid>`` rolls the workers gracefully. With preload, new
+code is loaded by starting a second master with ``kill -USR2`` and then
+sending ``QUIT`` to the old one once the new workers are serving.
+
+With a single worker, or where gunicorn is unavailable (Windows), it falls
+back to plain uvicorn. For development: uvicorn app.main:app --reload
 """
+import gc
+import logging
 import os
+import sys
+import time
 
-if __name__ == "__main__":
-    port = int(os.environ.get("PORT", "10000"))
+logger = logging.getLogger("run")
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: its affinity mask, limited by a cgroup v2 quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        # "max 100000" when unlimited, otherwise "<quota> <period>".
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, -(-int(quota) // int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def worker_count() -> int:
+    from app.core.config import settings
+
+    workers = settings.SERVER_WORKERS or min(available_cpus(), settings.SERVER_MAX_WORKERS)
+    per_worker = settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW
+    logger.info(
+        f"{workers} worker(s) x {per_worker} pooled connections = up to "
+        f"{workers * per_worker} database connections"
+    )
+    return workers
+
+
+def prepare_schema() -> None:
+    """Apply schema changes, index builds included, before any worker starts."""
+    from app.db.schema_sync import ensure_schema
+    from app.db.session import engine
+
+    started = time.perf_counter()
+    try:
+        outcome = ensure_schema()
+    except Exception as e:
+        # Workers report an unreachable database themselves at startup.
+        logger.error(f"Pre-fork schema sync failed: {e}")
+        return
+    finally:
+        engine.dispose()
+    logger.info(f"Schema {outcome} in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def warm_up_master(asgi_app) -> None:
+    """Do the per-process work that can be shared before forking workers."""
+    from sqlalchemy.orm import configure_mappers
+
+    from app.db.schema_sync import schema_fingerprint
+
+    started = time.perf_counter()
+    configure_mappers()
+    schema_fingerprint()
+    asgi_app.openapi()
+    # Move everything loaded so far out of the collector's view so that GC
+    # passes in the workers do not touch (and copy) the shared pages.
+    gc.collect()
+    gc.freeze()
+    logger.info(f"Master warm-up finished in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def run_gunicorn(port: int, workers: int) -> None:
+    from gunicorn.app.base import BaseApplication
+    from uvicorn_worker import UvicornWorker
+
+    from app.core.config import settings
+
+    class Worker(UvicornWorker):
+        CONFIG_KWARGS = {"loop": settings.SERVER_LOOP, "http": settings.SERVER_HTTP}
+
+    def post_fork(server, worker) -> None:
+        # Never reuse pooled connections inherited from the master.
+        if "app.db.session" in sys.modules:
+            sys.modules["app.db.session"].engine.dispose(close=False)
+
+    def when_ready(server) -> None:
+        server.log.info(
+            f"Serving on port {port} with {workers} workers "
+            f"(loop={settings.SERVER_LOOP}, http={settings.SERVER_HTTP}, "
+            f"preload={settings.SERVER_PRELOAD_APP})"
+        )
+
+    class Application(BaseApplication):
+        def load_config(self) -> None:
+            options = {
+                "bind": f"0.0.0.0:{port}",
+                "workers": workers,
+                "worker_class": Worker,
+                "preload_app": settings.SERVER_PRELOAD_APP,
+                "max_requests": settings.SERVER_MAX_REQUESTS,
+                "max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+                "timeout": settings.SERVER_TIMEOUT_SECONDS,
+                "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+                "keepalive": settings.SERVER_KEEPALIVE_SECONDS,
+                "loglevel": os.environ.get("LOG_LEVEL", "info").lower(),
+                "accesslog": None,
+                "post_fork": post_fork,
+                "when_ready": when_ready,
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app.main import app as asgi_app
+
+            if settings.SERVER_PRELOAD_APP:
+                warm_up_master(asgi_app)
+            return asgi_app
+
+    Application().run()
+
+
+def run_uvicorn(port: int) -> None:
     import uvicorn
+
+    from app.core.config import settings
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=port,
+        loop=settings.SERVER_LOOP,
+        http=settings.SERVER_HTTP,
         log_level=os.environ.get("LOG_LEVEL", "info").lower(),
     )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    port = int(os.environ.get("PORT", "10000"))
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        workers = 1
+    else:
+        workers = worker_count()
+    prepare_schema()
+    if workers > 1:
+        run_gunicorn(port, workers)
+    else:
+        run_uvicorn(port)
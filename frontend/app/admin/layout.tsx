@@ -3,6 +3,7 @@
 import { useRouter, usePathname } from "next/navigation";
 import { useEffect, useState } from "react";
 import Link from "next/link";
+import api from "../api-client";
 
 const contentNav = [
   { href: "/admin/homepage", label: "Homepage" },
@@ -106,7 +107,10 @@ export default function AdminLayout({ children }: { children: React.ReactNode })
           <button
             type="button"
             onClick={() => {
+              const refreshToken = localStorage.getItem("refresh_token");
+              if (refreshToken) api.post("/auth/logout", { refresh_token: refreshToken }).catch(() => {});
               localStorage.removeItem("access_token");
+              localStorage.removeItem("refresh_token");
               router.push("/admin/login");
             }}
             className="w-full flex items-center gap-3 px-3 py-2.5 rounded-xl text-sm font-medium text-slate-300 hover:bg-white/5 hover:text-white transition-all text-left"
@@ -17,9 +17,13 @@ export default function AdminLoginPage() {
     setError("");
     setLoading(true);
     try {
-      const { data } = await api.post<{ access_token: string }>("/auth/login", { email, password });
+      const { data } = await api.post<{ access_token: string; refresh_token: string }>("/auth/login", {
+        email,
+        password,
+      });
       if (typeof window !== "undefined") {
         localStorage.setItem("access_token", data.access_token);
+        localStorage.setItem("refresh_token", data.refresh_token);
       }
       router.push("/admin");
       router.refresh();
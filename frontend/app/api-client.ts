@@ -21,13 +21,48 @@ client.interceptors.request.use((config) => {
   return config;
 });
 
+let refreshing: Promise<string | null> | null = null;
+
+/** Exchange the stored refresh token for a new token pair; concurrent callers share one request. */
+function refreshAccessToken(): Promise<string | null> {
+  if (!refreshing) {
+    const refreshToken = localStorage.getItem("refresh_token");
+    refreshing = (refreshToken
+      ? axios
+          .post<{ access_token: string; refresh_token: string }>(`${getApiUrl()}/auth/refresh`, {
+            refresh_token: refreshToken,
+          })
+          .then(({ data }) => {
+            localStorage.setItem("access_token", data.access_token);
+            localStorage.setItem("refresh_token", data.refresh_token);
+            return data.access_token;
+          })
+          .catch(() => null)
+      : Promise.resolve(null)
+    ).finally(() => {
+      refreshing = null;
+    });
+  }
+  return refreshing;
+}
+
 client.interceptors.response.use(
   (r) => r,
-  (err) => {
+  async (err) => {
     if (typeof window !== "undefined" && err.response?.status === 401) {
+      const original = err.config;
+      if (original && !original._retried) {
+        original._retried = true;
+        const token = await refreshAccessToken();
+        if (token) {
+          original.headers.Authorization = `Bearer ${token}`;
+          return client(original);
+        }
+      }
       const path = window.location.pathname;
       if (path.startsWith("/admin") && !path.endsWith("/login")) {
         localStorage.removeItem("access_token");
+        localStorage.removeItem("refresh_token");
         window.location.href = "/admin/login";
       }
     }